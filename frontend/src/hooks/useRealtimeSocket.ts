@@ -1,6 +1,7 @@
 import { useEffect } from 'react'
 import { useQueryClient } from '@tanstack/react-query'
 import { api } from '../lib/apiClient'
+import type { DashboardResponse, DashboardSession } from '../features/dashboard/useDashboard'
 
 interface RealtimeMessage {
   event: string
@@ -9,6 +10,17 @@ interface RealtimeMessage {
 
 const MAX_BACKOFF_MS = 30_000
 const PING_INTERVAL_MS = 25_000
+const DASHBOARD_QUERY_KEY = ['dashboard', 'me']
+const ACCESS_FIELDS = ['starter_user_id', 'panel_creator_id', 'access_mode', 'invited_user_ids', 'access_role_ids']
+
+function toDashboardFields(fields: Record<string, unknown>): Partial<DashboardSession> {
+  const { root_channel_name: rootChannelName, started_at: startedAt, active_participant_count: activeParticipantCount } = fields
+  const next: Partial<DashboardSession> = {}
+  if (typeof rootChannelName === 'string') next.rootChannelName = rootChannelName
+  if (typeof startedAt === 'string') next.startedAt = startedAt
+  if (typeof activeParticipantCount === 'number') next.activeParticipantCount = activeParticipantCount
+  return next
+}
 
 export function useRealtimeSocket(scopes: string[]) {
   const queryClient = useQueryClient()
@@ -21,6 +33,68 @@ export function useRealtimeSocket(scopes: string[]) {
     let reconnectTimer: number | undefined
     let pingTimer: number | undefined
     let cancelled = false
+    let globalSeq: number | null = null
+
+    function requestResync() {
+      globalSeq = null
+      if (socket?.readyState === WebSocket.OPEN) socket.send('resync')
+    }
+
+    function invalidateDashboard() {
+      void queryClient.invalidateQueries({ queryKey: DASHBOARD_QUERY_KEY })
+    }
+
+    function patchDashboardSession(rootChannelId: string, fields: Record<string, unknown>): boolean {
+      let found = false
+      queryClient.setQueryData<DashboardResponse>(DASHBOARD_QUERY_KEY, (data) => {
+        if (!data) return data
+        const index = data.sessions.findIndex((session) => session.rootChannelId === rootChannelId)
+        if (index < 0) return data
+        found = true
+        const sessions = [...data.sessions]
+        sessions[index] = { ...sessions[index], ...toDashboardFields(fields) }
+        return { ...data, sessions }
+      })
+      return found
+    }
+
+    function removeDashboardSession(rootChannelId: string): boolean {
+      let found = false
+      queryClient.setQueryData<DashboardResponse>(DASHBOARD_QUERY_KEY, (data) => {
+        if (!data) return data
+        const sessions = data.sessions.filter((session) => session.rootChannelId !== rootChannelId)
+        found = sessions.length !== data.sessions.length
+        return found ? { ...data, sessions } : data
+      })
+      return found
+    }
+
+    function applyGlobalDelta(message: RealtimeMessage) {
+      const seq = message.payload?.seq
+      if (globalSeq === null || typeof seq !== 'number' || seq <= globalSeq) return
+      if (seq !== globalSeq + 1) {
+        requestResync()
+        return
+      }
+      globalSeq = seq
+      const rootChannelId = String(message.payload.root_channel_id ?? '')
+      switch (message.event) {
+        case 'session_added':
+          invalidateDashboard()
+          break
+        case 'session_patched': {
+          const changes = (message.payload.changes ?? {}) as Record<string, unknown>
+          if (ACCESS_FIELDS.some((field) => field in changes)) invalidateDashboard()
+          else patchDashboardSession(rootChannelId, changes)
+          break
+        }
+        case 'session_removed':
+          if (removeDashboardSession(rootChannelId)) invalidateDashboard()
+          break
+        default:
+          break
+      }
+    }
 
     function handleMessage(message: RealtimeMessage) {
       const guildId = message.payload?.guild_id as string | undefined
@@ -28,18 +102,32 @@ export function useRealtimeSocket(scopes: string[]) {
 
       switch (message.event) {
         case 'session_update':
+          if (guildId && rootChannelId) {
+            void queryClient.invalidateQueries({ queryKey: ['voice', guildId, rootChannelId] })
+            if (!patchDashboardSession(rootChannelId, message.payload)) invalidateDashboard()
+          }
+          break
         case 'session_event':
         case 'timeline_event':
           if (guildId && rootChannelId) {
             void queryClient.invalidateQueries({ queryKey: ['voice', guildId, rootChannelId] })
           }
-          void queryClient.invalidateQueries({ queryKey: ['dashboard', 'me'] })
           break
         case 'important_notification':
           void queryClient.invalidateQueries({ queryKey: ['notifications'] })
           break
         case 'global_state':
-          void queryClient.invalidateQueries({ queryKey: ['dashboard', 'me'] })
+          globalSeq = typeof message.payload?.seq === 'number' ? (message.payload.seq as number) : null
+          invalidateDashboard()
+          break
+        case 'session_added':
+        case 'session_patched':
+        case 'session_removed':
+          applyGlobalDelta(message)
+          break
+        case 'resync':
+          void queryClient.invalidateQueries()
+          if (scopeKey.split(',').includes('global')) requestResync()
           break
         default:
           break
@@ -56,6 +144,7 @@ export function useRealtimeSocket(scopes: string[]) {
 
         socket.onopen = () => {
           reconnectAttempts = 0
+          globalSeq = null
           pingTimer = window.setInterval(() => socket?.readyState === WebSocket.OPEN && socket.send('ping'), PING_INTERVAL_MS)
         }
         socket.onmessage = (event) => {
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import os
 import secrets
+import sys
 from logging import Logger
 from pathlib import Path
 
@@ -10,9 +11,10 @@ import uvicorn
 
 from vc_control.bootstrap import AppContainer
 from vc_control.bot import build_bot
+from vc_control.journal import ParticipantJournal
 from vc_control.logging_utils import DatabaseLogHandler, configure_logging
-from vc_control.repositories import ConfigRepository, StatsRepository
-from vc_control.runtime import SessionManager, WebSocketHub
+from vc_control.repositories import ConfigRepository, LiveStateRepository, StatsRepository
+from vc_control.runtime import DM_GLOBAL_RATE_PER_SEC, MEMBER_MOVE_CONCURRENCY, OUTBOX_SENDERS, PRESENCE_MIN_INTERVAL_SEC, SNAPSHOT_FLUSH_INTERVAL_SEC, VOICE_EVENT_WORKERS_PER_GUILD, SessionManager, WebSocketHub
 from vc_control.security import SecretBox
 from vc_control.web import create_app
 
@@ -25,6 +27,26 @@ def _read_env(name: str) -> str | None:
     return value or None
 
 
+def _read_float_env(name: str, default: float) -> float:
+    value = _read_env(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+def _read_int_env(name: str, default: int) -> int:
+    value = _read_env(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
 def _resolve_bind_host(settings: dict[str, str]) -> tuple[str, str]:
     env_host = _read_env("DASHBOARD_HOST")
     if env_host:
@@ -89,8 +111,22 @@ async def async_main() -> None:
     secret_box = SecretBox(data_dir / "secret.key")
     config_repo = ConfigRepository(data_dir / "config.db", secret_box)
     stats_repo = StatsRepository(data_dir / "stats.db")
+    live_state_repo = LiveStateRepository(data_dir / "live_state.db")
     websocket_hub = WebSocketHub()
-    session_manager = SessionManager(config_repo=config_repo, stats_repo=stats_repo, websocket_hub=websocket_hub, logger=logger)
+    session_manager = SessionManager(
+        config_repo=config_repo,
+        stats_repo=stats_repo,
+        live_state_repo=live_state_repo,
+        websocket_hub=websocket_hub,
+        logger=logger,
+        snapshot_flush_interval=_read_float_env("SNAPSHOT_FLUSH_INTERVAL_SEC", SNAPSHOT_FLUSH_INTERVAL_SEC),
+        journal=ParticipantJournal(data_dir / "journal"),
+        voice_event_workers=_read_int_env("VOICE_EVENT_WORKERS_PER_GUILD", VOICE_EVENT_WORKERS_PER_GUILD),
+        outbox_senders=_read_int_env("OUTBOX_SENDERS", OUTBOX_SENDERS),
+        member_move_concurrency=_read_int_env("MEMBER_MOVE_CONCURRENCY", MEMBER_MOVE_CONCURRENCY),
+        dm_rate_per_sec=_read_float_env("DM_RATE_PER_SEC", DM_GLOBAL_RATE_PER_SEC),
+        presence_interval=_read_float_env("PRESENCE_UPDATE_INTERVAL_SEC", PRESENCE_MIN_INTERVAL_SEC),
+    )
     container = AppContainer(
         root_dir=root_dir,
         data_dir=data_dir,
@@ -103,6 +139,7 @@ async def async_main() -> None:
 
     await config_repo.initialize()
     await stats_repo.initialize()
+    await live_state_repo.initialize()
 
     db_handler = DatabaseLogHandler()
     db_handler.bind(config_repo)
@@ -144,9 +181,28 @@ async def async_main() -> None:
     try:
         await asyncio.gather(*tasks)
     finally:
+        await session_manager.close()
         if container.bot is not None and not container.bot.is_closed():
             await container.bot.close()
+        await live_state_repo.close()
+        await stats_repo.close()
+        await config_repo.close()
+
+
+async def rebuild_leaderboards_main() -> None:
+    root_dir = Path(__file__).resolve().parent
+    logger = configure_logging(root_dir / "data" / "app.log")
+    stats_repo = StatsRepository(root_dir / "data" / "stats.db")
+    await stats_repo.initialize()
+    try:
+        count = await stats_repo.rebuild_leaderboards()
+        logger.info("ランキング集計テーブルを再構築しました: %s 件", count)
+    finally:
+        await stats_repo.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(async_main())
+    if "--rebuild-leaderboards" in sys.argv[1:]:
+        asyncio.run(rebuild_leaderboards_main())
+    else:
+        asyncio.run(async_main())
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from vc_control.repositories import LiveStateRepository
+from vc_control.runtime import SessionManager, WebSocketHub
+from vc_control.utils import utcnow
+
+
+GUILD_ID = 1
+CHANNEL_ID = 10
+OTHER_CHANNEL_ID = 11
+
+
+class FakeLiveState:
+    def __init__(self) -> None:
+        self.deadlines: dict[tuple[str, int], tuple[int, object, object, str]] = {}
+
+    async def save_cleanup_deadline(self, kind: str, channel_id: int, guild_id: int, started_at: object, due_at: object, stage: str = "notice") -> None:
+        self.deadlines[(kind, channel_id)] = (guild_id, started_at, due_at, stage)
+
+    async def delete_cleanup_deadline(self, kind: str, channel_id: int) -> None:
+        self.deadlines.pop((kind, channel_id), None)
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int, events: list[tuple[str, int]]) -> None:
+        self.id = channel_id
+        self.guild = SimpleNamespace(id=GUILD_ID)
+        self.members: list[object] = []
+        self.events = events
+
+    async def delete(self, reason: str | None = None) -> None:
+        self.events.append(("delete", self.id))
+
+
+def _manager(live_state: object, channels: dict[int, FakeChannel], events: list[tuple[str, int]]) -> SessionManager:
+    manager = SessionManager(None, None, live_state, WebSocketHub(), logging.getLogger("vc_control.tests"))  # type: ignore[arg-type]
+    config = SimpleNamespace(
+        first_empty_notice_sec=0.1,
+        final_delete_sec=0.2,
+        guild_language="ja",
+        solo_cleanup_mode="delete_warning",
+        solo_notice_after_sec=60,
+        solo_delete_warning_after_sec=60,
+        solo_repeat_notice_sec=300,
+    )
+    manager.guild_configs = {GUILD_ID: config}  # type: ignore[dict-item]
+
+    async def get_guild_config(guild_id: int) -> object:
+        return config
+
+    async def is_active_temporary_event_channel(channel_id: int) -> bool:
+        return False
+
+    async def send_embed(channel: FakeChannel, embed: object) -> None:
+        events.append(("embed", channel.id))
+
+    manager.get_guild_config = get_guild_config  # type: ignore[method-assign]
+    manager._is_active_temporary_event_channel = is_active_temporary_event_channel  # type: ignore[method-assign]
+    manager._is_managed_voice_channel = lambda channel, include_base=False: True  # type: ignore[method-assign]
+    manager._resolve_voice_channel = channels.get  # type: ignore[method-assign]
+    manager._send_embed = send_embed  # type: ignore[method-assign]
+    return manager
+
+
+async def _settle(manager: SessionManager, seconds: float) -> None:
+    await asyncio.sleep(seconds)
+    if manager.live_state_tasks:
+        await asyncio.gather(*manager.live_state_tasks, return_exceptions=True)
+
+
+def test_empty_cleanup_runs_notice_then_delete() -> None:
+    async def scenario() -> None:
+        events: list[tuple[str, int]] = []
+        live_state = FakeLiveState()
+        channel = FakeChannel(CHANNEL_ID, events)
+        manager = _manager(live_state, {CHANNEL_ID: channel}, events)
+        await manager._schedule_empty_cleanup(channel)  # type: ignore[arg-type]
+        await _settle(manager, 0)
+        assert live_state.deadlines[("empty", CHANNEL_ID)][3] == "notice"
+
+        await _settle(manager, 0.15)
+        assert events == [("embed", CHANNEL_ID)]
+        assert live_state.deadlines[("empty", CHANNEL_ID)][3] == "delete"
+
+        await _settle(manager, 0.15)
+        assert events == [("embed", CHANNEL_ID), ("delete", CHANNEL_ID)]
+        assert manager.empty_cleanups == {}
+        assert live_state.deadlines == {}
+        await manager._stop_cleanup_timers()
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_empty_cleanup_never_fires() -> None:
+    async def scenario() -> None:
+        events: list[tuple[str, int]] = []
+        live_state = FakeLiveState()
+        channels = {CHANNEL_ID: FakeChannel(CHANNEL_ID, events), OTHER_CHANNEL_ID: FakeChannel(OTHER_CHANNEL_ID, events)}
+        manager = _manager(live_state, channels, events)
+        await manager._schedule_empty_cleanup(channels[CHANNEL_ID])  # type: ignore[arg-type]
+        await manager._schedule_empty_cleanup(channels[OTHER_CHANNEL_ID])  # type: ignore[arg-type]
+        await manager._cancel_empty_cleanup(channels[CHANNEL_ID])  # type: ignore[arg-type]
+
+        await _settle(manager, 0.35)
+        assert events == [("embed", OTHER_CHANNEL_ID), ("delete", OTHER_CHANNEL_ID)]
+        assert live_state.deadlines == {}
+        await manager._stop_cleanup_timers()
+
+    asyncio.run(scenario())
+
+
+def test_rearm_supersedes_previous_deadline() -> None:
+    async def scenario() -> None:
+        events: list[tuple[str, int]] = []
+        live_state = FakeLiveState()
+        channel = FakeChannel(CHANNEL_ID, events)
+        manager = _manager(live_state, {CHANNEL_ID: channel}, events)
+        await manager._schedule_empty_cleanup(channel)  # type: ignore[arg-type]
+        entry = manager.empty_cleanups[CHANNEL_ID]
+        later = utcnow() + timedelta(seconds=0.3)
+        manager._arm_cleanup_deadline(entry, "notice", later)
+
+        await _settle(manager, 0.2)
+        assert events == []
+        assert live_state.deadlines[("empty", CHANNEL_ID)][2] == later
+
+        await _settle(manager, 0.2)
+        assert events == [("embed", CHANNEL_ID), ("delete", CHANNEL_ID)]
+        assert manager.empty_cleanups == {}
+        await manager._stop_cleanup_timers()
+
+    asyncio.run(scenario())
+
+
+def test_restored_empty_cleanup_resumes_at_delete_stage(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        repo = LiveStateRepository(tmp_path / "live_state.db")
+        await repo.initialize()
+        now = utcnow()
+        await repo.save_cleanup_deadline("empty", CHANNEL_ID, GUILD_ID, now - timedelta(seconds=30), now + timedelta(seconds=0.1), "delete")
+        await repo.close()
+
+        repo = LiveStateRepository(tmp_path / "live_state.db")
+        await repo.initialize()
+        events: list[tuple[str, int]] = []
+        channel = FakeChannel(CHANNEL_ID, events)
+        manager = _manager(repo, {CHANNEL_ID: channel}, events)
+        await manager._restore_cleanup_deadlines(await repo.list_cleanup_deadlines())
+        entry = manager.empty_cleanups[CHANNEL_ID]
+        assert entry.stage == "delete"
+        assert entry.notice_sent
+
+        await _settle(manager, 0.25)
+        assert events == [("delete", CHANNEL_ID)]
+        assert await repo.list_cleanup_deadlines() == []
+        await manager._stop_cleanup_timers()
+        await repo.close()
+
+    asyncio.run(scenario())
+
+
+def test_restored_solo_cleanup_resumes_remaining_stages() -> None:
+    async def scenario() -> None:
+        events: list[tuple[str, int]] = []
+        live_state = FakeLiveState()
+        manager = _manager(live_state, {}, events)
+        session = SimpleNamespace(guild_id=GUILD_ID, root_channel_id=CHANNEL_ID, session_key=(GUILD_ID, CHANNEL_ID))
+        manager.sessions_by_key = {session.session_key: session}  # type: ignore[dict-item]
+        manager._get_solo_cleanup_member = lambda current: object()  # type: ignore[method-assign]
+
+        async def send_notice(current: object, member: object, *, warning: bool, job_key: str) -> None:
+            events.append(("warning" if warning else "notice", CHANNEL_ID))
+
+        manager._send_solo_cleanup_notice = send_notice  # type: ignore[method-assign]
+        now = utcnow()
+        manager.restored_solo_deadlines = {
+            CHANNEL_ID: {"started_at": now - timedelta(seconds=200), "stage": "warning", "due_at": now + timedelta(seconds=0.1)},
+        }
+        await manager._refresh_solo_cleanup_for_session(session)  # type: ignore[arg-type]
+        entry = manager.solo_cleanups[CHANNEL_ID]
+        assert entry.stage == "warning"
+        assert entry.notice_sent and not entry.warning_sent
+        assert manager.restored_solo_deadlines == {}
+
+        await _settle(manager, 0.2)
+        assert events == [("warning", CHANNEL_ID)]
+        assert entry.stage == "delete"
+        assert live_state.deadlines[("solo", CHANNEL_ID)][3] == "delete"
+        assert entry.due_at is not None and entry.due_at - utcnow() > timedelta(seconds=55)
+
+        await manager._refresh_solo_cleanup_for_session(session)  # type: ignore[arg-type]
+        assert manager.solo_cleanups[CHANNEL_ID] is entry
+        assert entry.stage == "delete"
+        await manager._stop_cleanup_timers()
+
+    asyncio.run(scenario())
+
+
+def test_restored_solo_notice_keeps_original_start() -> None:
+    async def scenario() -> None:
+        events: list[tuple[str, int]] = []
+        manager = _manager(FakeLiveState(), {}, events)
+        session = SimpleNamespace(guild_id=GUILD_ID, root_channel_id=CHANNEL_ID, session_key=(GUILD_ID, CHANNEL_ID))
+        manager.sessions_by_key = {session.session_key: session}  # type: ignore[dict-item]
+        manager._get_solo_cleanup_member = lambda current: object()  # type: ignore[method-assign]
+
+        async def send_notice(current: object, member: object, *, warning: bool, job_key: str) -> None:
+            events.append(("warning" if warning else "notice", CHANNEL_ID))
+
+        manager._send_solo_cleanup_notice = send_notice  # type: ignore[method-assign]
+        started_at = utcnow() - timedelta(seconds=59.9)
+        manager.restored_solo_deadlines = {
+            CHANNEL_ID: {"started_at": started_at, "stage": "notice", "due_at": started_at + timedelta(seconds=60)},
+        }
+        await manager._refresh_solo_cleanup_for_session(session)  # type: ignore[arg-type]
+        assert manager.solo_cleanups[CHANNEL_ID].started_at == started_at
+
+        await _settle(manager, 0.25)
+        assert events == [("notice", CHANNEL_ID)]
+        assert manager.solo_cleanups[CHANNEL_ID].stage == "warning"
+        await manager._stop_cleanup_timers()
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("stage", ["notice", "delete"])
+def test_stop_cleanup_timers_keeps_persisted_deadline(stage: str) -> None:
+    async def scenario() -> None:
+        events: list[tuple[str, int]] = []
+        live_state = FakeLiveState()
+        channel = FakeChannel(CHANNEL_ID, events)
+        manager = _manager(live_state, {CHANNEL_ID: channel}, events)
+        await manager._schedule_empty_cleanup(channel)  # type: ignore[arg-type]
+        entry = manager.empty_cleanups[CHANNEL_ID]
+        manager._arm_cleanup_deadline(entry, stage, utcnow() + timedelta(seconds=5))
+        await manager._stop_cleanup_timers()
+        await _settle(manager, 0)
+        assert live_state.deadlines[("empty", CHANNEL_ID)][3] == stage
+        assert events == []
+
+    asyncio.run(scenario())
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+
+import discord
+
+from vc_control.repositories import LiveStateRepository
+from vc_control.runtime import DirectMessageDispatcher
+
+
+class FakeUser:
+    def __init__(self, user_id: int, sent: list[int], release: asyncio.Event | None) -> None:
+        self.id = user_id
+        self.dm_channel = object()
+        self.sent = sent
+        self.release = release
+
+    async def send(self, embed: discord.Embed) -> None:
+        if self.release is not None:
+            await self.release.wait()
+        self.sent.append(self.id)
+
+
+class FakeBot:
+    def __init__(self, users: dict[int, FakeUser]) -> None:
+        self.users = users
+
+    def get_user(self, user_id: int) -> FakeUser | None:
+        return self.users.get(user_id)
+
+    def get_guild(self, guild_id: int) -> None:
+        return None
+
+
+async def _pending(repo: LiveStateRepository) -> set[int]:
+    return {int(item["user_id"]) for item in await repo.list_pending_dm_deliveries(100)}
+
+
+def test_each_delivery_is_saved_as_soon_as_it_is_sent(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        repo = LiveStateRepository(tmp_path / "live_state.db")
+        await repo.initialize()
+        sent: list[int] = []
+        release = asyncio.Event()
+        users = {1: FakeUser(1, sent, None), 2: FakeUser(2, sent, release)}
+        dispatcher = DirectMessageDispatcher(repo, logging.getLogger("vc_control.tests"), rate_per_sec=100, open_rate_per_sec=100)
+        await dispatcher.enqueue("job", "scheduled_vc", 1, discord.Embed(title="notice"), [1, 2])
+        dispatcher.start(FakeBot(users))  # type: ignore[arg-type]
+
+        for _ in range(100):
+            if sent == [1] and await _pending(repo) == {2}:
+                break
+            await asyncio.sleep(0.01)
+        assert sent == [1]
+        assert await _pending(repo) == {2}
+
+        await dispatcher.close()
+        await repo.close()
+
+        repo = LiveStateRepository(tmp_path / "live_state.db")
+        await repo.initialize()
+        users[2].release = None
+        dispatcher = DirectMessageDispatcher(repo, logging.getLogger("vc_control.tests"), rate_per_sec=100, open_rate_per_sec=100)
+        dispatcher.start(FakeBot(users))  # type: ignore[arg-type]
+        for _ in range(100):
+            if not await _pending(repo):
+                break
+            await asyncio.sleep(0.01)
+        assert sent == [1, 2]
+        await dispatcher.close()
+        await repo.close()
+
+    asyncio.run(scenario())
+
+
+def test_same_job_key_is_enqueued_once(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        repo = LiveStateRepository(tmp_path / "live_state.db")
+        await repo.initialize()
+        dispatcher = DirectMessageDispatcher(repo, logging.getLogger("vc_control.tests"))
+        embed = discord.Embed(title="notice")
+        first = await dispatcher.enqueue("solo_cleanup:10:notice:2026-01-01T00:00:00+00:00", "solo_cleanup", 1, embed, [5])
+        second = await dispatcher.enqueue("solo_cleanup:10:notice:2026-01-01T00:00:00+00:00", "solo_cleanup", 1, embed, [5])
+        assert first == second
+        assert len(await repo.list_pending_dm_deliveries(100)) == 1
+        await repo.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+import vc_control.repositories as repositories
+import vc_control.utils as utils
+from vc_control.models import CompletedMember, CompletedSession
+from vc_control.repositories import LEADERBOARD_PERIODS, StatsRepository
+
+
+class Clock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock(datetime(2026, 1, 10, 12, 0, tzinfo=UTC))
+    monkeypatch.setattr(repositories, "utcnow", clock)
+    monkeypatch.setattr(utils, "utcnow", clock)
+    return clock
+
+
+def _session(index: int, ended_at: datetime, hours: int, guild_id: int = 1) -> CompletedSession:
+    members = [
+        CompletedMember(
+            user_id=user_id,
+            user_name=f"user{user_id}",
+            joined_at=ended_at - timedelta(hours=hours, minutes=user_id),
+            left_at=ended_at,
+            talk_seconds=hours * 3600 + user_id * 60,
+            afk_seconds=user_id * 30,
+            afk_channel_seconds=0,
+            self_mute_seconds=0,
+            self_deafen_seconds=0,
+            is_owner=False,
+        )
+        for user_id in range(1, 5)
+    ]
+    return CompletedSession(
+        session_id=f"session-{index}",
+        guild_id=guild_id,
+        guild_name=f"guild{guild_id}",
+        root_channel_id=100,
+        root_channel_name="vc",
+        started_by=1,
+        started_by_name="user1",
+        started_at=ended_at - timedelta(hours=hours),
+        ended_at=ended_at,
+        total_talk_seconds=0,
+        total_afk_seconds=0,
+        members=members,
+    )
+
+
+def _expected(db_path: Path, period: str, guild_id: int | None) -> dict[tuple[int, int], tuple[int, int]]:
+    cutoff = utils.period_cutoff(period)
+    assert cutoff is not None
+    query = """
+        SELECT guild_id, user_id, SUM(talk_seconds), SUM(afk_seconds)
+        FROM daily_user_stats
+        WHERE date >= ?
+    """
+    params: list[object] = [cutoff.isoformat()]
+    if guild_id is not None:
+        query += " AND guild_id = ?"
+        params.append(guild_id)
+    query += " GROUP BY guild_id, user_id"
+    with sqlite3.connect(db_path) as db:
+        return {(row[0], row[1]): (row[2], row[3]) for row in db.execute(query, params)}
+
+
+async def _assert_rankings(repo: StatsRepository, db_path: Path) -> None:
+    for period in LEADERBOARD_PERIODS:
+        for guild_id in (None, 1):
+            rankings = await repo.get_rankings(period, guild_id, 100)
+            actual = {(item["guild_id"], item["user_id"]): (item["talk_seconds"], item["afk_seconds"]) for item in rankings}
+            assert actual == _expected(db_path, period, guild_id), (period, guild_id)
+            talk = [item["talk_seconds"] for item in rankings]
+            assert talk == sorted(talk, reverse=True)
+
+
+def test_rolling_rankings_follow_the_clock(tmp_path: Path, clock: Clock) -> None:
+    async def scenario() -> None:
+        db_path = tmp_path / "stats.db"
+        repo = StatsRepository(db_path)
+        await repo.initialize()
+        index = 0
+        for days_ago in (0, 1, 5, 6, 7, 20, 29, 30, 100, 364, 365, 400):
+            index += 1
+            await repo.record_completed_session(_session(index, clock.now - timedelta(days=days_ago), 1 + days_ago % 3, 1 + index % 2))
+        await _assert_rankings(repo, db_path)
+
+        for step in (1, 1, 3, 25, 40, 300, 400):
+            clock.now += timedelta(days=step)
+            await _assert_rankings(repo, db_path)
+            index += 1
+            await repo.record_completed_session(_session(index, clock.now - timedelta(hours=1), 2, 1 + index % 2))
+            await _assert_rankings(repo, db_path)
+
+        before = {period: await repo.get_rankings(period, None, 100) for period in LEADERBOARD_PERIODS}
+        await repo.rebuild_leaderboards()
+        assert {period: await repo.get_rankings(period, None, 100) for period in LEADERBOARD_PERIODS} == before
+        await repo.close()
+
+    asyncio.run(scenario())
+
+
+def test_rankings_read_the_rank_index(tmp_path: Path, clock: Clock) -> None:
+    db_path = tmp_path / "stats.db"
+
+    async def scenario() -> None:
+        repo = StatsRepository(db_path)
+        await repo.initialize()
+        await repo.record_completed_session(_session(1, clock.now, 2))
+        await repo.close()
+
+    asyncio.run(scenario())
+    with sqlite3.connect(db_path) as db:
+        plan = " ".join(
+            str(row[-1])
+            for row in db.execute(
+                """
+                EXPLAIN QUERY PLAN
+                SELECT guild_id, guild_name, user_id, user_name, talk_seconds, afk_seconds
+                FROM leaderboard_entries
+                WHERE scope = ? AND period_bucket = ?
+                ORDER BY talk_seconds DESC, afk_seconds ASC, guild_id ASC, user_id ASC
+                LIMIT 100
+                """,
+                ("week", repositories.LEADERBOARD_ROLLING_BUCKET),
+            )
+        )
+    assert "idx_leaderboard_entries_rank" in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from types import SimpleNamespace
+
+from vc_control.runtime import LiveSession, SessionManager, WebSocketHub
+from vc_control.utils import utcnow
+
+
+def _session() -> LiveSession:
+    now = utcnow()
+    return LiveSession(
+        session_id=str(uuid.uuid4()),
+        guild_id=1,
+        guild_name="guild",
+        root_channel_id=500,
+        root_channel_name="vc",
+        starter_user_id=10,
+        starter_user_name="starter",
+        owner_user_id=10,
+        owner_user_name="starter",
+        started_at=now,
+        team_names=["A"],
+        team_mode="manual",
+    )
+
+
+def test_queued_notice_marks_snapshot_dirty() -> None:
+    async def scenario() -> None:
+        manager = SessionManager(None, None, None, WebSocketHub(), logging.getLogger("vc_control.tests"), snapshot_flush_interval=60)  # type: ignore[arg-type]
+        session = _session()
+        manager._register_session(session)
+        version = session.version
+
+        async def send(current: LiveSession, embed: object, view: object = None, *, propagate_http_errors: bool = False) -> object:
+            current.notice_channel_id = 20
+            current.notice_message_id = 30
+            return SimpleNamespace(id=30)
+
+        manager._send_notification_message = send  # type: ignore[method-assign]
+        manager._queue_notification_message(session, None)  # type: ignore[arg-type]
+        assert await manager.outbox.drain(1.0)
+        assert manager.dirty_snapshots == {session.session_id: session}
+        assert session.version > version
+        assert session.cached_payload()["notice_message_id"] == "30"
+        await manager.outbox.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from vc_control.runtime import LiveParticipant
+from vc_control.utils import utcnow
+
+
+def _participant(channel_id: int | None = 5) -> LiveParticipant:
+    now = utcnow()
+    return LiveParticipant(user_id=1, user_name="user", joined_at=now, last_transition_at=now, current_channel_id=channel_id)
+
+
+def test_checkpoint_keeps_fractional_seconds() -> None:
+    participant = _participant()
+    started_at = participant.last_transition_at
+    participant.self_muted = True
+    for index in range(1, 11):
+        participant.checkpoint(started_at + timedelta(seconds=1.9 * index))
+    participant.accrue(started_at + timedelta(seconds=19))
+    assert participant.talk_seconds == 19
+    assert participant.afk_seconds == 19
+    assert participant.self_mute_seconds == 19
+
+
+def test_checkpoint_reports_only_credited_time() -> None:
+    participant = _participant()
+    started_at = participant.last_transition_at
+    assert participant.checkpoint(started_at + timedelta(seconds=0.5)) is False
+    assert participant.checkpoint(started_at + timedelta(seconds=2.5)) is True
+    assert participant.last_transition_at == started_at + timedelta(seconds=2)
+
+    idle = _participant(None)
+    assert idle.checkpoint(idle.last_transition_at + timedelta(seconds=30)) is False
+    assert idle.talk_seconds == 0
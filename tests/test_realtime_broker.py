@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from vc_control.runtime import RealtimeEventBroker
+
+
+class FakeWebSocket:
+    def __init__(self) -> None:
+        self.frames: list[str] = []
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_text(self, frame: str) -> None:
+        self.frames.append(frame)
+
+
+def test_publish_shares_one_frame_and_honours_exclude() -> None:
+    async def scenario() -> None:
+        broker = RealtimeEventBroker()
+        both = FakeWebSocket()
+        session_only = FakeWebSocket()
+        global_only = FakeWebSocket()
+        await broker.connect(both, ["session:1", "guild:1"])  # type: ignore[arg-type]
+        await broker.connect(session_only, ["session:1"])  # type: ignore[arg-type]
+        await broker.connect(global_only, ["global"])  # type: ignore[arg-type]
+
+        recipients = await broker.publish_encoded(["session:1", "guild:1"], "session_update", '{"id":1}')
+        assert recipients == {both, session_only}
+        queued = [broker.clients[websocket].queue.get_nowait() for websocket in (both, session_only)]  # type: ignore[index]
+        assert queued[0] is queued[1]
+        assert json.loads(queued[0]) == {"event": "session_update", "payload": {"id": 1}}
+        assert broker.published_frames == 2
+        assert broker.deduplicated_frames == 1
+
+        await broker.publish_encoded(["global", "session:1"], "session_event", "{}", exclude=recipients)
+        assert broker.clients[global_only].queue.qsize() == 1  # type: ignore[index]
+        assert broker.clients[both].queue.empty()  # type: ignore[index]
+        assert await broker.publish_encoded(["guild:2"], "session_update", "{}") == set()
+
+        for websocket in (both, session_only, global_only):
+            await broker.disconnect(websocket)  # type: ignore[arg-type]
+
+    asyncio.run(scenario())
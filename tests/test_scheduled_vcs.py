@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import timedelta
+
+import pytest
+
+import vc_control.runtime as runtime
+from vc_control.models import ScheduledVC
+from vc_control.runtime import SessionManager, WebSocketHub
+from vc_control.utils import utcnow
+
+
+class FakeConfigRepo:
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    async def list_upcoming_scheduled_vcs(self) -> list[ScheduledVC]:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("database is locked")
+        return [
+            ScheduledVC(
+                id=7,
+                guild_id=1,
+                guild_name="guild",
+                creator_user_id=1,
+                creator_user_name="user1",
+                vc_name="vc",
+                category_id=None,
+                user_limit=0,
+                bitrate=None,
+                mention_type="none",
+                start_at=utcnow() + timedelta(hours=1),
+            )
+        ]
+
+    async def get_app_setting(self, key: str, default: str | None = None) -> str | None:
+        return default
+
+
+def test_scheduled_vc_load_is_retried_and_close_stops_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(runtime, "SCHEDULED_VC_LOAD_RETRY_BASE_SEC", 0.01)
+
+    async def scenario() -> None:
+        config_repo = FakeConfigRepo(failures=2)
+        manager = SessionManager(config_repo, None, None, WebSocketHub(), logging.getLogger("vc_control.tests"))  # type: ignore[arg-type]
+
+        async def purge() -> int:
+            return 0
+
+        manager.purge_expired_timeline_events = purge  # type: ignore[method-assign]
+        manager.start_scheduled_vc_worker()
+        manager.start_timeline_retention_worker()
+        scheduled_task = manager.scheduled_vc_task
+        retention_task = manager.timeline_retention_task
+        for _ in range(100):
+            if 7 in manager.scheduled_vc_items:
+                break
+            await asyncio.sleep(0.01)
+        assert config_repo.calls == 3
+        assert 7 in manager.scheduled_vc_items
+
+        await manager.close()
+        assert scheduled_task is not None and scheduled_task.cancelled()
+        assert retention_task is not None and retention_task.cancelled()
+        assert manager.scheduled_vc_task is None
+        assert manager.timeline_retention_task is None
+
+    asyncio.run(scenario())
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from vc_control.runtime import LiveParticipant, LiveSession, SessionManager, WebSocketHub
+from vc_control.utils import utcnow
+
+
+GUILD_ID = 1
+ROOT_ID = 500
+TEAM_CHANNEL_ID = 501
+STARTER_ID = 10
+ADMIN_ID = 11
+INVITED_ID = 12
+ROLE_MEMBER_ID = 13
+PARTICIPANT_ID = 14
+PANEL_CREATOR_ID = 15
+OUTSIDER_ID = 16
+ROLE_ID = 900
+USER_IDS = (STARTER_ID, ADMIN_ID, INVITED_ID, ROLE_MEMBER_ID, PARTICIPANT_ID, PANEL_CREATOR_ID, OUTSIDER_ID)
+
+
+def _permissions(admin: bool) -> SimpleNamespace:
+    return SimpleNamespace(manage_guild=admin, administrator=False)
+
+
+def _member(user_id: int, *, roles: tuple[int, ...] = (), admin: bool = False) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=user_id,
+        display_name=f"user{user_id}",
+        roles=[SimpleNamespace(id=role_id) for role_id in roles],
+        guild_permissions=_permissions(admin),
+    )
+
+
+def _session(root_id: int = ROOT_ID) -> LiveSession:
+    now = utcnow()
+    return LiveSession(
+        session_id=str(uuid.uuid4()),
+        guild_id=GUILD_ID,
+        guild_name="guild",
+        root_channel_id=root_id,
+        root_channel_name="vc",
+        starter_user_id=STARTER_ID,
+        starter_user_name="starter",
+        owner_user_id=STARTER_ID,
+        owner_user_name="starter",
+        started_at=now,
+        team_names=["A"],
+        team_mode="manual",
+    )
+
+
+def _participant(user_id: int, channel_id: int | None) -> LiveParticipant:
+    now = utcnow()
+    return LiveParticipant(
+        user_id=user_id,
+        user_name=f"user{user_id}",
+        joined_at=now,
+        last_transition_at=now,
+        current_channel_id=channel_id,
+    )
+
+
+async def _noop(*args: object, **kwargs: object) -> None:
+    return None
+
+
+def _legacy_can_view(members: dict[int, SimpleNamespace], session: LiveSession, user_id: int) -> bool:
+    member = members.get(user_id)
+    if member is not None and (member.guild_permissions.manage_guild or member.guild_permissions.administrator):
+        return True
+    if session.starter_user_id == user_id:
+        return True
+    if session.access_mode == "invite" and str(user_id) in session.invited_user_ids:
+        return True
+    if session.access_mode == "role":
+        if member is not None and any(str(role.id) in session.access_role_ids for role in member.roles):
+            return True
+    if session.panel_creator_id == user_id:
+        return True
+    if session.access_mode in {"invite", "role"}:
+        return False
+    participant = session.participants.get(user_id)
+    return participant is not None and participant.current_channel_id is not None
+
+
+@pytest.fixture
+def members() -> dict[int, SimpleNamespace]:
+    return {
+        STARTER_ID: _member(STARTER_ID),
+        ADMIN_ID: _member(ADMIN_ID, admin=True),
+        INVITED_ID: _member(INVITED_ID),
+        ROLE_MEMBER_ID: _member(ROLE_MEMBER_ID, roles=(ROLE_ID,)),
+        PARTICIPANT_ID: _member(PARTICIPANT_ID),
+        PANEL_CREATOR_ID: _member(PANEL_CREATOR_ID),
+        OUTSIDER_ID: _member(OUTSIDER_ID),
+    }
+
+
+@pytest.fixture
+def manager(members: dict[int, SimpleNamespace]) -> SessionManager:
+    manager = SessionManager(None, None, None, WebSocketHub(), logging.getLogger("vc_control.tests"))  # type: ignore[arg-type]
+    guild = SimpleNamespace(id=GUILD_ID, get_member=members.get)
+    manager.bot = SimpleNamespace(get_guild=lambda guild_id: guild if guild_id == GUILD_ID else None)  # type: ignore[assignment]
+    manager._mark_snapshot_dirty = lambda session: None  # type: ignore[method-assign]
+    manager._broadcast_global_state = _noop  # type: ignore[method-assign]
+    manager._refresh_solo_cleanup_for_session = _noop  # type: ignore[method-assign]
+    manager._apply_access_overwrites = _noop  # type: ignore[method-assign]
+    manager._record_timeline_event = _noop  # type: ignore[method-assign]
+    manager._cancel_solo_cleanup_by_channel_id = lambda channel_id: None  # type: ignore[method-assign]
+    return manager
+
+
+async def _assert_matches_legacy(manager: SessionManager, members: dict[int, SimpleNamespace], session: LiveSession) -> None:
+    for user_id in USER_IDS:
+        expected = _legacy_can_view(members, session, user_id)
+        assert await manager.can_view_session(session, user_id) is expected, user_id
+        assert (session.root_channel_id in await manager.visible_session_roots(user_id)) is expected, user_id
+
+
+def test_participant_join_and_leave(manager: SessionManager, members: dict[int, SimpleNamespace]) -> None:
+    async def scenario() -> None:
+        session = _session()
+        manager._register_session(session)
+        await _assert_matches_legacy(manager, members, session)
+
+        manager._add_participant(session, _participant(PARTICIPANT_ID, ROOT_ID))
+        await _assert_matches_legacy(manager, members, session)
+
+        manager._set_participant_channel(session, session.participants[PARTICIPANT_ID], TEAM_CHANNEL_ID)
+        await _assert_matches_legacy(manager, members, session)
+
+        manager._set_participant_channel(session, session.participants[PARTICIPANT_ID], None)
+        await _assert_matches_legacy(manager, members, session)
+
+        manager._add_participant(session, _participant(PARTICIPANT_ID, ROOT_ID))
+        await _assert_matches_legacy(manager, members, session)
+
+    asyncio.run(scenario())
+
+
+def test_access_mode_and_invite_edits(manager: SessionManager, members: dict[int, SimpleNamespace]) -> None:
+    async def scenario() -> None:
+        session = _session()
+        manager._register_session(session)
+        manager._add_participant(session, _participant(PARTICIPANT_ID, ROOT_ID))
+
+        await manager.update_access_control(ROOT_ID, STARTER_ID, access_mode="invite", invited_user_ids=[str(INVITED_ID)])
+        await _assert_matches_legacy(manager, members, session)
+
+        await manager.update_access_control(ROOT_ID, STARTER_ID, access_mode="invite", invited_user_ids=[str(OUTSIDER_ID)])
+        await _assert_matches_legacy(manager, members, session)
+
+        await manager.update_access_control(ROOT_ID, STARTER_ID, access_mode="role", access_role_ids=[str(ROLE_ID)])
+        await _assert_matches_legacy(manager, members, session)
+
+        await manager.update_access_control(ROOT_ID, STARTER_ID, access_mode="public")
+        await _assert_matches_legacy(manager, members, session)
+
+    asyncio.run(scenario())
+
+
+def test_role_edits(manager: SessionManager, members: dict[int, SimpleNamespace]) -> None:
+    async def scenario() -> None:
+        session = _session()
+        manager._register_session(session)
+        await manager.update_access_control(ROOT_ID, STARTER_ID, access_mode="role", access_role_ids=[str(ROLE_ID)])
+        await _assert_matches_legacy(manager, members, session)
+
+        members[OUTSIDER_ID].roles.append(SimpleNamespace(id=ROLE_ID))
+        await _assert_matches_legacy(manager, members, session)
+
+        members[ROLE_MEMBER_ID].roles.clear()
+        await _assert_matches_legacy(manager, members, session)
+
+        await manager.update_access_control(ROOT_ID, STARTER_ID, access_mode="role", access_role_ids=["901"])
+        await _assert_matches_legacy(manager, members, session)
+        assert manager.role_session_roots == {GUILD_ID: {901: {ROOT_ID}}}
+
+    asyncio.run(scenario())
+
+
+def test_panel_creator_change(manager: SessionManager, members: dict[int, SimpleNamespace]) -> None:
+    async def scenario() -> None:
+        session = _session()
+        manager._register_session(session)
+        await manager.update_access_control(ROOT_ID, STARTER_ID, access_mode="invite", invited_user_ids=[str(INVITED_ID)])
+
+        await manager.set_panel_creator(ROOT_ID, members[PANEL_CREATOR_ID])  # type: ignore[arg-type]
+        await _assert_matches_legacy(manager, members, session)
+
+        await manager.set_panel_creator(ROOT_ID, members[OUTSIDER_ID])  # type: ignore[arg-type]
+        await _assert_matches_legacy(manager, members, session)
+
+    asyncio.run(scenario())
+
+
+def test_admin_permission_change_needs_invalidation(manager: SessionManager, members: dict[int, SimpleNamespace]) -> None:
+    async def scenario() -> None:
+        session = _session()
+        manager._register_session(session)
+        await manager.update_access_control(ROOT_ID, STARTER_ID, access_mode="invite", invited_user_ids=[str(INVITED_ID)])
+        await _assert_matches_legacy(manager, members, session)
+
+        members[ADMIN_ID].guild_permissions = _permissions(False)
+        members[OUTSIDER_ID].guild_permissions = _permissions(True)
+        manager.invalidate_member_permissions(GUILD_ID, ADMIN_ID)
+        manager.invalidate_member_permissions(GUILD_ID, OUTSIDER_ID)
+        await _assert_matches_legacy(manager, members, session)
+
+    asyncio.run(scenario())
+
+
+def test_unregister_clears_indexes(manager: SessionManager, members: dict[int, SimpleNamespace]) -> None:
+    async def scenario() -> None:
+        session = _session()
+        manager._register_session(session)
+        manager._add_participant(session, _participant(PARTICIPANT_ID, ROOT_ID))
+        await manager.update_access_control(ROOT_ID, STARTER_ID, access_mode="role", access_role_ids=[str(ROLE_ID)])
+
+        manager._unregister_session(session)
+        assert manager.session_viewers == {}
+        assert manager.visible_sessions_by_user == {}
+        assert manager.guild_session_roots == {}
+        assert manager.role_session_roots == {}
+        for user_id in USER_IDS:
+            assert await manager.visible_session_roots(user_id) == set()
+
+    asyncio.run(scenario())
+
+
+def test_admin_guilds_follow_new_guild_sessions(manager: SessionManager, members: dict[int, SimpleNamespace]) -> None:
+    async def scenario() -> None:
+        other_guild_id = 2
+        other_members = {ADMIN_ID: _member(ADMIN_ID), OUTSIDER_ID: _member(OUTSIDER_ID, admin=True)}
+        guilds = {
+            GUILD_ID: SimpleNamespace(id=GUILD_ID, get_member=members.get),
+            other_guild_id: SimpleNamespace(id=other_guild_id, get_member=other_members.get),
+        }
+        manager.bot = SimpleNamespace(get_guild=guilds.get)  # type: ignore[assignment]
+        session = _session()
+        manager._register_session(session)
+        assert await manager.visible_session_roots(ADMIN_ID) == {ROOT_ID}
+        assert await manager.visible_session_roots(OUTSIDER_ID) == set()
+
+        other = _session(ROOT_ID + 100)
+        other.guild_id = other_guild_id
+        manager._register_session(other)
+        assert await manager.visible_session_roots(ADMIN_ID) == {ROOT_ID}
+        assert await manager.visible_session_roots(OUTSIDER_ID) == {other.root_channel_id}
+
+        other_members[ADMIN_ID].guild_permissions = _permissions(True)
+        manager.invalidate_guild_permissions(other_guild_id)
+        assert await manager.visible_session_roots(ADMIN_ID) == {ROOT_ID, other.root_channel_id}
+
+        manager._unregister_session(other)
+        assert await manager.visible_session_roots(ADMIN_ID) == {ROOT_ID}
+
+    asyncio.run(scenario())
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+from vc_control.runtime import VoiceEventDispatcher
+
+
+def _member(user_id: int, guild_id: int = 1) -> SimpleNamespace:
+    return SimpleNamespace(id=user_id, guild=SimpleNamespace(id=guild_id))
+
+
+def test_depth_tracks_pending_events_per_guild() -> None:
+    async def scenario() -> None:
+        release = asyncio.Event()
+        handled: list[int] = []
+
+        async def handler(member: SimpleNamespace, before: object, after: object) -> None:
+            await release.wait()
+            handled.append(member.id)
+
+        dispatcher = VoiceEventDispatcher(handler, logging.getLogger("vc_control.tests"), workers_per_guild=2)  # type: ignore[arg-type]
+        for user_id in (1, 2, 3):
+            dispatcher.submit(_member(user_id), None, None)  # type: ignore[arg-type]
+        dispatcher.submit(_member(4, guild_id=2), None, None)  # type: ignore[arg-type]
+        assert dispatcher.guild_depths == {1: 3, 2: 1}
+        assert dispatcher.guild_stats[1].max_depth == 3
+
+        await asyncio.sleep(0)
+        assert dispatcher.guild_depths == {1: 1}
+        assert dispatcher.stats()["queue_depth"] == 1
+
+        release.set()
+        await dispatcher.close()
+        assert sorted(handled) == [1, 2, 3, 4]
+        assert dispatcher.guild_depths == {}
+        assert dispatcher.stats()["guilds"]["1"]["processed"] == 3
+
+    asyncio.run(scenario())
+
+
+def test_close_waits_for_in_flight_handlers() -> None:
+    async def scenario() -> None:
+        handled: list[int] = []
+
+        async def handler(member: SimpleNamespace, before: object, after: object) -> None:
+            await asyncio.sleep(0.05)
+            handled.append(member.id)
+
+        dispatcher = VoiceEventDispatcher(handler, logging.getLogger("vc_control.tests"))  # type: ignore[arg-type]
+        dispatcher.submit(_member(1), None, None)  # type: ignore[arg-type]
+        dispatcher.submit(_member(2), None, None)  # type: ignore[arg-type]
+        await asyncio.sleep(0)
+        await dispatcher.close()
+        assert handled == [1, 2]
+
+        dispatcher.submit(_member(3), None, None)  # type: ignore[arg-type]
+        assert dispatcher.lanes == {}
+
+    asyncio.run(scenario())
+
+
+def test_close_cancels_handlers_past_the_timeout() -> None:
+    async def scenario() -> None:
+        cancelled = asyncio.Event()
+
+        async def handler(member: SimpleNamespace, before: object, after: object) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        dispatcher = VoiceEventDispatcher(handler, logging.getLogger("vc_control.tests"))  # type: ignore[arg-type]
+        dispatcher.submit(_member(1), None, None)  # type: ignore[arg-type]
+        dispatcher.submit(_member(2), None, None)  # type: ignore[arg-type]
+        await asyncio.sleep(0)
+        await dispatcher.close(timeout=0.05)
+        assert cancelled.is_set()
+        assert dispatcher.guild_depths == {}
+
+    asyncio.run(scenario())
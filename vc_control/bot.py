@@ -115,6 +115,7 @@ class VoiceControlBot(commands.Bot):
         if self.user is None:
             return
         self.logger.info("Discord Botとしてログインしました: %s", self.user)
+        self.session_manager.reset_voice_occupancy(list(self.guilds))
         if self._bootstrapped:
             return
         self._bootstrapped = True
@@ -122,6 +123,9 @@ class VoiceControlBot(commands.Bot):
         await self.session_manager.sync_guild_catalog()
         await self.session_manager.restore_sessions()
         self.session_manager.start_scheduled_vc_worker()
+        self.session_manager.start_timeline_retention_worker()
+        self.session_manager.start_journal_checkpoint_worker()
+        self.session_manager.start_dm_dispatcher()
 
         sync_guild_ids = _read_sync_guild_ids()
         try:
@@ -148,10 +152,7 @@ class VoiceControlBot(commands.Bot):
         before: discord.VoiceState,
         after: discord.VoiceState,
     ) -> None:
-        try:
-            await self.session_manager.handle_voice_state_update(member, before, after)
-        except Exception:
-            self.logger.exception("ボイス状態更新の処理中にエラーが発生しました")
+        self.session_manager.submit_voice_state_update(member, before, after)
 
     async def on_message(self, message: discord.Message) -> None:
         try:
@@ -161,12 +162,30 @@ class VoiceControlBot(commands.Bot):
 
     async def on_guild_join(self, guild: discord.Guild) -> None:
         self.logger.info("サーバーに参加しました: %s", guild.name)
+        self.session_manager.seed_voice_occupancy(guild)
         await self.session_manager.sync_guild_catalog()
 
     async def on_guild_remove(self, guild: discord.Guild) -> None:
         self.logger.info("サーバーから退出しました: %s", guild.name)
+        self.session_manager.drop_voice_occupancy(guild.id)
+        self.session_manager.invalidate_guild_permissions(guild.id)
         await self.session_manager.sync_guild_catalog()
 
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        self.session_manager.invalidate_member_permissions(after.guild.id, after.id)
+
+    async def on_member_remove(self, member: discord.Member) -> None:
+        self.session_manager.invalidate_member_permissions(member.guild.id, member.id)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        self.session_manager.invalidate_guild_permissions(after.guild.id)
+
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        self.session_manager.invalidate_guild_permissions(role.guild.id)
+
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild) -> None:
+        self.session_manager.invalidate_guild_permissions(after.id)
+
     async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
         try:
             await self.session_manager.handle_channel_delete(channel)
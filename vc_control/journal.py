@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import struct
+import uuid
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+JOURNAL_JOIN = 1
+JOURNAL_LEAVE = 2
+JOURNAL_MOVE = 3
+JOURNAL_VOICE = 4
+
+JOURNAL_FLAG_SELF_MUTED = 1
+JOURNAL_FLAG_SELF_DEAFENED = 2
+JOURNAL_FLAG_AFK_CHANNEL = 4
+
+_RECORD = struct.Struct("<BB16sqqq")
+_CHECKSUM = struct.Struct("<I")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_SEGMENT_PREFIX = "participants-"
+_SEGMENT_SUFFIX = ".journal"
+
+
+@dataclass(slots=True)
+class JournalEntry:
+    kind: int
+    session_id: str
+    user_id: int
+    channel_id: int | None
+    self_muted: bool
+    self_deafened: bool
+    in_afk_channel: bool
+    at: datetime
+
+
+def _encode(entry: JournalEntry) -> bytes | None:
+    try:
+        session_bytes = uuid.UUID(entry.session_id).bytes
+    except ValueError:
+        return None
+    flags = 0
+    if entry.self_muted:
+        flags |= JOURNAL_FLAG_SELF_MUTED
+    if entry.self_deafened:
+        flags |= JOURNAL_FLAG_SELF_DEAFENED
+    if entry.in_afk_channel:
+        flags |= JOURNAL_FLAG_AFK_CHANNEL
+    micros = (entry.at - _EPOCH) // timedelta(microseconds=1)
+    body = _RECORD.pack(entry.kind, flags, session_bytes, entry.user_id, entry.channel_id or 0, micros)
+    return body + _CHECKSUM.pack(zlib.crc32(body))
+
+
+def _decode(body: bytes) -> JournalEntry:
+    kind, flags, session_bytes, user_id, channel_id, micros = _RECORD.unpack(body)
+    return JournalEntry(
+        kind=kind,
+        session_id=str(uuid.UUID(bytes=session_bytes)),
+        user_id=user_id,
+        channel_id=channel_id or None,
+        self_muted=bool(flags & JOURNAL_FLAG_SELF_MUTED),
+        self_deafened=bool(flags & JOURNAL_FLAG_SELF_DEAFENED),
+        in_afk_channel=bool(flags & JOURNAL_FLAG_AFK_CHANNEL),
+        at=_EPOCH + timedelta(microseconds=micros),
+    )
+
+
+class ParticipantJournal:
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.records_since_rotate = 0
+        self._generation = 0
+        self._file = None
+
+    def _segments(self) -> list[tuple[int, Path]]:
+        segments: list[tuple[int, Path]] = []
+        for path in self.directory.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}"):
+            try:
+                generation = int(path.name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)])
+            except ValueError:
+                continue
+            segments.append((generation, path))
+        return sorted(segments)
+
+    def _segment_path(self, generation: int) -> Path:
+        return self.directory / f"{_SEGMENT_PREFIX}{generation:012d}{_SEGMENT_SUFFIX}"
+
+    def open(self) -> None:
+        if self._file is not None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        segments = self._segments()
+        self._generation = segments[-1][0] + 1 if segments else 1
+        self._file = open(self._segment_path(self._generation), "ab", buffering=0)
+        self.records_since_rotate = 0
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def append(self, entry: JournalEntry) -> None:
+        if self._file is None:
+            self.open()
+        record = _encode(entry)
+        if record is None:
+            return
+        self._file.write(record)
+        self.records_since_rotate += 1
+
+    def rotate(self) -> list[Path]:
+        self.open()
+        self._file.close()
+        sealed = [path for generation, path in self._segments() if generation <= self._generation]
+        self._generation += 1
+        self._file = open(self._segment_path(self._generation), "ab", buffering=0)
+        self.records_since_rotate = 0
+        return sealed
+
+    def discard(self, paths: list[Path]) -> None:
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+    def replay(self) -> Iterator[JournalEntry]:
+        record_size = _RECORD.size + _CHECKSUM.size
+        for _, path in self._segments():
+            data = path.read_bytes()
+            for offset in range(0, len(data) - record_size + 1, record_size):
+                body = data[offset : offset + _RECORD.size]
+                (checksum,) = _CHECKSUM.unpack_from(data, offset + _RECORD.size)
+                if zlib.crc32(body) != checksum:
+                    break
+                yield _decode(body)
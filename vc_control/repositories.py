@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import uuid
 from collections import defaultdict
 from contextlib import asynccontextmanager
@@ -9,14 +10,24 @@ from pathlib import Path
 from typing import Any
 
 import aiosqlite
+from cryptography.fernet import InvalidToken
 
-from vc_control.models import CompletedMember, CompletedSession, GuildConfig, ScheduledVC, SessionSnapshot, SetupPayload
+from vc_control.models import CompletedSession, GuildConfig, ScheduledVC, SessionSnapshot, SetupPayload
 from vc_control.security import SecretBox
 from vc_control.utils import from_iso, json_dumps, json_loads, period_cutoff, to_iso, utcnow
 
 
+logger = logging.getLogger("vc_control.repositories")
+
 SQLITE_BUSY_TIMEOUT_MS = 5000
 SQLITE_RETRY_DELAYS = (0.0, 0.2, 0.5, 1.0)
+SQLITE_READER_CONNECTIONS = 4
+SQLITE_CACHED_STATEMENTS = 256
+SQLITE_GROUP_COMMIT_WINDOW_SEC = 0.005
+SQLITE_GROUP_COMMIT_MAX_BATCH = 64
+LEADERBOARD_PERIODS = ("day", "week", "month", "year")
+LEADERBOARD_ROLLING_BUCKET = "rolling"
+TIMELINE_PURGE_BATCH_SIZE = 5000
 
 
 def _row_to_dict(row: aiosqlite.Row | None) -> dict[str, Any] | None:
@@ -36,17 +47,183 @@ async def _apply_sqlite_pragmas(db: aiosqlite.Connection) -> None:
     await db.execute("PRAGMA foreign_keys=ON;")
 
 
-@asynccontextmanager
 async def _open_sqlite_connection(
     db_path: Path,
     *,
     row_factory: type[aiosqlite.Row] | None = None,
-) -> Any:
-    async with aiosqlite.connect(db_path, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000) as db:
-        if row_factory is not None:
-            db.row_factory = row_factory
-        await _apply_sqlite_pragmas(db)
-        yield db
+) -> aiosqlite.Connection:
+    db = await aiosqlite.connect(
+        db_path,
+        timeout=SQLITE_BUSY_TIMEOUT_MS / 1000,
+        cached_statements=SQLITE_CACHED_STATEMENTS,
+    )
+    if row_factory is not None:
+        db.row_factory = row_factory
+    await _apply_sqlite_pragmas(db)
+    return db
+
+
+class SQLiteConnectionPool:
+    def __init__(self, db_path: Path, *, readers: int = SQLITE_READER_CONNECTIONS) -> None:
+        self.db_path = db_path
+        self.reader_count = max(1, readers)
+        self._writer: aiosqlite.Connection | None = None
+        self._readers: list[aiosqlite.Connection] = []
+        self._idle_readers: asyncio.Queue[aiosqlite.Connection | None] = asyncio.Queue()
+        self._open_lock = asyncio.Lock()
+        self._closed = False
+
+    async def open(self) -> None:
+        async with self._open_lock:
+            if self._writer is not None:
+                return
+            self._closed = False
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = await _open_sqlite_connection(self.db_path)
+            for _ in range(self.reader_count):
+                reader = await _open_sqlite_connection(self.db_path, row_factory=aiosqlite.Row)
+                self._readers.append(reader)
+                self._idle_readers.put_nowait(reader)
+
+    async def close(self) -> None:
+        async with self._open_lock:
+            self._closed = True
+            readers, self._readers = self._readers, []
+            idle_readers, self._idle_readers = self._idle_readers, asyncio.Queue()
+            idle_readers.put_nowait(None)
+            writer, self._writer = self._writer, None
+            for reader in readers:
+                await reader.close()
+            if writer is not None:
+                await writer.close()
+
+    async def _ensure_open(self) -> None:
+        if self._writer is not None:
+            return
+        if self._closed:
+            raise RuntimeError(f"SQLite connection pool is closed: {self.db_path}")
+        await self.open()
+
+    async def writer(self) -> aiosqlite.Connection:
+        await self._ensure_open()
+        return self._writer  # type: ignore[return-value]
+
+    @asynccontextmanager
+    async def reader(self) -> Any:
+        await self._ensure_open()
+        idle_readers = self._idle_readers
+        db = await idle_readers.get()
+        if db is None:
+            idle_readers.put_nowait(None)
+            raise RuntimeError(f"SQLite connection pool is closed: {self.db_path}")
+        try:
+            yield db
+        finally:
+            if db in self._readers:
+                self._idle_readers.put_nowait(db)
+
+
+class SQLiteGroupCommitQueue:
+    def __init__(
+        self,
+        pool: SQLiteConnectionPool,
+        *,
+        window_sec: float = SQLITE_GROUP_COMMIT_WINDOW_SEC,
+        max_batch: int = SQLITE_GROUP_COMMIT_MAX_BATCH,
+    ) -> None:
+        self._pool = pool
+        self.window_sec = max(0.0, window_sec)
+        self.max_batch = max(1, max_batch)
+        self._queue: asyncio.Queue[tuple[Any, asyncio.Future[Any]] | None] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._worker())
+
+    async def submit(self, operation: Any) -> Any:
+        self.start()
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((operation, future))
+        return await future
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        self._queue.put_nowait(None)
+        await task
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            if self.window_sec and self._queue.qsize() < self.max_batch - 1:
+                await asyncio.sleep(self.window_sec)
+            stopping = False
+            while len(batch) < self.max_batch and not self._queue.empty():
+                pending = self._queue.get_nowait()
+                if pending is None:
+                    stopping = True
+                    break
+                batch.append(pending)
+            await self._commit_batch(batch)
+            if stopping:
+                return
+
+    async def _commit_batch(self, batch: list[tuple[Any, asyncio.Future[Any]]]) -> None:
+        last_error: Exception | None = None
+        try:
+            db = await self._pool.writer()
+            for delay in SQLITE_RETRY_DELAYS:
+                if delay:
+                    await asyncio.sleep(delay)
+                try:
+                    outcomes = await self._apply_batch(db, batch)
+                    await db.commit()
+                except Exception as exc:
+                    await db.rollback()
+                    if not _is_database_locked_error(exc):
+                        raise
+                    last_error = exc
+                    continue
+                for (_, future), (succeeded, value) in zip(batch, outcomes):
+                    if future.done():
+                        continue
+                    if succeeded:
+                        future.set_result(value)
+                    else:
+                        future.set_exception(value)
+                return
+        except Exception as exc:
+            last_error = exc
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(last_error or RuntimeError("group commit failed"))
+
+    async def _apply_batch(
+        self,
+        db: aiosqlite.Connection,
+        batch: list[tuple[Any, asyncio.Future[Any]]],
+    ) -> list[tuple[bool, Any]]:
+        outcomes: list[tuple[bool, Any]] = []
+        await db.execute("BEGIN")
+        for operation, _ in batch:
+            await db.execute("SAVEPOINT group_commit_item")
+            try:
+                result = await operation(db)
+            except Exception as exc:
+                if _is_database_locked_error(exc):
+                    raise
+                await db.execute("ROLLBACK TO group_commit_item")
+                await db.execute("RELEASE group_commit_item")
+                outcomes.append((False, exc))
+                continue
+            await db.execute("RELEASE group_commit_item")
+            outcomes.append((True, result))
+        return outcomes
 
 
 def _split_by_day(started_at: datetime, ended_at: datetime) -> list[tuple[date, int]]:
@@ -73,24 +250,166 @@ def _split_by_hour(started_at: datetime, ended_at: datetime) -> list[tuple[date,
     return result
 
 
+def _aggregate_session_rollups(
+    session: CompletedSession,
+) -> tuple[
+    dict[tuple[int, int], tuple[str, int, int]],
+    dict[tuple[str, int, int], tuple[str, int, int]],
+    dict[tuple[str, int, int, int], tuple[int, int]],
+]:
+    totals: dict[tuple[int, int], tuple[str, int, int]] = {}
+    daily: dict[tuple[str, int, int], tuple[str, int, int]] = {}
+    hourly: dict[tuple[str, int, int, int], tuple[int, int]] = {}
+    guild_id = session.guild_id
+
+    for member in session.members:
+        total_key = (guild_id, member.user_id)
+        _, total_talk, total_afk = totals.get(total_key, ("", 0, 0))
+        totals[total_key] = (member.user_name, total_talk + member.talk_seconds, total_afk + member.afk_seconds)
+
+        total_seconds = max(1, int((member.left_at - member.joined_at).total_seconds()))
+        talk_ratio = member.talk_seconds / total_seconds
+        afk_ratio = member.afk_seconds / total_seconds
+
+        for target_date, seconds in _split_by_day(member.joined_at, member.left_at):
+            daily_key = (target_date.isoformat(), guild_id, member.user_id)
+            _, day_talk, day_afk = daily.get(daily_key, ("", 0, 0))
+            daily[daily_key] = (
+                member.user_name,
+                day_talk + int(seconds * talk_ratio),
+                day_afk + int(seconds * afk_ratio),
+            )
+
+        for target_date, hour, seconds in _split_by_hour(member.joined_at, member.left_at):
+            hourly_key = (target_date.isoformat(), guild_id, member.user_id, hour)
+            hour_talk, hour_afk = hourly.get(hourly_key, (0, 0))
+            hourly[hourly_key] = (hour_talk + int(seconds * talk_ratio), hour_afk + int(seconds * afk_ratio))
+
+    return totals, daily, hourly
+
+
+def _aggregate_leaderboard_entries(
+    totals: dict[tuple[int, int], tuple[str, int, int]],
+    daily: dict[tuple[str, int, int], tuple[str, int, int]],
+    anchor: date,
+) -> dict[tuple[str, str, int, int], tuple[str, int, int]]:
+    entries: dict[tuple[str, str, int, int], tuple[str, int, int]] = {}
+    windows = {period: period_cutoff(period, anchor) or anchor for period in LEADERBOARD_PERIODS}
+
+    def add(key: tuple[str, str, int, int], user_name: str, talk_seconds: int, afk_seconds: int) -> None:
+        _, current_talk, current_afk = entries.get(key, ("", 0, 0))
+        entries[key] = (user_name, current_talk + talk_seconds, current_afk + afk_seconds)
+
+    for (guild_id, user_id), (user_name, talk_seconds, afk_seconds) in totals.items():
+        add(("all", "all", guild_id, user_id), user_name, talk_seconds, afk_seconds)
+    for (target_date, guild_id, user_id), (user_name, talk_seconds, afk_seconds) in daily.items():
+        day = date.fromisoformat(target_date)
+        for period, start in windows.items():
+            if start <= day <= anchor:
+                add((period, LEADERBOARD_ROLLING_BUCKET, guild_id, user_id), user_name, talk_seconds, afk_seconds)
+    return entries
+
+
+async def _upsert_leaderboard_entries(db: aiosqlite.Connection, rows: list[tuple[str, str, int, str, int, str, int, int]]) -> None:
+    await db.executemany(
+        """
+        INSERT INTO leaderboard_entries(
+            scope, period_bucket, guild_id, guild_name, user_id, user_name, talk_seconds, afk_seconds
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(scope, period_bucket, guild_id, user_id) DO UPDATE SET
+            guild_name = excluded.guild_name,
+            user_name = excluded.user_name,
+            talk_seconds = leaderboard_entries.talk_seconds + excluded.talk_seconds,
+            afk_seconds = leaderboard_entries.afk_seconds + excluded.afk_seconds
+        """,
+        rows,
+    )
+
+
+async def _daily_totals_between(db: aiosqlite.Connection, start: date, end: date) -> list[tuple[int, str, int, str, int, int]]:
+    if start > end:
+        return []
+    cursor = await db.execute(
+        """
+        SELECT guild_id, MAX(guild_name), user_id, MAX(user_name), SUM(talk_seconds), SUM(afk_seconds)
+        FROM daily_user_stats
+        WHERE date >= ? AND date <= ?
+        GROUP BY guild_id, user_id
+        """,
+        (start.isoformat(), end.isoformat()),
+    )
+    return [
+        (int(row[0]), str(row[1]), int(row[2]), str(row[3]), int(row[4]), int(row[5]))
+        for row in await cursor.fetchall()
+    ]
+
+
+async def _advance_leaderboard_windows(db: aiosqlite.Connection, today: date) -> None:
+    cursor = await db.execute("SELECT scope, anchor_date FROM leaderboard_windows")
+    anchors = {str(row[0]): date.fromisoformat(str(row[1])) for row in await cursor.fetchall()}
+    for period in LEADERBOARD_PERIODS:
+        anchor = anchors.get(period)
+        if anchor is None or anchor >= today:
+            continue
+        old_start = period_cutoff(period, anchor) or anchor
+        new_start = period_cutoff(period, today) or today
+        leaving = await _daily_totals_between(db, old_start, min(anchor, new_start - timedelta(days=1)))
+        entering = await _daily_totals_between(db, max(anchor + timedelta(days=1), new_start), today)
+        await db.executemany(
+            """
+            UPDATE leaderboard_entries
+            SET talk_seconds = talk_seconds - ?, afk_seconds = afk_seconds - ?
+            WHERE scope = ? AND period_bucket = ? AND guild_id = ? AND user_id = ?
+            """,
+            [
+                (talk_seconds, afk_seconds, period, LEADERBOARD_ROLLING_BUCKET, guild_id, user_id)
+                for guild_id, _, user_id, _, talk_seconds, afk_seconds in leaving
+            ],
+        )
+        await _upsert_leaderboard_entries(
+            db,
+            [
+                (period, LEADERBOARD_ROLLING_BUCKET, guild_id, guild_name, user_id, user_name, talk_seconds, afk_seconds)
+                for guild_id, guild_name, user_id, user_name, talk_seconds, afk_seconds in entering
+            ],
+        )
+        await db.execute(
+            """
+            DELETE FROM leaderboard_entries
+            WHERE scope = ? AND period_bucket = ? AND talk_seconds <= 0 AND afk_seconds <= 0
+            """,
+            (period, LEADERBOARD_ROLLING_BUCKET),
+        )
+        await db.execute(
+            "UPDATE leaderboard_windows SET anchor_date = ? WHERE scope = ?",
+            (today.isoformat(), period),
+        )
+
+
 class ConfigRepository:
     def __init__(self, db_path: Path, secret_box: SecretBox) -> None:
         self.db_path = db_path
         self.secret_box = secret_box
+        self._pool = SQLiteConnectionPool(db_path)
         self._write_lock = asyncio.Lock()
+        self._settings_lock = asyncio.Lock()
+        self._settings_generation = 0
+        self._app_settings_cache: dict[str, str] | None = None
+        self._secure_settings_cache: dict[str, str | None] | None = None
 
     async def _run_write(self, operation: Any) -> Any:
         async with self._write_lock:
             last_error: Exception | None = None
+            db = await self._pool.writer()
             for delay in SQLITE_RETRY_DELAYS:
                 if delay:
                     await asyncio.sleep(delay)
                 try:
-                    async with _open_sqlite_connection(self.db_path) as db:
-                        result = await operation(db)
-                        await db.commit()
-                        return result
+                    result = await operation(db)
+                    await db.commit()
+                    return result
                 except Exception as exc:
+                    await db.rollback()
                     if not _is_database_locked_error(exc):
                         raise
                     last_error = exc
@@ -98,9 +417,14 @@ class ConfigRepository:
                 raise last_error
         return None
 
+    async def close(self) -> None:
+        async with self._write_lock:
+            await self._pool.close()
+
     async def initialize(self) -> None:
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        async with _open_sqlite_connection(self.db_path) as db:
+        await self._pool.open()
+        db = await self._pool.writer()
+        async with self._write_lock:
             await db.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS app_settings (
@@ -231,78 +555,124 @@ class ConfigRepository:
             if column not in existing:
                 await db.execute(f"ALTER TABLE guild_settings ADD COLUMN {column} {definition}")
 
-    async def _set_app_setting(self, key: str, value: str) -> None:
+    async def _load_settings_cache(self) -> tuple[dict[str, str], dict[str, str | None]]:
+        app_settings = self._app_settings_cache
+        secure_settings = self._secure_settings_cache
+        if app_settings is not None and secure_settings is not None:
+            return app_settings, secure_settings
+        async with self._settings_lock:
+            if self._app_settings_cache is not None and self._secure_settings_cache is not None:
+                return self._app_settings_cache, self._secure_settings_cache
+            generation = self._settings_generation
+            async with self._pool.reader() as db:
+                cursor = await db.execute(
+                    """
+                    SELECT 0 AS secure, key, value FROM app_settings
+                    UNION ALL
+                    SELECT 1 AS secure, key, value FROM secure_settings
+                    """
+                )
+                rows = await cursor.fetchall()
+            app_settings = {}
+            secure_settings = {}
+            for row in rows:
+                if row["secure"]:
+                    try:
+                        secure_settings[str(row["key"])] = self.secret_box.decrypt(str(row["value"]))
+                    except (InvalidToken, ValueError) as exc:
+                        logger.warning("暗号化設定を復号できませんでした: key=%s error=%s", row["key"], type(exc).__name__)
+                        secure_settings[str(row["key"])] = None
+                else:
+                    app_settings[str(row["key"])] = str(row["value"])
+            if generation == self._settings_generation:
+                self._app_settings_cache = app_settings
+                self._secure_settings_cache = secure_settings
+            return app_settings, secure_settings
+
+    def _apply_settings_cache(self, plain_values: dict[str, str], secure_values: dict[str, str]) -> None:
+        self._settings_generation += 1
+        if self._app_settings_cache is None or self._secure_settings_cache is None:
+            return
+        self._app_settings_cache = {**self._app_settings_cache, **plain_values}
+        self._secure_settings_cache = {**self._secure_settings_cache, **secure_values}
+
+    def invalidate_settings_cache(self) -> None:
+        self._settings_generation += 1
+        self._app_settings_cache = None
+        self._secure_settings_cache = None
+
+    async def _write_settings(self, plain_values: dict[str, str], secure_values: dict[str, str]) -> None:
         now = to_iso(utcnow()) or ""
+        encrypted_values = {key: self.secret_box.encrypt(value) for key, value in secure_values.items()}
+
         async def operation(db: aiosqlite.Connection) -> None:
-            await db.execute(
-                """
-                INSERT INTO app_settings(key, value, updated_at)
-                VALUES (?, ?, ?)
-                ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
-                """,
-                (key, value, now),
-            )
-        await self._run_write(operation)
+            if plain_values:
+                await db.executemany(
+                    """
+                    INSERT INTO app_settings(key, value, updated_at)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+                    """,
+                    [(key, value, now) for key, value in plain_values.items()],
+                )
+            if encrypted_values:
+                await db.executemany(
+                    """
+                    INSERT INTO secure_settings(key, value, updated_at)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+                    """,
+                    [(key, value, now) for key, value in encrypted_values.items()],
+                )
+
+        try:
+            await self._run_write(operation)
+        except Exception:
+            self.invalidate_settings_cache()
+            raise
+        self._apply_settings_cache(plain_values, secure_values)
+
+    async def _set_app_setting(self, key: str, value: str) -> None:
+        await self._write_settings({key: value}, {})
 
     async def _set_secure_setting(self, key: str, value: str) -> None:
-        now = to_iso(utcnow()) or ""
-        encrypted = self.secret_box.encrypt(value)
-        async def operation(db: aiosqlite.Connection) -> None:
-            await db.execute(
-                """
-                INSERT INTO secure_settings(key, value, updated_at)
-                VALUES (?, ?, ?)
-                ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
-                """,
-                (key, encrypted, now),
-            )
-        await self._run_write(operation)
+        await self._write_settings({}, {key: value})
 
     async def save_initial_setup(self, payload: SetupPayload, session_secret: str) -> None:
-        await self._set_secure_setting("bot_token", payload.bot_token)
-        await self._set_secure_setting("client_secret", payload.client_secret)
-        await self._set_secure_setting("session_secret", session_secret)
-
-        plain_values = {
-            "client_id": payload.client_id,
-            "redirect_uri": payload.redirect_uri,
-            "base_url": payload.base_url.rstrip("/"),
-            "owner_user_id": str(payload.owner_user_id),
-            "dashboard_host": payload.dashboard_host,
-            "dashboard_port": str(payload.dashboard_port),
-            "setup_completed": "1",
-        }
-        for key, value in plain_values.items():
-            await self._set_app_setting(key, value)
+        await self._write_settings(
+            {
+                "client_id": payload.client_id,
+                "redirect_uri": payload.redirect_uri,
+                "base_url": payload.base_url.rstrip("/"),
+                "owner_user_id": str(payload.owner_user_id),
+                "dashboard_host": payload.dashboard_host,
+                "dashboard_port": str(payload.dashboard_port),
+                "setup_completed": "1",
+            },
+            {
+                "bot_token": payload.bot_token,
+                "client_secret": payload.client_secret,
+                "session_secret": session_secret,
+            },
+        )
 
     async def update_runtime_settings(
         self,
         plain_values: dict[str, str],
         secure_values: dict[str, str] | None = None,
     ) -> None:
-        for key, value in plain_values.items():
-            await self._set_app_setting(key, value)
-        for key, value in (secure_values or {}).items():
-            if value:
-                await self._set_secure_setting(key, value)
+        await self._write_settings(
+            dict(plain_values),
+            {key: value for key, value in (secure_values or {}).items() if value},
+        )
 
     async def get_app_setting(self, key: str, default: str | None = None) -> str | None:
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("SELECT value FROM app_settings WHERE key = ?", (key,))
-            row = await cursor.fetchone()
-        if row is None:
-            return default
-        return str(row["value"])
+        app_settings, _ = await self._load_settings_cache()
+        return app_settings.get(key, default)
 
     async def get_secure_setting(self, key: str) -> str | None:
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("SELECT value FROM secure_settings WHERE key = ?", (key,))
-            row = await cursor.fetchone()
-        if row is None:
-            return None
-        return self.secret_box.decrypt(str(row["value"]))
+        _, secure_settings = await self._load_settings_cache()
+        return secure_settings.get(key)
 
     async def is_setup_complete(self) -> bool:
         return (await self.get_app_setting("setup_completed", "0")) == "1"
@@ -318,11 +688,12 @@ class ConfigRepository:
             "timeline_retention_days",
         ]
         secure_keys = ["bot_token", "client_secret", "session_secret"]
+        app_settings, secure_settings = await self._load_settings_cache()
         values: dict[str, str] = {}
         for key in keys:
-            values[key] = await self.get_app_setting(key, "") or ""
+            values[key] = app_settings.get(key) or ""
         for key in secure_keys:
-            values[key] = await self.get_secure_setting(key) or ""
+            values[key] = secure_settings.get(key) or ""
         return values
 
     async def sync_guild_catalog(self, guilds: list[tuple[int, str]]) -> None:
@@ -340,15 +711,13 @@ class ConfigRepository:
         await self._run_write(operation)
 
     async def list_guild_configs(self) -> list[GuildConfig]:
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             cursor = await db.execute("SELECT * FROM guild_settings ORDER BY guild_name COLLATE NOCASE")
             rows = await cursor.fetchall()
         return [GuildConfig.from_record(_row_to_dict(row) or {}) for row in rows]
 
     async def get_guild_config(self, guild_id: int) -> GuildConfig | None:
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             cursor = await db.execute("SELECT * FROM guild_settings WHERE guild_id = ?", (guild_id,))
             row = await cursor.fetchone()
         if row is None:
@@ -434,44 +803,26 @@ class ConfigRepository:
 
         await self._run_write(operation)
 
-    async def save_session_snapshot(self, snapshot: SessionSnapshot) -> None:
-        now = to_iso(utcnow()) or ""
-        async def operation(db: aiosqlite.Connection) -> None:
-            await db.execute(
-                """
-                INSERT INTO session_snapshots(session_key, guild_id, root_channel_id, payload_json, updated_at)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(session_key) DO UPDATE SET
-                    guild_id = excluded.guild_id,
-                    root_channel_id = excluded.root_channel_id,
-                    payload_json = excluded.payload_json,
-                    updated_at = excluded.updated_at
-                """,
-                (
-                    snapshot.session_id,
-                    snapshot.guild_id,
-                    snapshot.root_channel_id,
-                    json_dumps(snapshot.to_dict()),
-                    now,
-                ),
-            )
-        await self._run_write(operation)
-
-    async def list_session_snapshots(self) -> list[SessionSnapshot]:
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("SELECT payload_json FROM session_snapshots")
+    async def list_legacy_session_snapshots(self) -> tuple[list[str], list[SessionSnapshot]]:
+        async with self._pool.reader() as db:
+            cursor = await db.execute("SELECT session_key, payload_json FROM session_snapshots")
             rows = await cursor.fetchall()
+        keys: list[str] = []
         snapshots: list[SessionSnapshot] = []
         for row in rows:
-            payload = json_loads(row["payload_json"], {})
+            keys.append(str(row[0]))
+            payload = json_loads(row[1], {})
             if isinstance(payload, dict):
                 snapshots.append(SessionSnapshot.from_dict(payload))
-        return snapshots
+        return keys, snapshots
+
+    async def delete_legacy_session_snapshots(self, session_keys: list[str]) -> None:
+        if not session_keys:
+            return
 
-    async def delete_session_snapshot(self, session_id: str) -> None:
         async def operation(db: aiosqlite.Connection) -> None:
-            await db.execute("DELETE FROM session_snapshots WHERE session_key = ?", (session_id,))
+            await db.executemany("DELETE FROM session_snapshots WHERE session_key = ?", [(key,) for key in session_keys])
+
         await self._run_write(operation)
 
     async def log_error(self, level: str, source: str, message: str, detail: str) -> None:
@@ -488,8 +839,7 @@ class ConfigRepository:
 
     async def get_error_logs(self, page: int = 1, per_page: int = 30) -> tuple[list[dict[str, Any]], int]:
         offset = max(0, (page - 1) * per_page)
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             count_cursor = await db.execute("SELECT COUNT(*) AS total FROM error_logs")
             total_row = await count_cursor.fetchone()
             cursor = await db.execute(
@@ -553,8 +903,7 @@ class ConfigRepository:
         }
 
     async def list_notifications(self, user_id: int, limit: int = 30) -> list[dict[str, Any]]:
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             cursor = await db.execute(
                 """
                 SELECT
@@ -586,8 +935,7 @@ class ConfigRepository:
         return result
 
     async def count_unread_notifications(self, user_id: int) -> int:
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             cursor = await db.execute(
                 """
                 SELECT COUNT(*) AS total
@@ -767,8 +1115,7 @@ class ConfigRepository:
             params.append(guild_id)
         where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         params.append(limit)
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             cursor = await db.execute(
                 f"""
                 SELECT *
@@ -782,25 +1129,20 @@ class ConfigRepository:
             rows = await cursor.fetchall()
         return [ScheduledVC.from_record(_row_to_dict(row) or {}) for row in rows]
 
-    async def list_due_scheduled_vc_starts(self, now: datetime, limit: int = 20) -> list[ScheduledVC]:
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                """
-                SELECT *
-                FROM scheduled_vcs
-                WHERE status = 'pending' AND start_at <= ?
-                ORDER BY start_at ASC, id ASC
-                LIMIT ?
-                """,
-                (to_iso(now), limit),
-            )
+    async def get_scheduled_vc(self, scheduled_id: int) -> ScheduledVC | None:
+        async with self._pool.reader() as db:
+            cursor = await db.execute("SELECT * FROM scheduled_vcs WHERE id = ?", (scheduled_id,))
+            row = await cursor.fetchone()
+        return ScheduledVC.from_record(_row_to_dict(row) or {}) if row is not None else None
+
+    async def list_upcoming_scheduled_vcs(self) -> list[ScheduledVC]:
+        async with self._pool.reader() as db:
+            cursor = await db.execute("SELECT * FROM scheduled_vcs WHERE status IN ('pending', 'active') ORDER BY id ASC")
             rows = await cursor.fetchall()
         return [ScheduledVC.from_record(_row_to_dict(row) or {}) for row in rows]
 
     async def list_active_scheduled_vcs(self) -> list[ScheduledVC]:
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             cursor = await db.execute("SELECT * FROM scheduled_vcs WHERE status = 'active' ORDER BY end_at ASC, id ASC")
             rows = await cursor.fetchall()
         return [ScheduledVC.from_record(_row_to_dict(row) or {}) for row in rows]
@@ -847,120 +1189,499 @@ class ConfigRepository:
         await self._run_write(operation)
 
 
+class LiveStateRepository:
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._pool = SQLiteConnectionPool(db_path, readers=1)
+        self._write_queue = SQLiteGroupCommitQueue(self._pool)
+
+    async def _run_write(self, operation: Any) -> Any:
+        return await self._write_queue.submit(operation)
+
+    async def close(self) -> None:
+        await self._write_queue.close()
+        await self._pool.close()
+
+    async def initialize(self) -> None:
+        await self._pool.open()
+        db = await self._pool.writer()
+        await db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS session_snapshots (
+                session_key TEXT PRIMARY KEY,
+                guild_id INTEGER NOT NULL,
+                root_channel_id INTEGER NOT NULL,
+                payload_json TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS cleanup_deadlines (
+                kind TEXT NOT NULL,
+                channel_id INTEGER NOT NULL,
+                guild_id INTEGER NOT NULL,
+                started_at TEXT NOT NULL,
+                due_at TEXT NOT NULL,
+                stage TEXT NOT NULL DEFAULT 'notice',
+                PRIMARY KEY(kind, channel_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_cleanup_deadlines_due ON cleanup_deadlines(due_at);
+            CREATE TABLE IF NOT EXISTS dm_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_key TEXT NOT NULL UNIQUE,
+                kind TEXT NOT NULL,
+                guild_id INTEGER,
+                embed_json TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                created_at TEXT NOT NULL,
+                completed_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS dm_deliveries (
+                job_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at TEXT,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY(job_id, user_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_dm_deliveries_pending ON dm_deliveries(status, job_id);
+            """
+        )
+        cursor = await db.execute("PRAGMA table_info(cleanup_deadlines)")
+        if "stage" not in {str(row[1]) for row in await cursor.fetchall()}:
+            await db.execute("ALTER TABLE cleanup_deadlines ADD COLUMN stage TEXT NOT NULL DEFAULT 'notice'")
+        cursor = await db.execute("PRAGMA table_info(dm_deliveries)")
+        if "next_attempt_at" not in {str(row[1]) for row in await cursor.fetchall()}:
+            await db.execute("ALTER TABLE dm_deliveries ADD COLUMN next_attempt_at TEXT")
+        await db.commit()
+        self._write_queue.start()
+
+    async def import_session_snapshots(self, snapshots: list[SessionSnapshot]) -> None:
+        if not snapshots:
+            return
+        now = to_iso(utcnow()) or ""
+
+        async def operation(db: aiosqlite.Connection) -> None:
+            await db.executemany(
+                """
+                INSERT OR IGNORE INTO session_snapshots(session_key, guild_id, root_channel_id, payload_json, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (snapshot.session_id, snapshot.guild_id, snapshot.root_channel_id, json_dumps(snapshot.to_dict()), now)
+                    for snapshot in snapshots
+                ],
+            )
+
+        await self._run_write(operation)
+
+    async def save_session_snapshot(self, snapshot: SessionSnapshot) -> None:
+        now = to_iso(utcnow()) or ""
+        payload_json = json_dumps(snapshot.to_dict())
+
+        async def operation(db: aiosqlite.Connection) -> None:
+            await db.execute(
+                """
+                INSERT INTO session_snapshots(session_key, guild_id, root_channel_id, payload_json, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(session_key) DO UPDATE SET
+                    guild_id = excluded.guild_id,
+                    root_channel_id = excluded.root_channel_id,
+                    payload_json = excluded.payload_json,
+                    updated_at = excluded.updated_at
+                """,
+                (snapshot.session_id, snapshot.guild_id, snapshot.root_channel_id, payload_json, now),
+            )
+
+        await self._run_write(operation)
+
+    async def list_session_snapshots(self) -> list[SessionSnapshot]:
+        async with self._pool.reader() as db:
+            cursor = await db.execute("SELECT payload_json FROM session_snapshots")
+            rows = await cursor.fetchall()
+        snapshots: list[SessionSnapshot] = []
+        for row in rows:
+            payload = json_loads(row["payload_json"], {})
+            if isinstance(payload, dict):
+                snapshots.append(SessionSnapshot.from_dict(payload))
+        return snapshots
+
+    async def delete_session_snapshot(self, session_id: str) -> None:
+        async def operation(db: aiosqlite.Connection) -> None:
+            await db.execute("DELETE FROM session_snapshots WHERE session_key = ?", (session_id,))
+
+        await self._run_write(operation)
+
+    async def save_cleanup_deadline(
+        self,
+        kind: str,
+        channel_id: int,
+        guild_id: int,
+        started_at: datetime,
+        due_at: datetime,
+        stage: str = "notice",
+    ) -> None:
+        async def operation(db: aiosqlite.Connection) -> None:
+            await db.execute(
+                """
+                INSERT INTO cleanup_deadlines(kind, channel_id, guild_id, started_at, due_at, stage)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(kind, channel_id) DO UPDATE SET
+                    guild_id = excluded.guild_id,
+                    started_at = excluded.started_at,
+                    due_at = excluded.due_at,
+                    stage = excluded.stage
+                """,
+                (kind, channel_id, guild_id, to_iso(started_at), to_iso(due_at), stage),
+            )
+
+        await self._run_write(operation)
+
+    async def delete_cleanup_deadline(self, kind: str, channel_id: int) -> None:
+        async def operation(db: aiosqlite.Connection) -> None:
+            await db.execute("DELETE FROM cleanup_deadlines WHERE kind = ? AND channel_id = ?", (kind, channel_id))
+
+        await self._run_write(operation)
+
+    async def list_cleanup_deadlines(self) -> list[dict[str, Any]]:
+        async with self._pool.reader() as db:
+            cursor = await db.execute("SELECT * FROM cleanup_deadlines ORDER BY due_at ASC")
+            rows = await cursor.fetchall()
+        deadlines: list[dict[str, Any]] = []
+        for row in rows:
+            item = _row_to_dict(row) or {}
+            item["started_at"] = from_iso(item.get("started_at"))
+            item["due_at"] = from_iso(item.get("due_at"))
+            deadlines.append(item)
+        return deadlines
+
+    async def create_dm_job(
+        self,
+        job_key: str,
+        kind: str,
+        guild_id: int | None,
+        embed: dict[str, Any],
+        user_ids: list[int],
+    ) -> int:
+        now = to_iso(utcnow()) or ""
+
+        async def operation(db: aiosqlite.Connection) -> int:
+            await db.execute(
+                """
+                INSERT OR IGNORE INTO dm_jobs(job_key, kind, guild_id, embed_json, status, created_at)
+                VALUES (?, ?, ?, ?, 'pending', ?)
+                """,
+                (job_key, kind, guild_id, json_dumps(embed), now),
+            )
+            cursor = await db.execute("SELECT id FROM dm_jobs WHERE job_key = ?", (job_key,))
+            row = await cursor.fetchone()
+            job_id = int(row[0])
+            await db.executemany(
+                "INSERT OR IGNORE INTO dm_deliveries(job_id, user_id, status, attempts, updated_at) VALUES (?, ?, 'pending', 0, ?)",
+                [(job_id, user_id, now) for user_id in dict.fromkeys(user_ids)],
+            )
+            return job_id
+
+        return await self._run_write(operation)
+
+    async def list_pending_dm_deliveries(self, limit: int, now: datetime | None = None) -> list[dict[str, Any]]:
+        async with self._pool.reader() as db:
+            cursor = await db.execute(
+                """
+                SELECT d.job_id, d.user_id, d.attempts, j.guild_id, j.kind, j.embed_json
+                FROM dm_deliveries AS d
+                JOIN dm_jobs AS j ON j.id = d.job_id
+                WHERE d.status = 'pending' AND (d.next_attempt_at IS NULL OR d.next_attempt_at <= ?)
+                ORDER BY d.job_id ASC, d.rowid ASC
+                LIMIT ?
+                """,
+                (to_iso(now or utcnow()), limit),
+            )
+            rows = await cursor.fetchall()
+        deliveries: list[dict[str, Any]] = []
+        for row in rows:
+            item = _row_to_dict(row) or {}
+            item["embed"] = json_loads(item.pop("embed_json", None), {})
+            deliveries.append(item)
+        return deliveries
+
+    async def next_dm_retry_at(self) -> datetime | None:
+        async with self._pool.reader() as db:
+            cursor = await db.execute(
+                "SELECT MIN(next_attempt_at) FROM dm_deliveries WHERE status = 'pending' AND next_attempt_at IS NOT NULL"
+            )
+            row = await cursor.fetchone()
+        return from_iso(row[0]) if row is not None and row[0] else None
+
+    async def update_dm_deliveries(self, results: list[tuple[int, int, str, int, datetime | None]]) -> None:
+        if not results:
+            return
+        now = to_iso(utcnow()) or ""
+        job_ids = sorted({job_id for job_id, _, _, _, _ in results})
+
+        async def operation(db: aiosqlite.Connection) -> None:
+            await db.executemany(
+                """
+                UPDATE dm_deliveries SET status = ?, attempts = ?, next_attempt_at = ?, updated_at = ?
+                WHERE job_id = ? AND user_id = ?
+                """,
+                [
+                    (status, attempts, to_iso(next_attempt_at), now, job_id, user_id)
+                    for job_id, user_id, status, attempts, next_attempt_at in results
+                ],
+            )
+            await db.executemany(
+                """
+                UPDATE dm_jobs SET status = 'completed', completed_at = ?
+                WHERE id = ? AND status = 'pending'
+                AND NOT EXISTS (SELECT 1 FROM dm_deliveries WHERE job_id = dm_jobs.id AND status = 'pending')
+                """,
+                [(now, job_id) for job_id in job_ids],
+            )
+
+        await self._run_write(operation)
+
+    async def list_dm_job_progress(self, limit: int = 20) -> list[dict[str, Any]]:
+        async with self._pool.reader() as db:
+            cursor = await db.execute(
+                """
+                SELECT
+                    j.id, j.job_key, j.kind, j.guild_id, j.status, j.created_at, j.completed_at,
+                    COUNT(d.user_id) AS total,
+                    SUM(CASE WHEN d.status = 'sent' THEN 1 ELSE 0 END) AS sent,
+                    SUM(CASE WHEN d.status = 'failed' THEN 1 ELSE 0 END) AS failed,
+                    SUM(CASE WHEN d.status = 'pending' THEN 1 ELSE 0 END) AS pending
+                FROM dm_jobs AS j
+                LEFT JOIN dm_deliveries AS d ON d.job_id = j.id
+                GROUP BY j.id
+                ORDER BY j.id DESC
+                LIMIT ?
+                """,
+                (limit,),
+            )
+            rows = await cursor.fetchall()
+        jobs: list[dict[str, Any]] = []
+        for row in rows:
+            item = _row_to_dict(row) or {}
+            for key in ("total", "sent", "failed", "pending"):
+                item[key] = int(item.get(key) or 0)
+            if item.get("guild_id") is not None:
+                item["guild_id"] = str(item["guild_id"])
+            jobs.append(item)
+        return jobs
+
+    async def purge_completed_dm_jobs(self, cutoff: datetime) -> int:
+        async def operation(db: aiosqlite.Connection) -> int:
+            cursor = await db.execute("SELECT id FROM dm_jobs WHERE status = 'completed' AND completed_at < ?", (to_iso(cutoff),))
+            job_ids = [(int(row[0]),) for row in await cursor.fetchall()]
+            if job_ids:
+                await db.executemany("DELETE FROM dm_deliveries WHERE job_id = ?", job_ids)
+                await db.executemany("DELETE FROM dm_jobs WHERE id = ?", job_ids)
+            return len(job_ids)
+
+        return await self._run_write(operation)
+
+
 class StatsRepository:
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
-        self._write_lock = asyncio.Lock()
+        self._pool = SQLiteConnectionPool(db_path)
+        self._write_queue = SQLiteGroupCommitQueue(self._pool)
+        self._leaderboard_anchor: date | None = None
 
     async def _run_write(self, operation: Any) -> Any:
-        async with self._write_lock:
-            last_error: Exception | None = None
-            for delay in SQLITE_RETRY_DELAYS:
-                if delay:
-                    await asyncio.sleep(delay)
-                try:
-                    async with _open_sqlite_connection(self.db_path) as db:
-                        result = await operation(db)
-                        await db.commit()
-                        return result
-                except Exception as exc:
-                    if not _is_database_locked_error(exc):
-                        raise
-                    last_error = exc
-            if last_error is not None:
-                raise last_error
-        return None
+        return await self._write_queue.submit(operation)
+
+    async def close(self) -> None:
+        await self._write_queue.close()
+        await self._pool.close()
 
     async def initialize(self) -> None:
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        async with _open_sqlite_connection(self.db_path) as db:
-            await db.executescript(
+        await self._pool.open()
+        db = await self._pool.writer()
+        await db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS vc_sessions (
+                session_id TEXT PRIMARY KEY,
+                guild_id INTEGER NOT NULL,
+                guild_name TEXT NOT NULL,
+                root_channel_id INTEGER NOT NULL,
+                root_channel_name TEXT NOT NULL,
+                started_by INTEGER NOT NULL,
+                started_by_name TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                ended_at TEXT NOT NULL,
+                total_talk_seconds INTEGER NOT NULL,
+                total_afk_seconds INTEGER NOT NULL,
+                payload_json TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS session_members (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                guild_id INTEGER NOT NULL,
+                guild_name TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                user_name TEXT NOT NULL,
+                joined_at TEXT NOT NULL,
+                left_at TEXT NOT NULL,
+                talk_seconds INTEGER NOT NULL,
+                afk_seconds INTEGER NOT NULL,
+                afk_channel_seconds INTEGER NOT NULL,
+                self_mute_seconds INTEGER NOT NULL,
+                self_deafen_seconds INTEGER NOT NULL,
+                is_owner INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS user_totals (
+                guild_id INTEGER NOT NULL,
+                guild_name TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                user_name TEXT NOT NULL,
+                talk_seconds INTEGER NOT NULL,
+                afk_seconds INTEGER NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY(guild_id, user_id)
+            );
+            CREATE TABLE IF NOT EXISTS daily_user_stats (
+                date TEXT NOT NULL,
+                guild_id INTEGER NOT NULL,
+                guild_name TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                user_name TEXT NOT NULL,
+                talk_seconds INTEGER NOT NULL,
+                afk_seconds INTEGER NOT NULL,
+                PRIMARY KEY(date, guild_id, user_id)
+            );
+            CREATE TABLE IF NOT EXISTS hourly_user_stats (
+                date TEXT NOT NULL,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                hour INTEGER NOT NULL,
+                talk_seconds INTEGER NOT NULL,
+                afk_seconds INTEGER NOT NULL,
+                PRIMARY KEY(date, guild_id, user_id, hour)
+            );
+            CREATE TABLE IF NOT EXISTS timeline_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TEXT NOT NULL,
+                session_id TEXT NOT NULL,
+                guild_id TEXT NOT NULL,
+                guild_name TEXT NOT NULL,
+                root_channel_id TEXT NOT NULL,
+                root_channel_name TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                event_label TEXT NOT NULL,
+                user_id TEXT,
+                user_name TEXT,
+                message TEXT NOT NULL,
+                payload_json TEXT NOT NULL DEFAULT '{}'
+            );
+            CREATE TABLE IF NOT EXISTS leaderboard_entries (
+                scope TEXT NOT NULL,
+                period_bucket TEXT NOT NULL,
+                guild_id INTEGER NOT NULL,
+                guild_name TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                user_name TEXT NOT NULL,
+                talk_seconds INTEGER NOT NULL,
+                afk_seconds INTEGER NOT NULL,
+                PRIMARY KEY(scope, period_bucket, guild_id, user_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_daily_user_stats_user ON daily_user_stats(user_id, date);
+            CREATE INDEX IF NOT EXISTS idx_hourly_user_stats_user ON hourly_user_stats(user_id, date, hour);
+            CREATE INDEX IF NOT EXISTS idx_session_members_user ON session_members(user_id, guild_id);
+            CREATE INDEX IF NOT EXISTS idx_timeline_events_session ON timeline_events(session_id, created_at, id);
+            CREATE INDEX IF NOT EXISTS idx_timeline_events_voice ON timeline_events(guild_id, root_channel_id, created_at);
+            CREATE INDEX IF NOT EXISTS idx_timeline_events_type ON timeline_events(event_type, created_at);
+            CREATE INDEX IF NOT EXISTS idx_timeline_events_created_at ON timeline_events(created_at);
+            CREATE INDEX IF NOT EXISTS idx_leaderboard_entries_rank
+                ON leaderboard_entries(scope, period_bucket, talk_seconds DESC, afk_seconds ASC, guild_id, user_id);
+            CREATE INDEX IF NOT EXISTS idx_leaderboard_entries_guild_rank
+                ON leaderboard_entries(scope, period_bucket, guild_id, talk_seconds DESC, afk_seconds ASC, user_id);
+            CREATE TABLE IF NOT EXISTS leaderboard_windows (
+                scope TEXT PRIMARY KEY,
+                anchor_date TEXT NOT NULL
+            );
+            """
+        )
+        await db.commit()
+        self._write_queue.start()
+        if await self._leaderboard_needs_rebuild():
+            await self.rebuild_leaderboards()
+
+    async def _leaderboard_needs_rebuild(self) -> bool:
+        async with self._pool.reader() as db:
+            cursor = await db.execute("SELECT EXISTS(SELECT 1 FROM leaderboard_entries)")
+            has_entries = (await cursor.fetchone())[0]
+            cursor = await db.execute("SELECT EXISTS(SELECT 1 FROM user_totals)")
+            has_totals = (await cursor.fetchone())[0]
+            cursor = await db.execute("SELECT COUNT(*) FROM leaderboard_windows")
+            windows = (await cursor.fetchone())[0]
+        return (not has_entries and bool(has_totals)) or int(windows) != len(LEADERBOARD_PERIODS)
+
+    async def rebuild_leaderboards(self) -> int:
+        today = utcnow().date()
+
+        async def operation(db: aiosqlite.Connection) -> int:
+            totals: dict[tuple[int, int], tuple[str, int, int]] = {}
+            guild_names: dict[int, str] = {}
+            cursor = await db.execute(
+                "SELECT guild_id, guild_name, user_id, user_name, talk_seconds, afk_seconds FROM user_totals"
+            )
+            for row in await cursor.fetchall():
+                guild_names[int(row[0])] = str(row[1])
+                totals[(int(row[0]), int(row[2]))] = (str(row[3]), int(row[4]), int(row[5]))
+
+            daily: dict[tuple[str, int, int], tuple[str, int, int]] = {}
+            cursor = await db.execute(
                 """
-                CREATE TABLE IF NOT EXISTS vc_sessions (
-                    session_id TEXT PRIMARY KEY,
-                    guild_id INTEGER NOT NULL,
-                    guild_name TEXT NOT NULL,
-                    root_channel_id INTEGER NOT NULL,
-                    root_channel_name TEXT NOT NULL,
-                    started_by INTEGER NOT NULL,
-                    started_by_name TEXT NOT NULL,
-                    started_at TEXT NOT NULL,
-                    ended_at TEXT NOT NULL,
-                    total_talk_seconds INTEGER NOT NULL,
-                    total_afk_seconds INTEGER NOT NULL,
-                    payload_json TEXT NOT NULL
-                );
-                CREATE TABLE IF NOT EXISTS session_members (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id TEXT NOT NULL,
-                    guild_id INTEGER NOT NULL,
-                    guild_name TEXT NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    user_name TEXT NOT NULL,
-                    joined_at TEXT NOT NULL,
-                    left_at TEXT NOT NULL,
-                    talk_seconds INTEGER NOT NULL,
-                    afk_seconds INTEGER NOT NULL,
-                    afk_channel_seconds INTEGER NOT NULL,
-                    self_mute_seconds INTEGER NOT NULL,
-                    self_deafen_seconds INTEGER NOT NULL,
-                    is_owner INTEGER NOT NULL
-                );
-                CREATE TABLE IF NOT EXISTS user_totals (
-                    guild_id INTEGER NOT NULL,
-                    guild_name TEXT NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    user_name TEXT NOT NULL,
-                    talk_seconds INTEGER NOT NULL,
-                    afk_seconds INTEGER NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    PRIMARY KEY(guild_id, user_id)
-                );
-                CREATE TABLE IF NOT EXISTS daily_user_stats (
-                    date TEXT NOT NULL,
-                    guild_id INTEGER NOT NULL,
-                    guild_name TEXT NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    user_name TEXT NOT NULL,
-                    talk_seconds INTEGER NOT NULL,
-                    afk_seconds INTEGER NOT NULL,
-                    PRIMARY KEY(date, guild_id, user_id)
-                );
-                CREATE TABLE IF NOT EXISTS hourly_user_stats (
-                    date TEXT NOT NULL,
-                    guild_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    hour INTEGER NOT NULL,
-                    talk_seconds INTEGER NOT NULL,
-                    afk_seconds INTEGER NOT NULL,
-                    PRIMARY KEY(date, guild_id, user_id, hour)
-                );
-                CREATE TABLE IF NOT EXISTS timeline_events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    created_at TEXT NOT NULL,
-                    session_id TEXT NOT NULL,
-                    guild_id TEXT NOT NULL,
-                    guild_name TEXT NOT NULL,
-                    root_channel_id TEXT NOT NULL,
-                    root_channel_name TEXT NOT NULL,
-                    event_type TEXT NOT NULL,
-                    event_label TEXT NOT NULL,
-                    user_id TEXT,
-                    user_name TEXT,
-                    message TEXT NOT NULL,
-                    payload_json TEXT NOT NULL DEFAULT '{}'
-                );
-                CREATE INDEX IF NOT EXISTS idx_daily_user_stats_user ON daily_user_stats(user_id, date);
-                CREATE INDEX IF NOT EXISTS idx_hourly_user_stats_user ON hourly_user_stats(user_id, date, hour);
-                CREATE INDEX IF NOT EXISTS idx_session_members_user ON session_members(user_id, guild_id);
-                CREATE INDEX IF NOT EXISTS idx_timeline_events_session ON timeline_events(session_id, created_at, id);
-                CREATE INDEX IF NOT EXISTS idx_timeline_events_voice ON timeline_events(guild_id, root_channel_id, created_at);
-                CREATE INDEX IF NOT EXISTS idx_timeline_events_type ON timeline_events(event_type, created_at);
+                SELECT date, guild_id, guild_name, user_id, user_name, talk_seconds, afk_seconds
+                FROM daily_user_stats
+                WHERE date >= ? AND date <= ?
+                ORDER BY date ASC
+                """,
+                ((period_cutoff("year", today) or today).isoformat(), today.isoformat()),
+            )
+            for row in await cursor.fetchall():
+                guild_names.setdefault(int(row[1]), str(row[2]))
+                daily[(str(row[0]), int(row[1]), int(row[3]))] = (str(row[4]), int(row[5]), int(row[6]))
+
+            entries = _aggregate_leaderboard_entries(totals, daily, today)
+            await db.execute("DELETE FROM leaderboard_entries")
+            await db.execute("DELETE FROM leaderboard_windows")
+            await db.executemany(
+                "INSERT INTO leaderboard_windows(scope, anchor_date) VALUES (?, ?)",
+                [(period, today.isoformat()) for period in LEADERBOARD_PERIODS],
+            )
+            await db.executemany(
                 """
+                INSERT INTO leaderboard_entries(
+                    scope, period_bucket, guild_id, guild_name, user_id, user_name, talk_seconds, afk_seconds
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (scope, bucket, guild_id, guild_names.get(guild_id, ""), user_id, user_name, talk_seconds, afk_seconds)
+                    for (scope, bucket, guild_id, user_id), (user_name, talk_seconds, afk_seconds) in entries.items()
+                ],
             )
-            await db.commit()
+            return len(entries)
+
+        count = int(await self._run_write(operation))
+        self._leaderboard_anchor = today
+        return count
+
+    async def _ensure_leaderboard_windows(self) -> None:
+        today = utcnow().date()
+        if self._leaderboard_anchor == today:
+            return
+
+        async def operation(db: aiosqlite.Connection) -> None:
+            await _advance_leaderboard_windows(db, today)
+
+        await self._run_write(operation)
+        self._leaderboard_anchor = today
 
     async def record_completed_session(self, session: CompletedSession) -> None:
+        today = utcnow().date()
+
         async def operation(db: aiosqlite.Connection) -> None:
             await db.execute(
                 """
@@ -986,15 +1707,15 @@ class StatsRepository:
                 ),
             )
 
-            for member in session.members:
-                await db.execute(
-                    """
-                    INSERT INTO session_members(
-                        session_id, guild_id, guild_name, user_id, user_name,
-                        joined_at, left_at, talk_seconds, afk_seconds, afk_channel_seconds,
-                        self_mute_seconds, self_deafen_seconds, is_owner
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+            await db.executemany(
+                """
+                INSERT INTO session_members(
+                    session_id, guild_id, guild_name, user_id, user_name,
+                    joined_at, left_at, talk_seconds, afk_seconds, afk_channel_seconds,
+                    self_mute_seconds, self_deafen_seconds, is_owner
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         session.session_id,
                         session.guild_id,
@@ -1009,49 +1730,30 @@ class StatsRepository:
                         member.self_mute_seconds,
                         member.self_deafen_seconds,
                         int(member.is_owner),
-                    ),
-                )
-
-                await db.execute(
-                    """
-                    INSERT INTO user_totals(guild_id, guild_name, user_id, user_name, talk_seconds, afk_seconds, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(guild_id, user_id) DO UPDATE SET
-                        guild_name = excluded.guild_name,
-                        user_name = excluded.user_name,
-                        talk_seconds = user_totals.talk_seconds + excluded.talk_seconds,
-                        afk_seconds = user_totals.afk_seconds + excluded.afk_seconds,
-                        updated_at = excluded.updated_at
-                    """,
-                    (
-                        session.guild_id,
-                        session.guild_name,
-                        member.user_id,
-                        member.user_name,
-                        member.talk_seconds,
-                        member.afk_seconds,
-                        to_iso(utcnow()),
-                    ),
-                )
-
-                await self._upsert_rollups(db, session.guild_id, session.guild_name, member)
-        await self._run_write(operation)
-
-    async def _upsert_rollups(
-        self,
-        db: aiosqlite.Connection,
-        guild_id: int,
-        guild_name: str,
-        member: CompletedMember,
-    ) -> None:
-        total_seconds = max(1, int((member.left_at - member.joined_at).total_seconds()))
-        talk_ratio = member.talk_seconds / total_seconds
-        afk_ratio = member.afk_seconds / total_seconds
+                    )
+                    for member in session.members
+                ],
+            )
 
-        for target_date, seconds in _split_by_day(member.joined_at, member.left_at):
-            talk_seconds = int(seconds * talk_ratio)
-            afk_seconds = int(seconds * afk_ratio)
-            await db.execute(
+            totals, daily, hourly = _aggregate_session_rollups(session)
+            updated_at = to_iso(utcnow())
+            await db.executemany(
+                """
+                INSERT INTO user_totals(guild_id, guild_name, user_id, user_name, talk_seconds, afk_seconds, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(guild_id, user_id) DO UPDATE SET
+                    guild_name = excluded.guild_name,
+                    user_name = excluded.user_name,
+                    talk_seconds = user_totals.talk_seconds + excluded.talk_seconds,
+                    afk_seconds = user_totals.afk_seconds + excluded.afk_seconds,
+                    updated_at = excluded.updated_at
+                """,
+                [
+                    (guild_id, session.guild_name, user_id, user_name, talk_seconds, afk_seconds, updated_at)
+                    for (guild_id, user_id), (user_name, talk_seconds, afk_seconds) in totals.items()
+                ],
+            )
+            await db.executemany(
                 """
                 INSERT INTO daily_user_stats(date, guild_id, guild_name, user_id, user_name, talk_seconds, afk_seconds)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
@@ -1061,21 +1763,12 @@ class StatsRepository:
                     talk_seconds = daily_user_stats.talk_seconds + excluded.talk_seconds,
                     afk_seconds = daily_user_stats.afk_seconds + excluded.afk_seconds
                 """,
-                (
-                    target_date.isoformat(),
-                    guild_id,
-                    guild_name,
-                    member.user_id,
-                    member.user_name,
-                    talk_seconds,
-                    afk_seconds,
-                ),
+                [
+                    (target_date, guild_id, session.guild_name, user_id, user_name, talk_seconds, afk_seconds)
+                    for (target_date, guild_id, user_id), (user_name, talk_seconds, afk_seconds) in daily.items()
+                ],
             )
-
-        for target_date, hour, seconds in _split_by_hour(member.joined_at, member.left_at):
-            talk_seconds = int(seconds * talk_ratio)
-            afk_seconds = int(seconds * afk_ratio)
-            await db.execute(
+            await db.executemany(
                 """
                 INSERT INTO hourly_user_stats(date, guild_id, user_id, hour, talk_seconds, afk_seconds)
                 VALUES (?, ?, ?, ?, ?, ?)
@@ -1083,12 +1776,26 @@ class StatsRepository:
                     talk_seconds = hourly_user_stats.talk_seconds + excluded.talk_seconds,
                     afk_seconds = hourly_user_stats.afk_seconds + excluded.afk_seconds
                 """,
-                (target_date.isoformat(), guild_id, member.user_id, hour, talk_seconds, afk_seconds),
+                [
+                    (target_date, guild_id, user_id, hour, talk_seconds, afk_seconds)
+                    for (target_date, guild_id, user_id, hour), (talk_seconds, afk_seconds) in hourly.items()
+                ],
+            )
+            await _advance_leaderboard_windows(db, today)
+            await _upsert_leaderboard_entries(
+                db,
+                [
+                    (scope, bucket, guild_id, session.guild_name, user_id, user_name, talk_seconds, afk_seconds)
+                    for (scope, bucket, guild_id, user_id), (user_name, talk_seconds, afk_seconds) in _aggregate_leaderboard_entries(
+                        totals, daily, today
+                    ).items()
+                ],
             )
+        await self._run_write(operation)
+        self._leaderboard_anchor = today
 
     async def get_recent_sessions(self, limit: int = 20) -> list[dict[str, Any]]:
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             cursor = await db.execute(
                 """
                 SELECT * FROM vc_sessions
@@ -1101,8 +1808,7 @@ class StatsRepository:
         return [_row_to_dict(row) or {} for row in rows]
 
     async def get_completed_session(self, session_id: str) -> dict[str, Any] | None:
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             cursor = await db.execute("SELECT * FROM vc_sessions WHERE session_id = ?", (session_id,))
             row = await cursor.fetchone()
         return _row_to_dict(row)
@@ -1121,7 +1827,6 @@ class StatsRepository:
         user_id: str | None = None,
         user_name: str | None = None,
         payload: dict[str, Any] | None = None,
-        retention_days: int | None = None,
     ) -> dict[str, Any]:
         created_at = to_iso(utcnow()) or ""
 
@@ -1149,9 +1854,6 @@ class StatsRepository:
                     json_dumps(payload or {}),
                 ),
             )
-            if retention_days and retention_days > 0:
-                cutoff = to_iso(utcnow() - timedelta(days=retention_days))
-                await db.execute("DELETE FROM timeline_events WHERE created_at < ?", (cutoff,))
             return int(cursor.lastrowid)
 
         event_id = await self._run_write(operation)
@@ -1171,6 +1873,26 @@ class StatsRepository:
             "payload": payload or {},
         }
 
+    async def purge_expired_timeline_events(self, cutoff: datetime, limit: int = TIMELINE_PURGE_BATCH_SIZE) -> int:
+        cutoff_text = to_iso(cutoff)
+
+        async def operation(db: aiosqlite.Connection) -> int:
+            cursor = await db.execute(
+                """
+                DELETE FROM timeline_events
+                WHERE id IN (
+                    SELECT id FROM timeline_events
+                    WHERE created_at < ?
+                    ORDER BY created_at ASC
+                    LIMIT ?
+                )
+                """,
+                (cutoff_text, max(1, limit)),
+            )
+            return max(0, int(cursor.rowcount))
+
+        return int(await self._run_write(operation))
+
     async def list_timeline_events(
         self,
         *,
@@ -1211,8 +1933,7 @@ class StatsRepository:
             query += " WHERE " + " AND ".join(clauses)
         query += " ORDER BY created_at ASC, id ASC LIMIT ?"
         params.append(max(1, min(500, int(limit))))
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             cursor = await db.execute(query, tuple(params))
             rows = await cursor.fetchall()
         result: list[dict[str, Any]] = []
@@ -1232,46 +1953,25 @@ class StatsRepository:
         guild_id: int | None = None,
         limit: int = 100,
     ) -> list[dict[str, Any]]:
-        cutoff = period_cutoff(period)
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            if cutoff is None:
-                params: list[Any] = []
-                query = """
-                    SELECT guild_id, guild_name, user_id, user_name,
-                           SUM(talk_seconds) AS talk_seconds,
-                           SUM(afk_seconds) AS afk_seconds
-                    FROM user_totals
-                """
-                if guild_id is not None:
-                    query += " WHERE guild_id = ?"
-                    params.append(guild_id)
-                query += """
-                    GROUP BY guild_id, guild_name, user_id, user_name
-                    ORDER BY talk_seconds DESC, afk_seconds ASC
-                    LIMIT ?
-                """
-                params.append(limit)
-                cursor = await db.execute(query, tuple(params))
-            else:
-                params = [cutoff.isoformat()]
-                query = """
-                    SELECT guild_id, guild_name, user_id, user_name,
-                           SUM(talk_seconds) AS talk_seconds,
-                           SUM(afk_seconds) AS afk_seconds
-                    FROM daily_user_stats
-                    WHERE date >= ?
-                """
-                if guild_id is not None:
-                    query += " AND guild_id = ?"
-                    params.append(guild_id)
-                query += """
-                    GROUP BY guild_id, guild_name, user_id, user_name
-                    ORDER BY talk_seconds DESC, afk_seconds ASC
-                    LIMIT ?
-                """
-                params.append(limit)
-                cursor = await db.execute(query, tuple(params))
+        scope = period if period in LEADERBOARD_PERIODS else "all"
+        if scope != "all":
+            await self._ensure_leaderboard_windows()
+        params: list[Any] = [scope, LEADERBOARD_ROLLING_BUCKET if scope != "all" else "all"]
+        query = """
+            SELECT guild_id, guild_name, user_id, user_name, talk_seconds, afk_seconds
+            FROM leaderboard_entries
+            WHERE scope = ? AND period_bucket = ?
+        """
+        if guild_id is not None:
+            query += " AND guild_id = ?"
+            params.append(guild_id)
+        query += """
+            ORDER BY talk_seconds DESC, afk_seconds ASC, guild_id ASC, user_id ASC
+            LIMIT ?
+        """
+        params.append(limit)
+        async with self._pool.reader() as db:
+            cursor = await db.execute(query, tuple(params))
             rows = await cursor.fetchall()
         result: list[dict[str, Any]] = []
         for index, row in enumerate(rows, start=1):
@@ -1285,8 +1985,7 @@ class StatsRepository:
         today = utcnow().date().isoformat()
         cutoff = period_cutoff(period) or utcnow().date()
         cutoff_text = cutoff.isoformat()
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             top_talkers_cursor = await db.execute(
                 """
                 SELECT guild_id, guild_name, user_id, user_name,
@@ -1368,8 +2067,7 @@ class StatsRepository:
 
     async def get_user_period_summary(self, user_id: int, period: str = "all") -> dict[str, Any]:
         cutoff = period_cutoff(period)
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             if cutoff is None:
                 cursor = await db.execute(
                     """
@@ -1399,8 +2097,7 @@ class StatsRepository:
 
     async def get_user_guild_breakdown(self, user_id: int, period: str = "all") -> list[dict[str, Any]]:
         cutoff = period_cutoff(period)
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             if cutoff is None:
                 cursor = await db.execute(
                     """
@@ -1447,8 +2144,7 @@ class StatsRepository:
             query += " AND guild_id = ?"
             params.append(guild_id)
         query += " GROUP BY date ORDER BY date ASC"
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             cursor = await db.execute(query, tuple(params))
             rows = await cursor.fetchall()
         return [_row_to_dict(row) or {} for row in rows]
@@ -1465,15 +2161,13 @@ class StatsRepository:
             query += " AND guild_id = ?"
             params.append(guild_id)
         query += " GROUP BY hour ORDER BY hour ASC"
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             cursor = await db.execute(query, tuple(params))
             rows = await cursor.fetchall()
         return [_row_to_dict(row) or {} for row in rows]
 
     async def get_known_guilds_for_user(self, user_id: int) -> list[dict[str, Any]]:
-        async with _open_sqlite_connection(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             cursor = await db.execute(
                 """
                 SELECT guild_id, guild_name,
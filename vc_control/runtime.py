@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import json
 import logging
 import os
 import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any
@@ -14,9 +18,10 @@ from fastapi import WebSocket
 
 from vc_control.embeds import BRAND_BLUE, COLOR_ERROR, COLOR_NOTIFY, COLOR_SUCCESS, COLOR_WARNING, build_embed
 from vc_control.i18n import t
+from vc_control.journal import JOURNAL_JOIN, JOURNAL_LEAVE, JOURNAL_MOVE, JOURNAL_VOICE, JournalEntry, ParticipantJournal
 from vc_control.models import DEFAULT_TEAM_NAMES, CompletedMember, CompletedSession, GuildConfig, ScheduledVC, SessionSnapshot, SnapshotMember
-from vc_control.repositories import ConfigRepository, StatsRepository
-from vc_control.utils import format_duration, make_session_key, normalize_ids, utcnow
+from vc_control.repositories import TIMELINE_PURGE_BATCH_SIZE, ConfigRepository, LiveStateRepository, StatsRepository
+from vc_control.utils import format_duration, make_session_key, normalize_ids, to_iso, utcnow
 
 
 TIMELINE_EVENT_LABEL_KEYS = {
@@ -44,6 +49,36 @@ ACCESS_MODE_LABEL_KEYS = {
 }
 
 LOCAL_TZ = ZoneInfo("Asia/Tokyo")
+TIMELINE_RETENTION_INTERVAL_SEC = 600
+SNAPSHOT_FLUSH_INTERVAL_SEC = 2.0
+JOURNAL_CHECKPOINT_INTERVAL_SEC = 60
+WS_SEND_QUEUE_SIZE = 256
+WS_MAX_OVERFLOWS = 3
+VOICE_EVENT_WORKERS_PER_GUILD = 1
+VOICE_EVENT_DRAIN_TIMEOUT_SEC = 10.0
+OUTBOX_PRIORITY_HIGH = 0
+OUTBOX_PRIORITY_NORMAL = 1
+OUTBOX_PRIORITY_LOW = 2
+OUTBOX_SENDERS = 4
+OUTBOX_MAX_ATTEMPTS = 4
+OUTBOX_RETRY_BASE_SEC = 1.0
+OUTBOX_DRAIN_TIMEOUT_SEC = 10.0
+MEMBER_MOVE_CONCURRENCY = 5
+MEMBER_MOVE_MAX_ATTEMPTS = 3
+DM_SENDER_CONCURRENCY = 4
+DM_GLOBAL_RATE_PER_SEC = 5.0
+DM_OPEN_RATE_PER_SEC = 1.0
+DM_BATCH_SIZE = 100
+DM_MAX_ATTEMPTS = 5
+DM_RETRY_BASE_SEC = 30.0
+DM_RETRY_MAX_SEC = 600.0
+DM_JOB_RETENTION_DAYS = 7
+PRESENCE_MIN_INTERVAL_SEC = 15.0
+SYSTEM_MOVE_MARKER_TTL_SEC = 15
+SCHEDULED_VC_PRE_NOTICE_MINUTES = (15, 5, 3)
+SCHEDULED_VC_RETRY_SEC = 30
+SCHEDULED_VC_LOAD_RETRY_BASE_SEC = 5.0
+SCHEDULED_VC_LOAD_RETRY_MAX_SEC = 300.0
 RANKING_TARGET_LABEL_KEYS = {
     "top_talkers": "ranking.target.top_talkers",
     "top_hosts": "ranking.target.top_hosts",
@@ -62,6 +97,10 @@ def _access_mode_label(mode: str, locale: str | None) -> str:
     return t(key, locale) if key else mode
 
 
+def _encode_json(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
 @dataclass(slots=True)
 class LiveParticipant:
     user_id: int
@@ -97,6 +136,14 @@ class LiveParticipant:
             self.afk_channel_seconds += elapsed
         self.last_transition_at = now
 
+    def checkpoint(self, now: datetime) -> bool:
+        elapsed = max(0, int((now - self.last_transition_at).total_seconds()))
+        if elapsed <= 0:
+            return False
+        accruing = self.current_channel_id is not None or self.self_muted or self.self_deafened or self.in_afk_channel
+        self.accrue(self.last_transition_at + timedelta(seconds=elapsed))
+        return accruing
+
     def apply_voice_state(self, state: discord.VoiceState | None) -> None:
         self.self_muted = bool(state and state.self_mute)
         self.self_deafened = bool(state and state.self_deaf)
@@ -163,6 +210,43 @@ class LiveSession:
     member_order: list[int] = field(default_factory=list)
     participants: dict[int, LiveParticipant] = field(default_factory=dict)
     lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+    version: int = 0
+    payload_cache_version: int = field(default=-1, repr=False)
+    payload_cache: dict[str, Any] | None = field(default=None, repr=False)
+    payload_json_cache: str | None = field(default=None, repr=False)
+    summary_cache_version: int = field(default=-1, repr=False)
+    summary_cache: dict[str, Any] | None = field(default=None, repr=False)
+
+    def touch(self) -> int:
+        self.version += 1
+        return self.version
+
+    def cached_payload(self) -> dict[str, Any]:
+        if self.payload_cache is None or self.payload_cache_version != self.version:
+            self.payload_cache = self.to_payload()
+            self.payload_json_cache = None
+            self.payload_cache_version = self.version
+        return self.payload_cache
+
+    def cached_payload_json(self) -> str:
+        payload = self.cached_payload()
+        if self.payload_json_cache is None:
+            self.payload_json_cache = _encode_json(payload)
+        return self.payload_json_cache
+
+    def cached_summary(self) -> dict[str, Any]:
+        if self.summary_cache is None or self.summary_cache_version != self.version:
+            self.summary_cache = {
+                "session_id": self.session_id,
+                "guild_id": str(self.guild_id),
+                "guild_name": self.guild_name,
+                "root_channel_id": str(self.root_channel_id),
+                "root_channel_name": self.root_channel_name,
+                "started_at": self.started_at.isoformat(),
+                "active_participant_count": len(self.active_participants()),
+            }
+            self.summary_cache_version = self.version
+        return self.summary_cache
 
     def active_participants(self) -> list[LiveParticipant]:
         return [participant for participant in self.participants.values() if participant.current_channel_id is not None]
@@ -219,25 +303,53 @@ class LiveSession:
             "invited_user_ids": sorted(self.invited_user_ids),
             "access_role_ids": sorted(self.access_role_ids),
             "session_key": {"guild_id": str(self.guild_id), "vc_id": str(self.root_channel_id)},
+            "version": self.version,
             "notice_channel_id": str(self.notice_channel_id) if self.notice_channel_id is not None else None,
             "notice_message_id": str(self.notice_message_id) if self.notice_message_id is not None else None,
             "active_participant_count": len(self.active_participants()),
-            "elapsed_seconds": max(0, int((utcnow() - self.started_at).total_seconds())),
             "participants": [participant.to_payload() for participant in self.participants.values()],
         }
 
 
 @dataclass(slots=True)
-class DeletionHandle:
-    task: asyncio.Task[None]
+class CleanupDeadline:
+    kind: str
+    channel_id: int
+    guild_id: int
+    started_at: datetime
+    stage: str = "notice"
+    due_at: datetime | None = None
+    generation: int = 0
+    session_key: tuple[int, int] | None = None
     notice_sent: bool = False
+    warning_sent: bool = False
+    task: asyncio.Task[None] | None = None
 
 
 @dataclass(slots=True)
-class SoloCleanupHandle:
-    task: asyncio.Task[None]
-    notice_sent: bool = False
-    warning_sent: bool = False
+class TimelineRetentionStatus:
+    retention_days: int = 0
+    running: bool = False
+    last_started_at: datetime | None = None
+    last_finished_at: datetime | None = None
+    last_cutoff: datetime | None = None
+    last_removed: int = 0
+    last_batches: int = 0
+    total_removed: int = 0
+    last_error: str | None = None
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "retention_days": self.retention_days,
+            "running": self.running,
+            "last_started_at": self.last_started_at.isoformat() if self.last_started_at else None,
+            "last_finished_at": self.last_finished_at.isoformat() if self.last_finished_at else None,
+            "last_cutoff": self.last_cutoff.isoformat() if self.last_cutoff else None,
+            "last_removed": self.last_removed,
+            "last_batches": self.last_batches,
+            "total_removed": self.total_removed,
+            "last_error": self.last_error,
+        }
 
 
 @dataclass(slots=True)
@@ -249,41 +361,922 @@ class SystemMoveMarker:
     created_at: datetime
 
 
+class SystemMoveMarkerStore:
+    def __init__(self, ttl_sec: float = SYSTEM_MOVE_MARKER_TTL_SEC) -> None:
+        self.ttl = timedelta(seconds=ttl_sec)
+        self.markers: dict[tuple[int, int | None, int | None], tuple[int, SystemMoveMarker]] = {}
+        self.expiry: list[tuple[datetime, int, tuple[int, int | None, int | None]]] = []
+        self.sequence = 0
+        self.marked = 0
+        self.refreshed = 0
+        self.consumed = 0
+        self.missed = 0
+        self.expired_by_reason: dict[str, int] = {}
+
+    def mark(self, marker: SystemMoveMarker) -> None:
+        self._expire(marker.created_at)
+        key = (marker.user_id, marker.source_channel_id, marker.target_channel_id)
+        if key in self.markers:
+            self.refreshed += 1
+        self.sequence += 1
+        self.markers[key] = (self.sequence, marker)
+        heapq.heappush(self.expiry, (marker.created_at + self.ttl, self.sequence, key))
+        self.marked += 1
+
+    def consume(self, user_id: int, source_channel_id: int | None, target_channel_id: int | None) -> bool:
+        self._expire(utcnow())
+        if not self.markers:
+            return False
+        if self.markers.pop((user_id, source_channel_id, target_channel_id), None) is None:
+            self.missed += 1
+            return False
+        self.consumed += 1
+        return True
+
+    def _expire(self, now: datetime) -> None:
+        while self.expiry and self.expiry[0][0] < now:
+            _, sequence, key = heapq.heappop(self.expiry)
+            current = self.markers.get(key)
+            if current is None or current[0] != sequence:
+                continue
+            del self.markers[key]
+            reason = current[1].reason
+            self.expired_by_reason[reason] = self.expired_by_reason.get(reason, 0) + 1
+
+    def stats(self) -> dict[str, Any]:
+        self._expire(utcnow())
+        return {
+            "ttl_sec": self.ttl.total_seconds(),
+            "pending": len(self.markers),
+            "heap_size": len(self.expiry),
+            "marked": self.marked,
+            "refreshed": self.refreshed,
+            "consumed": self.consumed,
+            "missed": self.missed,
+            "expired_unused": sum(self.expired_by_reason.values()),
+            "expired_by_reason": dict(self.expired_by_reason),
+        }
+
+
+def _encode_realtime_frame(event: str, payload: dict[str, Any]) -> str:
+    return _realtime_frame(event, _encode_json(payload))
+
+
+def _realtime_frame(event: str, payload_json: str) -> str:
+    return f'{{"event":{_encode_json(event)},"payload":{payload_json}}}'
+
+
+def _splice_json_field(encoded_object: str, key: str, encoded_value: str) -> str:
+    if encoded_object == "{}":
+        return f"{{{_encode_json(key)}:{encoded_value}}}"
+    return f"{encoded_object[:-1]},{_encode_json(key)}:{encoded_value}}}"
+
+
+@dataclass(slots=True)
+class RealtimeConnection:
+    websocket: WebSocket
+    scopes: set[str]
+    queue: asyncio.Queue[str]
+    writer_task: asyncio.Task[None] | None = None
+    sent_frames: int = 0
+    dropped_frames: int = 0
+    overflows: int = 0
+
+
 class RealtimeEventBroker:
-    def __init__(self) -> None:
+    def __init__(self, *, queue_size: int = WS_SEND_QUEUE_SIZE, max_overflows: int = WS_MAX_OVERFLOWS) -> None:
         self.connections: dict[str, set[WebSocket]] = {}
-        self.lock = asyncio.Lock()
+        self.clients: dict[WebSocket, RealtimeConnection] = {}
+        self.close_tasks: set[asyncio.Task[None]] = set()
+        self.queue_size = max(1, queue_size)
+        self.max_overflows = max(1, max_overflows)
+        self.dropped_frames = 0
+        self.evicted_connections = 0
+        self.published_frames = 0
+        self.deduplicated_frames = 0
 
     async def connect(self, websocket: WebSocket, scopes: list[str]) -> None:
         await websocket.accept()
-        async with self.lock:
-            for scope in scopes:
-                self.connections.setdefault(scope, set()).add(websocket)
+        client = RealtimeConnection(websocket=websocket, scopes=set(scopes), queue=asyncio.Queue(maxsize=self.queue_size))
+        self.clients[websocket] = client
+        for scope in client.scopes:
+            self.connections.setdefault(scope, set()).add(websocket)
+        client.writer_task = asyncio.create_task(self._writer(client))
 
     async def disconnect(self, websocket: WebSocket) -> None:
-        async with self.lock:
-            empty_scopes: list[str] = []
-            for scope, members in self.connections.items():
-                members.discard(websocket)
-                if not members:
-                    empty_scopes.append(scope)
-            for scope in empty_scopes:
+        client = self._detach(websocket)
+        if client is not None and client.writer_task is not None and client.writer_task is not asyncio.current_task():
+            client.writer_task.cancel()
+
+    def _detach(self, websocket: WebSocket) -> RealtimeConnection | None:
+        client = self.clients.pop(websocket, None)
+        if client is None:
+            return None
+        for scope in client.scopes:
+            members = self.connections.get(scope)
+            if members is None:
+                continue
+            members.discard(websocket)
+            if not members:
                 self.connections.pop(scope, None)
+        return client
+
+    async def _writer(self, client: RealtimeConnection) -> None:
+        try:
+            while True:
+                frame = await client.queue.get()
+                await client.websocket.send_text(frame)
+                client.sent_frames += 1
+                if client.queue.empty():
+                    client.overflows = 0
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._detach(client.websocket)
+
+    def send_text(self, websocket: WebSocket, text: str) -> None:
+        client = self.clients.get(websocket)
+        if client is not None:
+            self._enqueue(client, text)
+
+    def _enqueue(self, client: RealtimeConnection, frame: str) -> None:
+        try:
+            client.queue.put_nowait(frame)
+            return
+        except asyncio.QueueFull:
+            pass
+        dropped = client.queue.qsize()
+        while not client.queue.empty():
+            client.queue.get_nowait()
+        client.dropped_frames += dropped + 1
+        self.dropped_frames += dropped + 1
+        client.overflows += 1
+        if client.overflows >= self.max_overflows:
+            self._evict(client)
+            return
+        client.queue.put_nowait(_encode_realtime_frame("resync", {"reason": "backpressure", "dropped": dropped + 1}))
+
+    def _evict(self, client: RealtimeConnection) -> None:
+        self._detach(client.websocket)
+        self.evicted_connections += 1
+        if client.writer_task is not None:
+            client.writer_task.cancel()
+        task = asyncio.create_task(self._close_evicted(client.websocket))
+        self.close_tasks.add(task)
+        task.add_done_callback(self.close_tasks.discard)
+
+    async def _close_evicted(self, websocket: WebSocket) -> None:
+        try:
+            await websocket.close(code=4008)
+        except Exception:
+            pass
 
     async def broadcast(self, scope: str, event: str, payload: dict[str, Any]) -> None:
-        async with self.lock:
-            targets = list(self.connections.get(scope, set()))
-        stale: list[WebSocket] = []
-        for websocket in targets:
+        if scope in self.connections:
+            await self.broadcast_frame(scope, _encode_realtime_frame(event, payload))
+
+    async def broadcast_encoded(self, scope: str, event: str, payload_json: str) -> None:
+        if scope in self.connections:
+            await self.broadcast_frame(scope, _realtime_frame(event, payload_json))
+
+    async def broadcast_frame(self, scope: str, frame: str) -> None:
+        targets = self.connections.get(scope)
+        if not targets:
+            return
+        for websocket in list(targets):
+            client = self.clients.get(websocket)
+            if client is not None:
+                self._enqueue(client, frame)
+
+    def _resolve_subscribers(self, scopes: list[str]) -> dict[WebSocket, int]:
+        matched: dict[WebSocket, int] = {}
+        for scope in dict.fromkeys(scopes):
+            for websocket in self.connections.get(scope, ()):
+                matched[websocket] = matched.get(websocket, 0) + 1
+        return matched
+
+    async def publish(self, scopes: list[str], event: str, payload: dict[str, Any]) -> set[WebSocket]:
+        if not any(scope in self.connections for scope in scopes):
+            return set()
+        return await self.publish_encoded(scopes, event, _encode_json(payload))
+
+    async def publish_encoded(
+        self,
+        scopes: list[str],
+        event: str,
+        payload_json: str,
+        *,
+        exclude: set[WebSocket] | None = None,
+    ) -> set[WebSocket]:
+        matched = self._resolve_subscribers(scopes)
+        if not matched:
+            return set()
+        frame = _realtime_frame(event, payload_json)
+        for websocket, scope_count in matched.items():
+            if exclude is not None and websocket in exclude:
+                continue
+            client = self.clients.get(websocket)
+            if client is None:
+                continue
+            self._enqueue(client, frame)
+            self.published_frames += 1
+            self.deduplicated_frames += scope_count - 1
+        return set(matched)
+
+    def stats(self) -> dict[str, Any]:
+        depths = [client.queue.qsize() for client in self.clients.values()]
+        return {
+            "connections": len(self.clients),
+            "scopes": len(self.connections),
+            "queue_size": self.queue_size,
+            "queued_frames": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "dropped_frames": self.dropped_frames,
+            "evicted_connections": self.evicted_connections,
+            "published_frames": self.published_frames,
+            "deduplicated_frames": self.deduplicated_frames,
+        }
+
+
+WebSocketHub = RealtimeEventBroker
+
+
+@dataclass(slots=True)
+class VoiceEventLane:
+    queue: deque[tuple[float, discord.Member, discord.VoiceState, discord.VoiceState]] = field(default_factory=deque)
+    task: asyncio.Task[None] | None = None
+
+
+@dataclass(slots=True)
+class VoiceEventGuildStats:
+    queued: int = 0
+    processed: int = 0
+    failed: int = 0
+    max_depth: int = 0
+    total_wait_sec: float = 0.0
+    total_latency_sec: float = 0.0
+    max_latency_sec: float = 0.0
+
+    def to_payload(self, depth: int) -> dict[str, Any]:
+        return {
+            "queue_depth": depth,
+            "max_queue_depth": self.max_depth,
+            "queued": self.queued,
+            "processed": self.processed,
+            "failed": self.failed,
+            "avg_wait_ms": round(self.total_wait_sec * 1000 / self.processed, 2) if self.processed else 0.0,
+            "avg_latency_ms": round(self.total_latency_sec * 1000 / self.processed, 2) if self.processed else 0.0,
+            "max_latency_ms": round(self.max_latency_sec * 1000, 2),
+        }
+
+
+class VoiceEventDispatcher:
+    def __init__(
+        self,
+        handler: Callable[[discord.Member, discord.VoiceState, discord.VoiceState], Awaitable[None]],
+        logger: logging.Logger,
+        *,
+        workers_per_guild: int = VOICE_EVENT_WORKERS_PER_GUILD,
+    ) -> None:
+        self.handler = handler
+        self.logger = logger
+        self.workers_per_guild = max(1, workers_per_guild)
+        self.lanes: dict[tuple[int, int], VoiceEventLane] = {}
+        self.guild_stats: dict[int, VoiceEventGuildStats] = {}
+        self.guild_depths: dict[int, int] = {}
+        self.closed = False
+
+    def submit(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState) -> None:
+        if self.closed:
+            return
+        guild_id = member.guild.id
+        key = (guild_id, member.id % self.workers_per_guild)
+        lane = self.lanes.get(key)
+        if lane is None:
+            lane = self.lanes[key] = VoiceEventLane()
+        lane.queue.append((asyncio.get_running_loop().time(), member, before, after))
+        stats = self.guild_stats.setdefault(guild_id, VoiceEventGuildStats())
+        stats.queued += 1
+        depth = self.guild_depths[guild_id] = self.guild_depths.get(guild_id, 0) + 1
+        stats.max_depth = max(stats.max_depth, depth)
+        if lane.task is None or lane.task.done():
+            lane.task = asyncio.create_task(self._drain(key, lane))
+
+    async def _drain(self, key: tuple[int, int], lane: VoiceEventLane) -> None:
+        loop = asyncio.get_running_loop()
+        stats = self.guild_stats.setdefault(key[0], VoiceEventGuildStats())
+        while lane.queue:
+            submitted_at, member, before, after = lane.queue.popleft()
+            self._release_depth(key[0])
+            started_at = loop.time()
             try:
-                await websocket.send_json({"event": event, "payload": payload})
+                await self.handler(member, before, after)
+            except asyncio.CancelledError:
+                raise
             except Exception:
-                stale.append(websocket)
-        for websocket in stale:
-            await self.disconnect(websocket)
+                stats.failed += 1
+                self.logger.exception("ボイス状態更新の処理中にエラーが発生しました: guild=%s member=%s", key[0], member.id)
+            finished_at = loop.time()
+            stats.processed += 1
+            stats.total_wait_sec += started_at - submitted_at
+            stats.total_latency_sec += finished_at - submitted_at
+            stats.max_latency_sec = max(stats.max_latency_sec, finished_at - submitted_at)
+        if self.lanes.get(key) is lane:
+            self.lanes.pop(key, None)
+
+    def _release_depth(self, guild_id: int) -> None:
+        depth = self.guild_depths.get(guild_id, 0) - 1
+        if depth > 0:
+            self.guild_depths[guild_id] = depth
+        else:
+            self.guild_depths.pop(guild_id, None)
+
+    async def close(self, timeout: float = VOICE_EVENT_DRAIN_TIMEOUT_SEC) -> None:
+        self.closed = True
+        tasks = [lane.task for lane in self.lanes.values() if lane.task is not None and not lane.task.done()]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            if pending:
+                self.logger.warning("ボイス状態更新キューを破棄しました: pending=%s", sum(self.guild_depths.values()))
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        self.lanes.clear()
+        self.guild_depths.clear()
+
+    def stats(self) -> dict[str, Any]:
+        guilds = {str(guild_id): stats.to_payload(self.guild_depths.get(guild_id, 0)) for guild_id, stats in self.guild_stats.items()}
+        return {
+            "workers_per_guild": self.workers_per_guild,
+            "active_lanes": len(self.lanes),
+            "queue_depth": sum(self.guild_depths.values()),
+            "guilds": guilds,
+        }
 
 
-WebSocketHub = RealtimeEventBroker
+@dataclass(slots=True)
+class OutboxItem:
+    priority: int
+    target: Any
+    description: str
+    job: Callable[[], Awaitable[Any]]
+    on_failure: Callable[[], Awaitable[Any]] | None = None
+    coalesce_key: Any = None
+    enqueued_at: float = 0.0
+
+
+class DiscordOutbox:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        *,
+        senders: int = OUTBOX_SENDERS,
+        max_attempts: int = OUTBOX_MAX_ATTEMPTS,
+        retry_base_sec: float = OUTBOX_RETRY_BASE_SEC,
+    ) -> None:
+        self.logger = logger
+        self.sender_count = max(1, senders)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_sec = max(0.0, retry_base_sec)
+        self.ready: asyncio.PriorityQueue[tuple[int, int, Any]] | None = None
+        self.sender_tasks: list[asyncio.Task[None]] = []
+        self.pending_by_key: dict[Any, OutboxItem] = {}
+        self.target_queues: dict[Any, deque[OutboxItem]] = {}
+        self.scheduled_targets: dict[Any, int] = {}
+        self.active_targets: set[Any] = set()
+        self.idle = asyncio.Event()
+        self.idle.set()
+        self.sequence = 0
+        self.pending = 0
+        self.in_flight = 0
+        self.delivered = 0
+        self.failed = 0
+        self.retried = 0
+        self.coalesced = 0
+        self.max_wait_sec = 0.0
+        self.closed = False
+
+    def submit(
+        self,
+        job: Callable[[], Awaitable[Any]],
+        *,
+        target: Any,
+        description: str,
+        priority: int = OUTBOX_PRIORITY_NORMAL,
+        on_failure: Callable[[], Awaitable[Any]] | None = None,
+        coalesce_key: Any = None,
+    ) -> None:
+        if self.closed:
+            return
+        if coalesce_key is not None:
+            pending = self.pending_by_key.get(coalesce_key)
+            if pending is not None:
+                pending.job = job
+                pending.on_failure = on_failure
+                pending.description = description
+                self.coalesced += 1
+                return
+        if self.ready is None:
+            self.ready = asyncio.PriorityQueue()
+        if not self.sender_tasks:
+            self.sender_tasks = [asyncio.create_task(self._sender()) for _ in range(self.sender_count)]
+        item = OutboxItem(
+            priority=priority,
+            target=target,
+            description=description,
+            job=job,
+            on_failure=on_failure,
+            coalesce_key=coalesce_key,
+            enqueued_at=asyncio.get_running_loop().time(),
+        )
+        if coalesce_key is not None:
+            self.pending_by_key[coalesce_key] = item
+        self.target_queues.setdefault(target, deque()).append(item)
+        self.pending += 1
+        self.idle.clear()
+        self._schedule_target(target, priority)
+
+    def _schedule_target(self, target: Any, priority: int) -> None:
+        if target in self.active_targets or self.ready is None:
+            return
+        scheduled = self.scheduled_targets.get(target)
+        if scheduled is not None and scheduled <= priority:
+            return
+        self.scheduled_targets[target] = priority
+        self.sequence += 1
+        self.ready.put_nowait((priority, self.sequence, target))
+
+    async def _sender(self) -> None:
+        assert self.ready is not None
+        while True:
+            priority, _, target = await self.ready.get()
+            if self.scheduled_targets.get(target) != priority:
+                continue
+            del self.scheduled_targets[target]
+            queue = self.target_queues.get(target)
+            if not queue:
+                continue
+            item = queue.popleft()
+            if item.coalesce_key is not None and self.pending_by_key.get(item.coalesce_key) is item:
+                self.pending_by_key.pop(item.coalesce_key, None)
+            self.active_targets.add(target)
+            self.in_flight += 1
+            try:
+                self.max_wait_sec = max(self.max_wait_sec, asyncio.get_running_loop().time() - item.enqueued_at)
+                await self._deliver(item)
+            finally:
+                self.in_flight -= 1
+                self.pending -= 1
+                self.active_targets.discard(target)
+                if queue:
+                    self._schedule_target(target, min(queued.priority for queued in queue))
+                else:
+                    self.target_queues.pop(target, None)
+                if not self.pending:
+                    self.idle.set()
+
+    async def _deliver(self, item: OutboxItem) -> None:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await item.job()
+                self.delivered += 1
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                if attempt < self.max_attempts and self._is_retryable(exc):
+                    self.retried += 1
+                    await asyncio.sleep(self._retry_delay(exc, attempt))
+                    continue
+                self.failed += 1
+                self.logger.exception("Discord送信キューの処理に失敗しました: %s target=%s", item.description, item.target)
+                break
+        if item.on_failure is not None:
+            try:
+                await item.on_failure()
+            except Exception:
+                self.logger.exception("Discord送信キューのフォールバックに失敗しました: %s target=%s", item.description, item.target)
+
+    def _is_retryable(self, exc: Exception) -> bool:
+        if isinstance(exc, discord.Forbidden | discord.NotFound):
+            return False
+        if isinstance(exc, discord.HTTPException):
+            return exc.status == 429 or exc.status >= 500
+        return isinstance(exc, OSError | asyncio.TimeoutError)
+
+    def _retry_delay(self, exc: Exception, attempt: int) -> float:
+        retry_after = getattr(exc, "retry_after", None)
+        if isinstance(retry_after, int | float) and retry_after > 0:
+            return float(retry_after)
+        return self.retry_base_sec * 2 ** (attempt - 1)
+
+    async def drain(self, timeout: float = OUTBOX_DRAIN_TIMEOUT_SEC) -> bool:
+        try:
+            await asyncio.wait_for(self.idle.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def close(self, timeout: float = OUTBOX_DRAIN_TIMEOUT_SEC) -> None:
+        self.closed = True
+        if not await self.drain(timeout):
+            self.logger.warning("Discord送信キューを破棄しました: pending=%s", self.pending)
+        tasks, self.sender_tasks = self.sender_tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "senders": self.sender_count,
+            "pending": self.pending - self.in_flight,
+            "targets": len(self.target_queues),
+            "in_flight": self.in_flight,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "retried": self.retried,
+            "coalesced": self.coalesced,
+            "max_wait_ms": round(self.max_wait_sec * 1000, 2),
+        }
+
+
+@dataclass(slots=True)
+class MemberMoveResult:
+    user_id: int
+    target_channel_id: int
+    status: str
+    attempts: int = 0
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "user_id": str(self.user_id),
+            "target_channel_id": str(self.target_channel_id),
+            "status": self.status,
+            "attempts": self.attempts,
+        }
+
+
+@dataclass(slots=True)
+class MemberMoveReport:
+    results: list[MemberMoveResult] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    def moved_user_ids(self) -> list[int]:
+        return [result.user_id for result in self.results if result.status == "moved"]
+
+    def to_payload(self) -> dict[str, Any]:
+        totals: dict[str, int] = {}
+        for result in self.results:
+            totals[result.status] = totals.get(result.status, 0) + 1
+        return {
+            "total": len(self.results),
+            "moved": totals.get("moved", 0),
+            "forbidden": totals.get("forbidden", 0),
+            "failed": totals.get("failed", 0),
+            "elapsed_ms": round(self.elapsed_ms, 2),
+        }
+
+
+class MemberMoveExecutor:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        *,
+        concurrency: int = MEMBER_MOVE_CONCURRENCY,
+        max_attempts: int = MEMBER_MOVE_MAX_ATTEMPTS,
+    ) -> None:
+        self.logger = logger
+        self.concurrency = max(1, concurrency)
+        self.max_attempts = max(1, max_attempts)
+        self.guild_slots: dict[int, asyncio.Semaphore] = {}
+        self.guild_resume_at: dict[int, float] = {}
+        self.moved = 0
+        self.failed = 0
+        self.retried = 0
+
+    async def move_members(
+        self,
+        guild_id: int,
+        moves: list[tuple[discord.Member, discord.VoiceChannel]],
+        *,
+        reason: str,
+    ) -> MemberMoveReport:
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        results = await asyncio.gather(*(self._move(guild_id, member, channel, reason) for member, channel in moves))
+        return MemberMoveReport(results=list(results), elapsed_ms=(loop.time() - started_at) * 1000)
+
+    async def _move(self, guild_id: int, member: discord.Member, channel: discord.VoiceChannel, reason: str) -> MemberMoveResult:
+        loop = asyncio.get_running_loop()
+        slots = self.guild_slots.get(guild_id)
+        if slots is None:
+            slots = self.guild_slots[guild_id] = asyncio.Semaphore(self.concurrency)
+        result = MemberMoveResult(user_id=member.id, target_channel_id=channel.id, status="failed")
+        async with slots:
+            for attempt in range(1, self.max_attempts + 1):
+                result.attempts = attempt
+                delay = self.guild_resume_at.get(guild_id, 0.0) - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                try:
+                    await member.move_to(channel, reason=reason)
+                except discord.Forbidden:
+                    self.logger.exception("メンバー移動の権限がありません: guild=%s member=%s", guild_id, member.id)
+                    result.status = "forbidden"
+                    break
+                except discord.HTTPException as exc:
+                    if attempt < self.max_attempts and (exc.status == 429 or exc.status >= 500):
+                        self.retried += 1
+                        retry_after = getattr(exc, "retry_after", None) or 2 ** (attempt - 1)
+                        self.guild_resume_at[guild_id] = max(self.guild_resume_at.get(guild_id, 0.0), loop.time() + retry_after)
+                        continue
+                    self.logger.exception("メンバー移動に失敗しました: guild=%s member=%s", guild_id, member.id)
+                    break
+                result.status = "moved"
+                break
+        if result.status == "moved":
+            self.moved += 1
+        else:
+            self.failed += 1
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "concurrency_per_guild": self.concurrency,
+            "moved": self.moved,
+            "failed": self.failed,
+            "retried": self.retried,
+        }
+
+
+class RateLimiter:
+    def __init__(self, rate_per_sec: float, *, burst: int = 1) -> None:
+        self.interval = 1 / max(0.001, rate_per_sec)
+        self.burst = max(1, burst)
+        self.available_at = 0.0
+
+    async def acquire(self) -> None:
+        now = asyncio.get_running_loop().time()
+        available_at = max(self.available_at, now)
+        self.available_at = available_at + self.interval
+        delay = available_at - now - (self.burst - 1) * self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        self.available_at = max(self.available_at, asyncio.get_running_loop().time() + seconds)
+
+
+class DirectMessageDispatcher:
+    def __init__(
+        self,
+        live_state_repo: LiveStateRepository,
+        logger: logging.Logger,
+        *,
+        concurrency: int = DM_SENDER_CONCURRENCY,
+        rate_per_sec: float = DM_GLOBAL_RATE_PER_SEC,
+        open_rate_per_sec: float = DM_OPEN_RATE_PER_SEC,
+        batch_size: int = DM_BATCH_SIZE,
+        max_attempts: int = DM_MAX_ATTEMPTS,
+        retry_base_sec: float = DM_RETRY_BASE_SEC,
+        retry_max_sec: float = DM_RETRY_MAX_SEC,
+    ) -> None:
+        self.live_state_repo = live_state_repo
+        self.logger = logger
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_sec = max(0.0, retry_base_sec)
+        self.retry_max_sec = max(self.retry_base_sec, retry_max_sec)
+        self.global_limiter = RateLimiter(rate_per_sec, burst=self.concurrency)
+        self.route_limiters = {
+            "create_dm": RateLimiter(open_rate_per_sec),
+            "fetch_user": RateLimiter(open_rate_per_sec),
+        }
+        self.bot: discord.Client | None = None
+        self.task: asyncio.Task[None] | None = None
+        self.wakeup = asyncio.Event()
+        self.sent = 0
+        self.failed = 0
+        self.retried = 0
+        self.rate_limited = 0
+
+    def start(self, bot: discord.Client) -> None:
+        self.bot = bot
+        if self.task is not None and not self.task.done():
+            return
+        self.task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        task, self.task = self.task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def enqueue(self, job_key: str, kind: str, guild_id: int | None, embed: discord.Embed, user_ids: list[int]) -> int:
+        job_id = await self.live_state_repo.create_dm_job(job_key, kind, guild_id, embed.to_dict(), user_ids)
+        self.wakeup.set()
+        return job_id
+
+    async def _run(self) -> None:
+        try:
+            await self.live_state_repo.purge_completed_dm_jobs(utcnow() - timedelta(days=DM_JOB_RETENTION_DAYS))
+        except Exception:
+            self.logger.exception("完了済みDMジョブの削除に失敗しました")
+        semaphore = asyncio.Semaphore(self.concurrency)
+        while True:
+            self.wakeup.clear()
+            try:
+                deliveries = await self.live_state_repo.list_pending_dm_deliveries(self.batch_size)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger.exception("DM送信キューの読み込みに失敗しました")
+                await asyncio.sleep(5)
+                continue
+            if not deliveries:
+                await self._wait_for_retry()
+                continue
+            embeds: dict[int, discord.Embed] = {}
+            for item in deliveries:
+                if item["job_id"] not in embeds:
+                    embeds[item["job_id"]] = discord.Embed.from_dict(item["embed"])
+            saved = await asyncio.gather(*(self._deliver_and_save(item, embeds[item["job_id"]], semaphore) for item in deliveries))
+            if not all(saved):
+                await asyncio.sleep(5)
+
+    async def _deliver_and_save(self, item: dict[str, Any], embed: discord.Embed, semaphore: asyncio.Semaphore) -> bool:
+        result = await self._deliver(item, embed, semaphore)
+        try:
+            await self.live_state_repo.update_dm_deliveries([result])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger.exception("DM送信結果の保存に失敗しました: job_id=%s user=%s", result[0], result[1])
+            return False
+        return True
+
+    async def _wait_for_retry(self) -> None:
+        try:
+            next_retry_at = await self.live_state_repo.next_dm_retry_at()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger.exception("DM再送時刻の読み込みに失敗しました")
+            next_retry_at = utcnow() + timedelta(seconds=5)
+        timeout = None if next_retry_at is None else max(0.0, (next_retry_at - utcnow()).total_seconds())
+        try:
+            await asyncio.wait_for(self.wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _retry_delay(self, attempts: int, retry_after: float | None = None) -> float:
+        delay = min(self.retry_max_sec, self.retry_base_sec * (2 ** max(0, attempts - 1)))
+        return max(delay, retry_after or 0.0)
+
+    def _resolve_user(self, guild_id: int | None, user_id: int) -> discord.abc.User | None:
+        if self.bot is None:
+            return None
+        user = self.bot.get_user(user_id)
+        if user is None and guild_id is not None:
+            guild = self.bot.get_guild(guild_id)
+            user = guild.get_member(user_id) if guild is not None else None
+        return user
+
+    async def _deliver(
+        self,
+        item: dict[str, Any],
+        embed: discord.Embed,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[int, int, str, int, datetime | None]:
+        job_id = int(item["job_id"])
+        user_id = int(item["user_id"])
+        attempts = int(item.get("attempts") or 0) + 1
+        async with semaphore:
+            try:
+                if self.bot is None:
+                    raise RuntimeError("bot is not ready")
+                user = self._resolve_user(item.get("guild_id"), user_id)
+                if user is None:
+                    await self.route_limiters["fetch_user"].acquire()
+                    await self.global_limiter.acquire()
+                    user = await self.bot.fetch_user(user_id)
+                if getattr(user, "dm_channel", None) is None:
+                    await self.route_limiters["create_dm"].acquire()
+                    await self.global_limiter.acquire()
+                    await user.create_dm()
+                await self.global_limiter.acquire()
+                await user.send(embed=embed)
+            except asyncio.CancelledError:
+                raise
+            except (discord.Forbidden, discord.NotFound):
+                self.failed += 1
+                self.logger.info("DM送信に失敗しました: kind=%s job_id=%s user=%s", item.get("kind"), job_id, user_id)
+                return job_id, user_id, "failed", attempts, None
+            except Exception as exc:
+                status = getattr(exc, "status", None)
+                retry_after = None
+                if status == 429:
+                    self.rate_limited += 1
+                    retry_after = float(getattr(exc, "retry_after", None) or 5)
+                    self.global_limiter.pause(retry_after)
+                retryable = status == 429 or (isinstance(status, int) and status >= 500) or isinstance(exc, OSError | asyncio.TimeoutError)
+                if retryable and attempts < self.max_attempts:
+                    self.retried += 1
+                    return job_id, user_id, "pending", attempts, utcnow() + timedelta(seconds=self._retry_delay(attempts, retry_after))
+                self.failed += 1
+                self.logger.info("DM送信に失敗しました: kind=%s job_id=%s user=%s error=%s", item.get("kind"), job_id, user_id, exc)
+                return job_id, user_id, "failed", attempts, None
+        self.sent += 1
+        return job_id, user_id, "sent", attempts, None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.task is not None and not self.task.done(),
+            "concurrency": self.concurrency,
+            "rate_per_sec": round(1 / self.global_limiter.interval, 2),
+            "sent": self.sent,
+            "failed": self.failed,
+            "retried": self.retried,
+            "rate_limited": self.rate_limited,
+        }
+
+
+class PresencePublisher:
+    def __init__(self, logger: logging.Logger, *, min_interval: float = PRESENCE_MIN_INTERVAL_SEC) -> None:
+        self.logger = logger
+        self.min_interval = max(0.0, min_interval)
+        self.published: str | None = None
+        self.pending: str | None = None
+        self.in_flight: str | None = None
+        self.last_sent_at: float | None = None
+        self.task: asyncio.Task[None] | None = None
+        self.sent = 0
+        self.failed = 0
+        self.unchanged = 0
+        self.coalesced = 0
+
+    def publish(self, bot: discord.Client, name: str) -> None:
+        flushing = self.task is not None and not self.task.done()
+        if self.pending is not None:
+            baseline = self.pending
+        elif self.in_flight is not None:
+            baseline = self.in_flight
+        else:
+            baseline = self.published
+        if name == baseline:
+            self.unchanged += 1
+            return
+        if self.pending is not None:
+            self.coalesced += 1
+        self.pending = name
+        if not flushing:
+            self.task = asyncio.create_task(self._flush(bot))
+
+    async def _flush(self, bot: discord.Client) -> None:
+        loop = asyncio.get_running_loop()
+        while self.pending is not None:
+            if self.last_sent_at is not None:
+                delay = self.last_sent_at + self.min_interval - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            name, self.pending = self.pending, None
+            if name is None or name == self.published:
+                continue
+            self.in_flight = name
+            try:
+                await bot.change_presence(activity=discord.CustomActivity(name=name))
+                self.published = name
+                self.sent += 1
+            except discord.HTTPException:
+                self.failed += 1
+                self.logger.exception("プレゼンス更新に失敗しました")
+            finally:
+                self.in_flight = None
+            self.last_sent_at = loop.time()
+
+    async def close(self) -> None:
+        task, self.task = self.task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "min_interval_sec": self.min_interval,
+            "published": self.published,
+            "pending": self.pending,
+            "sent": self.sent,
+            "failed": self.failed,
+            "unchanged": self.unchanged,
+            "coalesced": self.coalesced,
+        }
 
 
 class SessionManager:
@@ -291,11 +1284,21 @@ class SessionManager:
         self,
         config_repo: ConfigRepository,
         stats_repo: StatsRepository,
+        live_state_repo: LiveStateRepository,
         websocket_hub: WebSocketHub,
         logger: logging.Logger,
+        *,
+        snapshot_flush_interval: float = SNAPSHOT_FLUSH_INTERVAL_SEC,
+        journal: ParticipantJournal | None = None,
+        voice_event_workers: int = VOICE_EVENT_WORKERS_PER_GUILD,
+        outbox_senders: int = OUTBOX_SENDERS,
+        member_move_concurrency: int = MEMBER_MOVE_CONCURRENCY,
+        dm_rate_per_sec: float = DM_GLOBAL_RATE_PER_SEC,
+        presence_interval: float = PRESENCE_MIN_INTERVAL_SEC,
     ) -> None:
         self.config_repo = config_repo
         self.stats_repo = stats_repo
+        self.live_state_repo = live_state_repo
         self.websocket_hub = websocket_hub
         self.logger = logger
         self.bot: discord.Client | None = None
@@ -303,11 +1306,50 @@ class SessionManager:
         self.sessions: dict[int, LiveSession] = {}
         self.sessions_by_key: dict[tuple[int, int], LiveSession] = {}
         self.channel_to_root: dict[int, int] = {}
-        self.deletion_tasks: dict[int, DeletionHandle] = {}
-        self.solo_cleanup_tasks: dict[int, SoloCleanupHandle] = {}
+        self.voice_occupancy: dict[int, set[int]] = {}
+        self.voice_member_channels: dict[tuple[int, int], int] = {}
+        self.guild_admin_cache: dict[int, dict[int, bool]] = {}
+        self.user_admin_guilds: dict[int, set[int]] = {}
+        self.guild_session_roots: dict[int, set[int]] = {}
+        self.session_viewers: dict[int, set[int]] = {}
+        self.visible_sessions_by_user: dict[int, set[int]] = {}
+        self.session_roles: dict[int, tuple[int, set[int]]] = {}
+        self.role_session_roots: dict[int, dict[int, set[int]]] = {}
+        self.active_participant_count = 0
+        self.presence = PresencePublisher(logger, min_interval=presence_interval)
+        self.empty_cleanups: dict[int, CleanupDeadline] = {}
+        self.solo_cleanups: dict[int, CleanupDeadline] = {}
+        self.cleanup_timers: list[tuple[datetime, int, str, int]] = []
+        self.cleanup_timer_sequence = 0
+        self.cleanup_wakeup = asyncio.Event()
+        self.cleanup_task: asyncio.Task[None] | None = None
         self.auto_personal_root_channels: set[int] = set()
         self.scheduled_vc_task: asyncio.Task[None] | None = None
-        self.system_move_markers: list[SystemMoveMarker] = []
+        self.scheduled_vc_timers: list[tuple[datetime, int, str, int, int, int]] = []
+        self.scheduled_vc_items: dict[int, ScheduledVC] = {}
+        self.scheduled_vc_generations: dict[int, int] = {}
+        self.scheduled_vc_timer_sequence = 0
+        self.scheduled_vc_wakeup = asyncio.Event()
+        self.timeline_retention_task: asyncio.Task[None] | None = None
+        self.timeline_retention_status = TimelineRetentionStatus()
+        self.snapshot_flush_interval = max(0.0, snapshot_flush_interval)
+        self.dirty_snapshots: dict[str, LiveSession] = {}
+        self.snapshot_flush_task: asyncio.Task[None] | None = None
+        self.snapshot_flush_sleeping = False
+        self.snapshot_flush_closing = False
+        self.snapshot_lock = asyncio.Lock()
+        self.live_state_tasks: set[asyncio.Task[None]] = set()
+        self.journal = journal
+        self.retired_snapshot_ids: set[str] = set()
+        self.global_sequence = 0
+        self.global_published: dict[int, tuple[dict[str, Any], str]] = {}
+        self.journal_checkpoint_task: asyncio.Task[None] | None = None
+        self.restored_solo_deadlines: dict[int, dict[str, Any]] = {}
+        self.system_move_markers = SystemMoveMarkerStore()
+        self.outbox = DiscordOutbox(logger, senders=outbox_senders)
+        self.member_moves = MemberMoveExecutor(logger, concurrency=member_move_concurrency)
+        self.direct_messages = DirectMessageDispatcher(live_state_repo, logger, rate_per_sec=dm_rate_per_sec)
+        self.voice_events = VoiceEventDispatcher(self.handle_voice_state_update, logger, workers_per_guild=voice_event_workers)
 
     def bind_bot(self, bot: discord.Client) -> None:
         self.bot = bot
@@ -315,8 +1357,9 @@ class SessionManager:
     async def refresh_guild_configs(self) -> None:
         configs = await self.config_repo.list_guild_configs()
         self.guild_configs = {config.guild_id: config for config in configs}
+        if self.scheduled_vc_task is not None:
+            self._schedule_ranking_timer(utcnow())
         for session in list(self.sessions.values()):
-            self._cancel_solo_cleanup_by_channel_id(session.root_channel_id)
             await self._refresh_solo_cleanup_for_session(session)
 
     async def sync_guild_catalog(self) -> None:
@@ -331,25 +1374,200 @@ class SessionManager:
             return
         self.scheduled_vc_task = asyncio.create_task(self._scheduled_vc_worker())
 
+    async def _load_scheduled_vcs(self) -> None:
+        delay = SCHEDULED_VC_LOAD_RETRY_BASE_SEC
+        while True:
+            try:
+                scheduled_vcs = await self.config_repo.list_upcoming_scheduled_vcs()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger.exception("scheduled VC timer load failed; retrying in %.0fs", delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, SCHEDULED_VC_LOAD_RETRY_MAX_SEC)
+                continue
+            for scheduled in scheduled_vcs:
+                self.track_scheduled_vc(scheduled)
+            return
+
     async def _scheduled_vc_worker(self) -> None:
+        await self._load_scheduled_vcs()
+        self._schedule_ranking_timer(utcnow())
         while True:
+            self.scheduled_vc_wakeup.clear()
+            if self.bot is None or not self.guild_configs:
+                await self.scheduled_vc_wakeup.wait()
+                continue
             try:
                 await self._process_scheduled_vcs()
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger.exception("scheduled VC worker failed")
-            await asyncio.sleep(30)
+            next_due = self._next_scheduled_vc_due()
+            timeout = None if next_due is None else max(0.0, (next_due - utcnow()).total_seconds())
+            try:
+                await asyncio.wait_for(self.scheduled_vc_wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
 
-    async def _process_scheduled_vcs(self) -> None:
-        if self.bot is None or not self.guild_configs:
+    def track_scheduled_vc(self, scheduled: ScheduledVC) -> None:
+        if scheduled.id is None:
             return
+        generation = self.scheduled_vc_generations.get(scheduled.id, 0) + 1
+        self.scheduled_vc_generations[scheduled.id] = generation
+        if scheduled.status == "pending" and scheduled.start_at is not None:
+            self.scheduled_vc_items[scheduled.id] = scheduled
+            self._push_scheduled_vc_timer(scheduled.start_at, "start", scheduled.id, generation)
+        elif scheduled.status == "active" and scheduled.end_at is not None:
+            self.scheduled_vc_items[scheduled.id] = scheduled
+            for minutes, already_sent in zip(
+                SCHEDULED_VC_PRE_NOTICE_MINUTES,
+                (scheduled.pre_notice_15_sent, scheduled.pre_notice_5_sent, scheduled.pre_notice_3_sent),
+            ):
+                if not already_sent:
+                    self._push_scheduled_vc_timer(scheduled.end_at - timedelta(minutes=minutes), "notice", scheduled.id, generation, minutes)
+            self._push_scheduled_vc_timer(scheduled.end_at, "end", scheduled.id, generation)
+        else:
+            self.untrack_scheduled_vc(scheduled.id)
+            return
+        self.scheduled_vc_wakeup.set()
+
+    def untrack_scheduled_vc(self, scheduled_id: int) -> None:
+        self.scheduled_vc_items.pop(scheduled_id, None)
+        self.scheduled_vc_generations.pop(scheduled_id, None)
+
+    def _push_scheduled_vc_timer(self, due_at: datetime, kind: str, scheduled_id: int, generation: int, minutes: int = 0) -> None:
+        self.scheduled_vc_timer_sequence += 1
+        heapq.heappush(self.scheduled_vc_timers, (due_at, self.scheduled_vc_timer_sequence, kind, scheduled_id, generation, minutes))
+
+    def _retry_scheduled_vc_timer(self, scheduled: ScheduledVC, kind: str) -> None:
+        generation = self.scheduled_vc_generations.get(scheduled.id or 0)
+        if generation is not None:
+            self._push_scheduled_vc_timer(utcnow() + timedelta(seconds=SCHEDULED_VC_RETRY_SEC), kind, scheduled.id or 0, generation)
+
+    def _schedule_ranking_timer(self, due_at: datetime) -> None:
+        generation = self.scheduled_vc_generations.get(0, 0) + 1
+        self.scheduled_vc_generations[0] = generation
+        self._push_scheduled_vc_timer(due_at, "ranking", 0, generation)
+        self.scheduled_vc_wakeup.set()
+
+    def _scheduled_vc_timer_is_current(self, kind: str, scheduled_id: int, generation: int) -> bool:
+        return self.scheduled_vc_generations.get(scheduled_id) == generation
+
+    def _next_scheduled_vc_due(self) -> datetime | None:
+        while self.scheduled_vc_timers:
+            due_at, _, kind, scheduled_id, generation, _ = self.scheduled_vc_timers[0]
+            if self._scheduled_vc_timer_is_current(kind, scheduled_id, generation):
+                return due_at
+            heapq.heappop(self.scheduled_vc_timers)
+        return None
+
+    def _next_ranking_post_at(self, now: datetime) -> datetime | None:
+        candidates: list[datetime] = []
+        local_now = now.astimezone(LOCAL_TZ)
+        for config in self.guild_configs.values():
+            if not config.ranking_post_enabled or not config.ranking_post_channel_id:
+                continue
+            try:
+                hour_text, minute_text = (config.ranking_post_time or "21:00").split(":", 1)
+                hour = max(0, min(23, int(hour_text)))
+                minute = max(0, min(59, int(minute_text)))
+            except ValueError:
+                hour, minute = 21, 0
+            candidate = local_now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if candidate <= local_now:
+                candidate += timedelta(days=1)
+            candidates.append(candidate)
+        return min(candidates) if candidates else None
+
+    def start_timeline_retention_worker(self) -> None:
+        if self.timeline_retention_task is not None and not self.timeline_retention_task.done():
+            return
+        self.timeline_retention_task = asyncio.create_task(self._timeline_retention_worker())
+
+    async def _timeline_retention_worker(self) -> None:
+        while True:
+            try:
+                await self.purge_expired_timeline_events()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger.exception("timeline retention worker failed")
+            await asyncio.sleep(TIMELINE_RETENTION_INTERVAL_SEC)
+
+    async def purge_expired_timeline_events(self) -> int:
+        status = self.timeline_retention_status
+        if status.running:
+            return 0
+        status.running = True
+        status.retention_days = await self._timeline_retention_days()
+        status.last_started_at = utcnow()
+        status.last_cutoff = status.last_started_at - timedelta(days=status.retention_days)
+        status.last_removed = 0
+        status.last_batches = 0
+        status.last_error = None
+        try:
+            while True:
+                removed = await self.stats_repo.purge_expired_timeline_events(status.last_cutoff, TIMELINE_PURGE_BATCH_SIZE)
+                status.last_batches += 1
+                status.last_removed += removed
+                status.total_removed += removed
+                if removed < TIMELINE_PURGE_BATCH_SIZE:
+                    break
+                await asyncio.sleep(0)
+        except Exception as exc:
+            status.last_error = str(exc)
+            raise
+        finally:
+            status.running = False
+            status.last_finished_at = utcnow()
+        if status.last_removed:
+            self.logger.info(
+                "期限切れのタイムラインを削除しました: removed=%s batches=%s cutoff=%s",
+                status.last_removed,
+                status.last_batches,
+                status.last_cutoff.isoformat(),
+            )
+        return status.last_removed
+
+    async def _process_scheduled_vcs(self) -> None:
         now = utcnow()
-        for scheduled in await self.config_repo.list_due_scheduled_vc_starts(now):
-            await self._start_scheduled_vc(scheduled)
-        for scheduled in await self.config_repo.list_active_scheduled_vcs():
-            await self._process_active_scheduled_vc(scheduled, now)
-        await self._process_ranking_posts(now)
+        while self.scheduled_vc_timers and self.scheduled_vc_timers[0][0] <= now:
+            _, _, kind, scheduled_id, generation, minutes = heapq.heappop(self.scheduled_vc_timers)
+            if not self._scheduled_vc_timer_is_current(kind, scheduled_id, generation):
+                continue
+            if kind == "ranking":
+                try:
+                    completed = await self._process_ranking_posts(now)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger.exception("ranking post timer failed")
+                    completed = False
+                if not completed:
+                    self._schedule_ranking_timer(now + timedelta(seconds=SCHEDULED_VC_RETRY_SEC))
+                    continue
+                next_post_at = self._next_ranking_post_at(now)
+                if next_post_at is not None:
+                    self._schedule_ranking_timer(next_post_at)
+                continue
+            scheduled = self.scheduled_vc_items.get(scheduled_id)
+            if scheduled is None:
+                continue
+            try:
+                if kind == "start":
+                    await self._start_scheduled_vc(scheduled)
+                elif kind == "notice":
+                    await self._send_scheduled_vc_pre_notice(scheduled, minutes, now)
+                elif kind == "end":
+                    await self._finish_scheduled_vc(scheduled)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger.exception("scheduled VC timer failed: scheduled_id=%s kind=%s", scheduled_id, kind)
+                if kind != "notice":
+                    self._retry_scheduled_vc_timer(scheduled, kind)
 
     def _ranking_frequency_key(self, frequency: str, now: datetime) -> str:
         local_now = now.astimezone(LOCAL_TZ)
@@ -377,7 +1595,8 @@ class SessionManager:
         local_now = now.astimezone(LOCAL_TZ)
         return (local_now.hour, local_now.minute) >= (hour, minute)
 
-    async def _process_ranking_posts(self, now: datetime) -> None:
+    async def _process_ranking_posts(self, now: datetime) -> bool:
+        completed = True
         for config in list(self.guild_configs.values()):
             if not config.ranking_post_enabled or not config.ranking_post_channel_id:
                 continue
@@ -388,10 +1607,19 @@ class SessionManager:
                 post_key = self._ranking_frequency_key(frequency, now)
                 if config.ranking_post_last_keys.get(frequency) == post_key:
                     continue
-                sent = await self.post_activity_rankings(config.guild_id, frequency=frequency)
-                if sent:
-                    config.ranking_post_last_keys[frequency] = post_key
-                    await self.config_repo.update_ranking_post_last_keys(config.guild_id, config.ranking_post_last_keys)
+                try:
+                    sent = await self.post_activity_rankings(config.guild_id, frequency=frequency)
+                    if sent:
+                        config.ranking_post_last_keys[frequency] = post_key
+                        await self.config_repo.update_ranking_post_last_keys(config.guild_id, config.ranking_post_last_keys)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger.exception("ranking post failed: guild_id=%s frequency=%s", config.guild_id, frequency)
+                    sent = False
+                if not sent:
+                    completed = False
+        return completed
 
     async def post_activity_rankings(self, guild_id: int, *, frequency: str = "manual") -> bool:
         config = self.guild_configs.get(guild_id) or await self.get_guild_config(guild_id)
@@ -464,14 +1692,22 @@ class SessionManager:
         if self.bot is None:
             return
         await self.refresh_guild_configs()
-        snapshots = {snapshot.root_channel_id: snapshot for snapshot in await self.config_repo.list_session_snapshots()}
+        await self._migrate_legacy_live_state()
+        snapshots = {snapshot.root_channel_id: snapshot for snapshot in await self.live_state_repo.list_session_snapshots()}
+        deadlines = await self.live_state_repo.list_cleanup_deadlines()
+        journal_entries = self._load_journal_entries()
+        self.restored_solo_deadlines = {
+            int(item["channel_id"]): item
+            for item in deadlines
+            if item["kind"] == "solo" and item["started_at"] is not None and item["due_at"] is not None
+        }
         for root_channel_id, snapshot in snapshots.items():
             guild = self.bot.get_guild(snapshot.guild_id)
             if guild is None:
                 continue
             root_channel = guild.get_channel(root_channel_id)
             if not isinstance(root_channel, discord.VoiceChannel):
-                await self.config_repo.delete_session_snapshot(snapshot.session_id)
+                await self._delete_session_snapshot(snapshot.session_id)
                 continue
             session = LiveSession(
                 session_id=snapshot.session_id,
@@ -502,7 +1738,7 @@ class SessionManager:
                     user_id=member_snapshot.user_id,
                     user_name=member_snapshot.user_name,
                     joined_at=member_snapshot.joined_at,
-                    last_transition_at=utcnow(),
+                    last_transition_at=member_snapshot.last_transition_at,
                     current_channel_id=member_snapshot.current_channel_id,
                     talk_seconds=member_snapshot.talk_seconds,
                     afk_seconds=member_snapshot.afk_seconds,
@@ -515,14 +1751,18 @@ class SessionManager:
                     current_team=member_snapshot.current_team,
                     panel_creator=member_snapshot.panel_creator,
                 )
-                member = guild.get_member(member_snapshot.user_id)
+                self._add_participant(session, participant)
+            self._replay_journal_entries(session, journal_entries.get(session.session_id, []))
+            restored_at = utcnow()
+            for participant in session.participants.values():
+                participant.last_transition_at = restored_at
+                member = guild.get_member(participant.user_id)
                 if member and member.voice and member.voice.channel:
-                    participant.current_channel_id = member.voice.channel.id
+                    self._set_participant_channel(session, participant, member.voice.channel.id)
                     participant.apply_voice_state(member.voice)
                     participant.user_name = member.display_name
                 else:
-                    participant.current_channel_id = None
-                session.participants[participant.user_id] = participant
+                    self._set_participant_channel(session, participant, None)
             self._hydrate_session_live_members(session, guild, root_channel)
             self._register_session(session)
             self.auto_personal_root_channels.add(session.root_channel_id)
@@ -560,8 +1800,160 @@ class SessionManager:
                 if not members:
                     continue
                 await self.restore_or_create_session_from_channel(guild, channel, members)
+        await self._restore_cleanup_deadlines(deadlines)
+        await self.checkpoint_journal(force=True)
         await self.update_presence()
 
+    async def _migrate_legacy_live_state(self) -> None:
+        try:
+            legacy_keys, legacy_snapshots = await self.config_repo.list_legacy_session_snapshots()
+        except Exception:
+            self.logger.exception("旧スナップショットの読み込みに失敗しました")
+            return
+        if not legacy_keys:
+            return
+        try:
+            await self.live_state_repo.import_session_snapshots(legacy_snapshots)
+        except Exception:
+            self.logger.exception("旧スナップショットの移行に失敗しました")
+            return
+        try:
+            await self.config_repo.delete_legacy_session_snapshots(legacy_keys)
+        except Exception:
+            self.logger.exception("移行済みの旧スナップショットの削除に失敗しました")
+        self.logger.info("config.db のセッションスナップショットを live_state.db へ移行しました: %s 件", len(legacy_snapshots))
+
+    async def _restore_cleanup_deadlines(self, deadlines: list[dict[str, Any]]) -> None:
+        for channel_id in list(self.restored_solo_deadlines):
+            if channel_id not in self.solo_cleanups:
+                self._drop_cleanup_deadline("solo", channel_id)
+        self.restored_solo_deadlines = {}
+        for item in deadlines:
+            if item["kind"] != "empty":
+                continue
+            channel_id = int(item["channel_id"])
+            channel = self._resolve_voice_channel(channel_id)
+            if channel is None or any(not member.bot for member in channel.members):
+                self._drop_cleanup_deadline("empty", channel_id)
+                continue
+            await self._schedule_empty_cleanup(channel, restored=item)
+
+    def _queue_live_state_write(self, coroutine: Any) -> None:
+        task = asyncio.create_task(coroutine)
+        self.live_state_tasks.add(task)
+        task.add_done_callback(self._finish_live_state_write)
+
+    def _finish_live_state_write(self, task: asyncio.Task[None]) -> None:
+        self.live_state_tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self.logger.error("ライブ状態の保存に失敗しました: %s", error)
+
+    def _track_cleanup_deadline(self, entry: CleanupDeadline) -> None:
+        self._queue_live_state_write(
+            self.live_state_repo.save_cleanup_deadline(
+                entry.kind,
+                entry.channel_id,
+                entry.guild_id,
+                entry.started_at,
+                entry.due_at or entry.started_at,
+                entry.stage,
+            )
+        )
+
+    def _drop_cleanup_deadline(self, kind: str, channel_id: int) -> None:
+        self._queue_live_state_write(self.live_state_repo.delete_cleanup_deadline(kind, channel_id))
+
+    def _cleanup_entries(self, kind: str) -> dict[int, CleanupDeadline]:
+        return self.empty_cleanups if kind == "empty" else self.solo_cleanups
+
+    def _arm_cleanup_deadline(self, entry: CleanupDeadline, stage: str, due_at: datetime) -> None:
+        self.cleanup_timer_sequence += 1
+        entry.stage = stage
+        entry.due_at = due_at
+        entry.generation = self.cleanup_timer_sequence
+        heapq.heappush(self.cleanup_timers, (due_at, entry.generation, entry.kind, entry.channel_id))
+        self._track_cleanup_deadline(entry)
+        if self.cleanup_task is None or self.cleanup_task.done():
+            self.cleanup_task = asyncio.create_task(self._cleanup_timer_worker())
+        if self.cleanup_timers[0][1] == entry.generation:
+            self.cleanup_wakeup.set()
+
+    def _release_cleanup_deadline(self, kind: str, channel_id: int) -> CleanupDeadline | None:
+        entry = self._cleanup_entries(kind).pop(channel_id, None)
+        if entry is None:
+            return None
+        if entry.task is not None and entry.task is not asyncio.current_task():
+            entry.task.cancel()
+        self._drop_cleanup_deadline(kind, channel_id)
+        return entry
+
+    def _current_cleanup_deadline(self, generation: int, kind: str, channel_id: int) -> CleanupDeadline | None:
+        entry = self._cleanup_entries(kind).get(channel_id)
+        if entry is None or entry.generation != generation:
+            return None
+        return entry
+
+    def _next_cleanup_due(self) -> datetime | None:
+        while self.cleanup_timers:
+            due_at, generation, kind, channel_id = self.cleanup_timers[0]
+            if self._current_cleanup_deadline(generation, kind, channel_id) is not None:
+                return due_at
+            heapq.heappop(self.cleanup_timers)
+        return None
+
+    async def _cleanup_timer_worker(self) -> None:
+        while True:
+            self.cleanup_wakeup.clear()
+            now = utcnow()
+            while self.cleanup_timers and self.cleanup_timers[0][0] <= now:
+                _, generation, kind, channel_id = heapq.heappop(self.cleanup_timers)
+                entry = self._current_cleanup_deadline(generation, kind, channel_id)
+                if entry is not None:
+                    entry.task = asyncio.create_task(self._run_cleanup_deadline(entry))
+            next_due = self._next_cleanup_due()
+            timeout = None if next_due is None else max(0.0, (next_due - utcnow()).total_seconds())
+            try:
+                await asyncio.wait_for(self.cleanup_wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run_cleanup_deadline(self, entry: CleanupDeadline) -> None:
+        generation = entry.generation
+        try:
+            if entry.kind == "empty":
+                await self._advance_empty_cleanup(entry)
+            else:
+                await self._advance_solo_cleanup(entry)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger.exception("cleanup deadline failed: kind=%s channel=%s", entry.kind, entry.channel_id)
+        finally:
+            current_task = asyncio.current_task()
+            if entry.task is current_task:
+                entry.task = None
+            entries = self._cleanup_entries(entry.kind)
+            if (
+                entries.get(entry.channel_id) is entry
+                and entry.generation == generation
+                and (current_task is None or not current_task.cancelling())
+            ):
+                entries.pop(entry.channel_id, None)
+                self._drop_cleanup_deadline(entry.kind, entry.channel_id)
+
+    async def _stop_cleanup_timers(self) -> None:
+        tasks = [entry.task for entries in (self.empty_cleanups, self.solo_cleanups) for entry in entries.values() if entry.task is not None]
+        worker, self.cleanup_task = self.cleanup_task, None
+        if worker is not None:
+            tasks.append(worker)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     def _hydrate_session_live_members(
         self,
         session: LiveSession,
@@ -580,7 +1972,7 @@ class SessionManager:
 
         now = utcnow()
         for participant in session.participants.values():
-            participant.current_channel_id = None
+            self._set_participant_channel(session, participant, None)
 
         for member_id, member in live_members.items():
             voice_channel_id = int(member.voice.channel.id) if member.voice and member.voice.channel else int(root_channel.id)
@@ -594,12 +1986,12 @@ class SessionManager:
                     current_channel_id=voice_channel_id,
                     current_team=session.team_assignments.get(member_id),
                 )
-                session.participants[member_id] = participant
+                self._add_participant(session, participant)
                 if member_id not in session.member_order:
                     session.member_order.append(member_id)
             else:
                 participant.user_name = member.display_name
-                participant.current_channel_id = voice_channel_id
+                self._set_participant_channel(session, participant, voice_channel_id)
                 participant.last_transition_at = now
                 participant.current_team = participant.current_team or session.team_assignments.get(member_id)
             if member.voice is not None:
@@ -682,22 +2074,41 @@ class SessionManager:
         guild: discord.Guild,
         channel: discord.VoiceChannel,
     ) -> list[discord.Member]:
-        members: dict[int, discord.Member] = {}
-
-        for member in channel.members:
-            if not member.bot:
-                members[int(member.id)] = member
-
-        for member in guild.members:
-            if member.bot:
-                continue
-            voice_state = member.voice
-            if voice_state is None or voice_state.channel is None:
-                continue
-            if int(voice_state.channel.id) == int(channel.id):
-                members[int(member.id)] = member
-
-        return sorted(members.values(), key=lambda item: item.display_name.lower())
+        members: list[discord.Member] = []
+        for member_id in self.voice_occupancy.get(int(channel.id), ()):
+            member = guild.get_member(member_id)
+            if member is not None and not member.bot:
+                members.append(member)
+        return sorted(members, key=lambda item: item.display_name.lower())
+
+    def reset_voice_occupancy(self, guilds: list[discord.Guild]) -> None:
+        self.voice_occupancy.clear()
+        self.voice_member_channels.clear()
+        for guild in guilds:
+            self.seed_voice_occupancy(guild)
+
+    def seed_voice_occupancy(self, guild: discord.Guild) -> None:
+        for channel in guild.voice_channels:
+            for member in channel.members:
+                if not member.bot:
+                    self._set_voice_occupancy(guild.id, member.id, channel.id)
+
+    def drop_voice_occupancy(self, guild_id: int) -> None:
+        for key in [key for key in self.voice_member_channels if key[0] == guild_id]:
+            self._set_voice_occupancy(guild_id, key[1], None)
+
+    def _set_voice_occupancy(self, guild_id: int, member_id: int, channel_id: int | None) -> None:
+        key = (int(guild_id), int(member_id))
+        previous = self.voice_member_channels.pop(key, None)
+        if previous is not None:
+            occupants = self.voice_occupancy.get(previous)
+            if occupants is not None:
+                occupants.discard(key[1])
+                if not occupants:
+                    self.voice_occupancy.pop(previous, None)
+        if channel_id is not None:
+            self.voice_member_channels[key] = int(channel_id)
+            self.voice_occupancy.setdefault(int(channel_id), set()).add(key[1])
 
     async def create_session_from_current_channel_state(
         self,
@@ -739,7 +2150,7 @@ class SessionManager:
             )
             if member.voice is not None:
                 participant.apply_voice_state(member.voice)
-            session.participants[participant.user_id] = participant
+            self._add_participant(session, participant)
             session.member_order.append(participant.user_id)
         return session
 
@@ -916,7 +2327,8 @@ class SessionManager:
         participant.accrue(now)
         participant.user_name = member.display_name
         participant.apply_voice_state(state)
-        await self._persist_and_broadcast(session)
+        self._journal_participant(session, participant, JOURNAL_VOICE)
+        await self._persist_and_broadcast(session, snapshot=False)
         await self._record_timeline_event(
             session,
             "member_mute_changed",
@@ -1061,6 +2473,8 @@ class SessionManager:
         session: LiveSession,
         embed: discord.Embed,
         view: discord.ui.View | None = None,
+        *,
+        propagate_http_errors: bool = False,
     ) -> discord.Message | None:
         channel = await self._resolve_notice_channel(session.guild_id, session.notice_channel_id)
         if channel is None:
@@ -1071,6 +2485,8 @@ class SessionManager:
         try:
             message = await channel.send(embed=embed, view=view)
         except Exception as exc:
+            if propagate_http_errors and isinstance(exc, discord.HTTPException):
+                raise
             print(f"[NOTICE ERROR] {exc}")
             self.logger.exception("通知送信に失敗しました: session_key=%s channel_id=%s", session.session_key, channel_id)
             return None
@@ -1152,13 +2568,8 @@ class SessionManager:
                 "payload": payload,
                 "read_at": None,
             }
-        await self.websocket_hub.broadcast(
-            f"guild:{scheduled.guild_id}",
-            "important_notification",
-            {"type": event_type, "notification": notification, "payload": payload},
-        )
-        await self.websocket_hub.broadcast(
-            "global",
+        await self.websocket_hub.publish(
+            [f"guild:{scheduled.guild_id}", "global"],
             "important_notification",
             {"type": event_type, "notification": notification, "payload": payload},
         )
@@ -1180,19 +2591,10 @@ class SessionManager:
                         target_ids.add(member.id)
             elif scheduled.mention_type in {"everyone", "here"}:
                 target_ids.update(member.id for member in guild.members if not member.bot)
-        for user_id in target_ids:
-            user: discord.User | discord.Member | None = self.bot.get_user(user_id)
-            if user is None and guild is not None:
-                user = guild.get_member(user_id)
-            if user is None:
-                try:
-                    user = await self.bot.fetch_user(user_id)
-                except (discord.Forbidden, discord.HTTPException, discord.NotFound):
-                    continue
-            try:
-                await user.send(embed=embed)
-            except (discord.Forbidden, discord.HTTPException):
-                self.logger.info("scheduled VC DM failed: scheduled_id=%s user=%s", scheduled.id, user_id)
+        try:
+            await self.direct_messages.enqueue(f"scheduled_vc:{scheduled.id}", "scheduled_vc", scheduled.guild_id, embed, sorted(target_ids))
+        except Exception:
+            self.logger.exception("scheduled VC DM enqueue failed: scheduled_id=%s", scheduled.id)
 
     async def _send_scheduled_vc_message(
         self,
@@ -1230,7 +2632,6 @@ class SessionManager:
                 user_name=scheduled.creator_user_name,
                 message=message,
                 payload={"scheduled_vc_id": str(scheduled.id)},
-                retention_days=await self._timeline_retention_days(),
             )
             await self.websocket_hub.broadcast(f"guild:{scheduled.guild_id}", "timeline_event", event)
         except Exception:
@@ -1260,7 +2661,6 @@ class SessionManager:
                 user_name=actor_name,
                 message=t("embed.web_vc_created.description", locale, channel=channel.name),
                 payload={"vc_type": vc_type},
-                retention_days=await self._timeline_retention_days(),
             )
             await self.websocket_hub.broadcast(f"guild:{guild.id}", "timeline_event", event)
         except Exception:
@@ -1309,8 +2709,7 @@ class SessionManager:
                 "read_at": None,
             }
         envelope = {"type": "web_vc_created", "notification": notification, "payload": payload}
-        for scope in {f"guild:{guild.id}", f"session:{channel.id}", "global"}:
-            await self.websocket_hub.broadcast(scope, "important_notification", envelope)
+        await self.websocket_hub.publish([f"guild:{guild.id}", f"session:{channel.id}", "global"], "important_notification", envelope)
 
     async def create_web_voice_channel(
         self,
@@ -1392,6 +2791,7 @@ class SessionManager:
             )
             if scheduled.id is not None:
                 await self.config_repo.update_scheduled_vc_start_result(scheduled.id, channel_id=channel.id, status="active")
+                self.track_scheduled_vc(scheduled)
 
         embed = build_embed(
             config.guild_language,
@@ -1460,7 +2860,7 @@ class SessionManager:
         if next_range is None:
             return
         next_start, next_end = next_range
-        await self.config_repo.create_scheduled_vc(
+        next_scheduled = await self.config_repo.create_scheduled_vc(
             ScheduledVC(
                 id=None,
                 guild_id=scheduled.guild_id,
@@ -1480,6 +2880,7 @@ class SessionManager:
                 repeat_weekdays=scheduled.repeat_weekdays.copy(),
             )
         )
+        self.track_scheduled_vc(next_scheduled)
 
     async def _start_scheduled_vc(self, scheduled: ScheduledVC) -> None:
         if scheduled.id is None:
@@ -1488,14 +2889,14 @@ class SessionManager:
         locale = config.guild_language if config else None
         guild = self._resolve_guild(scheduled.guild_id)
         if guild is None:
-            await self.config_repo.update_scheduled_vc_status(scheduled.id, "failed")
+            await self._set_scheduled_vc_status(scheduled, "failed")
             await self._publish_scheduled_vc_notification(
                 "error", t("scheduled.error.createTitle", locale), t("scheduled.error.guildNotFound", locale), scheduled
             )
             return
         category = guild.get_channel(scheduled.category_id) if scheduled.category_id is not None else None
         if scheduled.category_id is not None and not isinstance(category, discord.CategoryChannel):
-            await self.config_repo.update_scheduled_vc_status(scheduled.id, "failed")
+            await self._set_scheduled_vc_status(scheduled, "failed")
             await self._publish_scheduled_vc_notification(
                 "error", t("scheduled.error.createTitle", locale), t("scheduled.error.categoryUnavailable", locale), scheduled
             )
@@ -1510,14 +2911,14 @@ class SessionManager:
                 create_kwargs["bitrate"] = scheduled.bitrate
             channel = await guild.create_voice_channel(scheduled.vc_name, **create_kwargs)
         except discord.Forbidden:
-            await self.config_repo.update_scheduled_vc_status(scheduled.id, "failed")
+            await self._set_scheduled_vc_status(scheduled, "failed")
             await self._publish_scheduled_vc_notification(
                 "permission_denied", t("scheduled.error.permissionTitle", locale), t("scheduled.error.createPermission", locale), scheduled
             )
             return
         except discord.HTTPException:
             self.logger.exception("scheduled VC create failed: scheduled_id=%s", scheduled.id)
-            await self.config_repo.update_scheduled_vc_status(scheduled.id, "failed")
+            await self._set_scheduled_vc_status(scheduled, "failed")
             await self._publish_scheduled_vc_notification(
                 "error", t("scheduled.error.createTitle", locale), t("scheduled.error.createFailed", locale), scheduled
             )
@@ -1526,6 +2927,10 @@ class SessionManager:
         self.auto_personal_root_channels.discard(channel.id)
         status = "active" if scheduled.end_at is not None else "completed"
         await self.config_repo.update_scheduled_vc_start_result(scheduled.id, channel_id=channel.id, status=status)
+        scheduled.status = status
+        scheduled.created_channel_id = channel.id
+        scheduled.pre_notice_15_sent = scheduled.pre_notice_5_sent = scheduled.pre_notice_3_sent = False
+        self.track_scheduled_vc(scheduled)
         if scheduled.repeat_mode != "none":
             await self._create_next_scheduled_occurrence(scheduled)
 
@@ -1555,29 +2960,45 @@ class SessionManager:
             channel_id=channel.id,
         )
 
-    async def _process_active_scheduled_vc(self, scheduled: ScheduledVC, now: datetime) -> None:
+    async def _set_scheduled_vc_status(self, scheduled: ScheduledVC, status: str) -> None:
+        if scheduled.id is None:
+            return
+        await self.config_repo.update_scheduled_vc_status(scheduled.id, status)
+        scheduled.status = status
+        self.track_scheduled_vc(scheduled)
+
+    async def _send_scheduled_vc_pre_notice(self, scheduled: ScheduledVC, minutes: int, now: datetime) -> None:
         if scheduled.id is None or scheduled.end_at is None or scheduled.created_channel_id is None:
             return
-        config = self.guild_configs.get(scheduled.guild_id)
-        locale = config.guild_language if config else None
         channel = self._resolve_voice_channel(scheduled.created_channel_id)
         if channel is None:
-            await self.config_repo.update_scheduled_vc_status(scheduled.id, "completed")
+            await self._set_scheduled_vc_status(scheduled, "completed")
             return
         remaining = int((scheduled.end_at - now).total_seconds())
-        for minutes, already_sent in ((15, scheduled.pre_notice_15_sent), (5, scheduled.pre_notice_5_sent), (3, scheduled.pre_notice_3_sent)):
-            if not already_sent and 0 < remaining <= minutes * 60:
-                embed = build_embed(
-                    locale,
-                    "embed.scheduled_vc_ending.title",
-                    "embed.scheduled_vc_ending.description",
-                    color=COLOR_WARNING,
-                    title_fmt={"minutes": minutes},
-                    description_fmt={"name": scheduled.vc_name},
-                )
-                await self._send_embed(channel, embed)
-                await self.config_repo.mark_scheduled_vc_pre_notice(scheduled.id, minutes)
-        if remaining > 0:
+        if not 0 < remaining <= minutes * 60:
+            return
+        config = self.guild_configs.get(scheduled.guild_id)
+        locale = config.guild_language if config else None
+        embed = build_embed(
+            locale,
+            "embed.scheduled_vc_ending.title",
+            "embed.scheduled_vc_ending.description",
+            color=COLOR_WARNING,
+            title_fmt={"minutes": minutes},
+            description_fmt={"name": scheduled.vc_name},
+        )
+        await self._send_embed(channel, embed)
+        await self.config_repo.mark_scheduled_vc_pre_notice(scheduled.id, minutes)
+        setattr(scheduled, f"pre_notice_{minutes}_sent", True)
+
+    async def _finish_scheduled_vc(self, scheduled: ScheduledVC) -> None:
+        if scheduled.id is None or scheduled.end_at is None or scheduled.created_channel_id is None:
+            return
+        config = self.guild_configs.get(scheduled.guild_id)
+        locale = config.guild_language if config else None
+        channel = self._resolve_voice_channel(scheduled.created_channel_id)
+        if channel is None:
+            await self._set_scheduled_vc_status(scheduled, "completed")
             return
         session = self.sessions.get(channel.id)
         if session is not None:
@@ -1588,14 +3009,16 @@ class SessionManager:
             await self._publish_scheduled_vc_notification(
                 "permission_denied", t("scheduled.error.permissionTitle", locale), t("scheduled.error.deletePermission", locale), scheduled, channel_id=channel.id
             )
+            self._retry_scheduled_vc_timer(scheduled, "end")
             return
         except discord.HTTPException:
             self.logger.exception("scheduled VC delete failed: scheduled_id=%s", scheduled.id)
             await self._publish_scheduled_vc_notification(
                 "error", t("scheduled.error.deleteTitle", locale), t("scheduled.error.deleteFailed", locale), scheduled, channel_id=channel.id
             )
+            self._retry_scheduled_vc_timer(scheduled, "end")
             return
-        await self.config_repo.update_scheduled_vc_status(scheduled.id, "completed")
+        await self._set_scheduled_vc_status(scheduled, "completed")
         await self._publish_scheduled_vc_notification(
             "scheduled_vc_ended",
             t("scheduled.notif.endedTitle", locale),
@@ -1628,6 +3051,8 @@ class SessionManager:
                 except discord.HTTPException:
                     self.logger.exception("予約VCキャンセル時のチャンネル削除に失敗: scheduled_id=%s", scheduled.id)
         await self.config_repo.delete_scheduled_vc(scheduled.id)
+        self.untrack_scheduled_vc(scheduled.id)
+        self.scheduled_vc_wakeup.set()
 
     async def _start_session(
         self,
@@ -1672,22 +3097,24 @@ class SessionManager:
                 current_team=session.team_assignments.get(member.id),
             )
             participant.apply_voice_state(voice_state)
-            session.participants[member.id] = participant
+            self._add_participant(session, participant)
             session.member_order.append(member.id)
+            self._journal_participant(session, participant, JOURNAL_JOIN)
         locale = config.guild_language
         start_embed = self._build_start_embed(session, starter, management_url, locale)
         start_view = self._build_management_link_view(management_url)
-        await self._send_embed(channel, start_embed, view=start_view)
+        self._queue_embed(channel, start_embed, view=start_view, priority=OUTBOX_PRIORITY_HIGH)
         from vc_control.team_ui import TeamPanelView
 
-        await self._send_embed(
+        self._queue_embed(
             channel,
             self._build_management_panel_embed(session, management_url, locale),
             view=TeamPanelView(self, session.root_channel_id, management_url=management_url),
+            priority=OUTBOX_PRIORITY_HIGH,
         )
-        await self._send_notification_message(session, start_embed, view=start_view)
+        self._queue_notification_message(session, start_embed, view=start_view)
         if not suppressed:
-            await self._send_embed(
+            self._queue_embed(
                 channel,
                 build_embed(
                     locale,
@@ -1746,18 +3173,19 @@ class SessionManager:
                 current_channel_id=channel.id,
                 current_team=session.team_assignments.get(member.id),
             )
-            session.participants[member.id] = participant
+            self._add_participant(session, participant)
             session.member_order.append(member.id)
         else:
             participant.accrue(now)
             participant.user_name = member.display_name
-            participant.current_channel_id = channel.id
+            self._set_participant_channel(session, participant, channel.id)
             participant.last_transition_at = now
         participant.apply_voice_state(state)
+        self._journal_participant(session, participant, JOURNAL_JOIN)
         await self._cancel_empty_cleanup(channel)
         if not suppressed:
             config = self.guild_configs.get(session.guild_id)
-            await self._send_embed(
+            self._queue_embed(
                 channel,
                 build_embed(
                     config.guild_language if config else None,
@@ -1767,7 +3195,7 @@ class SessionManager:
                     description_fmt={"mention": member.mention},
                 ),
             )
-        await self._persist_and_broadcast(session)
+        await self._persist_and_broadcast(session, snapshot=False)
         await self._record_timeline_event(
             session,
             "member_joined",
@@ -1795,14 +3223,15 @@ class SessionManager:
             return
         now = utcnow()
         participant.accrue(now)
-        participant.current_channel_id = None
+        self._set_participant_channel(session, participant, None)
         participant.user_name = member.display_name
         participant.apply_voice_state(None)
+        self._journal_participant(session, participant, JOURNAL_LEAVE)
 
         config = self.guild_configs.get(session.guild_id)
         locale = config.guild_language if config else None
         if not suppressed:
-            await self._send_embed(
+            self._queue_embed(
                 channel,
                 build_embed(
                     locale,
@@ -1814,11 +3243,12 @@ class SessionManager:
             )
 
         active_users = session.active_participants()
-        if session.owner_user_id == member.id and active_users:
+        owner_changed = session.owner_user_id == member.id and bool(active_users)
+        if owner_changed:
             next_owner = active_users[0]
             session.owner_user_id = next_owner.user_id
             session.owner_user_name = next_owner.user_name
-            await self._send_embed(
+            self._queue_embed(
                 self._resolve_voice_channel(session.root_channel_id),
                 build_embed(
                     locale,
@@ -1827,6 +3257,8 @@ class SessionManager:
                     color=COLOR_WARNING,
                     description_fmt={"mention": f"<@{next_owner.user_id}>"},
                 ),
+                priority=OUTBOX_PRIORITY_HIGH,
+                coalesce_key=("owner_changed", session.session_id),
             )
 
         if not session.active_participants():
@@ -1840,7 +3272,7 @@ class SessionManager:
             await self._end_session(session)
             return
 
-        await self._persist_and_broadcast(session)
+        await self._persist_and_broadcast(session, snapshot=owner_changed)
         await self._record_timeline_event(
             session,
             "member_left",
@@ -1870,9 +3302,10 @@ class SessionManager:
             return
         now = utcnow()
         participant.accrue(now)
-        participant.current_channel_id = after_channel.id
+        self._set_participant_channel(session, participant, after_channel.id)
         participant.user_name = member.display_name
         participant.apply_voice_state(after_state)
+        self._journal_participant(session, participant, JOURNAL_MOVE)
         await self._cancel_empty_cleanup(after_channel)
         if not before_channel.members:
             await self._schedule_empty_cleanup(before_channel)
@@ -1893,9 +3326,9 @@ class SessionManager:
                 color=COLOR_SUCCESS,
                 description_fmt={"mention": member.mention, "channel": after_channel.name},
             )
-            await self._send_embed(before_channel, leave_embed)
-            await self._send_embed(after_channel, join_embed)
-        await self._persist_and_broadcast(session)
+            self._queue_embed(before_channel, leave_embed)
+            self._queue_embed(after_channel, join_embed)
+        await self._persist_and_broadcast(session, snapshot=False)
         await self._record_timeline_event(
             session,
             "member_moved",
@@ -1937,6 +3370,7 @@ class SessionManager:
             members.append(member)
             total_talk += participant.talk_seconds
             total_afk += participant.afk_seconds
+        session.touch()
         completed = CompletedSession(
             session_id=session.session_id,
             guild_id=session.guild_id,
@@ -1957,7 +3391,7 @@ class SessionManager:
         except Exception:
             self.logger.exception("統計保存に失敗しました: session_key=%s", session.session_key)
         try:
-            await self.config_repo.delete_session_snapshot(session.session_id)
+            await self._delete_session_snapshot(session.session_id)
         except Exception:
             self.logger.exception("セッションスナップショット削除に失敗しました: session_key=%s", session.session_key)
         await self._delete_notification_message(session)
@@ -1979,11 +3413,13 @@ class SessionManager:
             session,
             extra_payload={"total_talk_seconds": total_talk, "total_afk_seconds": total_afk},
         )
-        await self._send_embed(self._resolve_voice_channel(session.root_channel_id), end_embed)
+        self._queue_embed(self._resolve_voice_channel(session.root_channel_id), end_embed)
         self._unregister_session(session)
         await self._broadcast_global_state()
 
     async def handle_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        for member_id in list(self.voice_occupancy.get(channel.id, ())):
+            self._set_voice_occupancy(channel.guild.id, member_id, None)
         if not isinstance(channel, discord.VoiceChannel):
             return
         root_id = self.channel_to_root.get(channel.id)
@@ -1995,7 +3431,7 @@ class SessionManager:
         if channel.id == session.root_channel_id:
             self._cancel_solo_cleanup_by_channel_id(channel.id)
             self._unregister_session(session)
-            await self.config_repo.delete_session_snapshot(session.session_id)
+            await self._delete_session_snapshot(session.session_id)
         else:
             for team_name, team_channel_id in list(session.team_channels.items()):
                 if team_channel_id == channel.id:
@@ -2079,6 +3515,9 @@ class SessionManager:
         return self.get_session_by_root(root_id)
 
     async def is_guild_admin(self, guild_id: int, user_id: int) -> bool:
+        cached = self.guild_admin_cache.get(guild_id, {}).get(user_id)
+        if cached is not None:
+            return cached
         if self.bot is None:
             return False
         guild = self.bot.get_guild(guild_id)
@@ -2087,100 +3526,211 @@ class SessionManager:
         member = guild.get_member(user_id)
         if member is None:
             return False
-        return member.guild_permissions.manage_guild or member.guild_permissions.administrator
+        is_admin = member.guild_permissions.manage_guild or member.guild_permissions.administrator
+        self.guild_admin_cache.setdefault(guild_id, {})[user_id] = is_admin
+        return is_admin
+
+    def invalidate_member_permissions(self, guild_id: int, user_id: int) -> None:
+        cache = self.guild_admin_cache.get(guild_id)
+        if cache is not None:
+            cache.pop(user_id, None)
+        self.user_admin_guilds.pop(user_id, None)
+
+    def invalidate_guild_permissions(self, guild_id: int) -> None:
+        self.guild_admin_cache.pop(guild_id, None)
+        self.user_admin_guilds.clear()
+
+    async def _admin_guild_ids(self, user_id: int) -> set[int]:
+        admin_guilds = self.user_admin_guilds.get(user_id)
+        if admin_guilds is None:
+            guild_ids = list(self.guild_session_roots)
+            admin_guilds = {guild_id for guild_id in guild_ids if await self.is_guild_admin(guild_id, user_id)}
+            if all(user_id in self.guild_admin_cache.get(guild_id, {}) for guild_id in guild_ids):
+                self.user_admin_guilds[user_id] = admin_guilds
+        return admin_guilds
+
+    def _is_session_viewer(self, session: LiveSession, user_id: int) -> bool:
+        if user_id == session.starter_user_id or user_id == session.panel_creator_id:
+            return True
+        if session.access_mode == "invite":
+            return str(user_id) in session.invited_user_ids
+        if session.access_mode == "role":
+            return False
+        participant = session.participants.get(user_id)
+        return participant is not None and participant.current_channel_id is not None
+
+    def _session_viewer_ids(self, session: LiveSession) -> set[int]:
+        candidates = {session.starter_user_id, *session.participants}
+        if session.panel_creator_id is not None:
+            candidates.add(session.panel_creator_id)
+        if session.access_mode == "invite":
+            candidates.update(int(user_id) for user_id in session.invited_user_ids if str(user_id).isdigit())
+        return {user_id for user_id in candidates if self._is_session_viewer(session, user_id)}
+
+    def _index_session_visibility(self, session: LiveSession, *, remove: bool = False) -> None:
+        root_id = session.root_channel_id
+        if remove:
+            guild_roots = self.guild_session_roots.get(session.guild_id)
+            if guild_roots is not None:
+                guild_roots.discard(root_id)
+                if not guild_roots:
+                    self.guild_session_roots.pop(session.guild_id, None)
+        else:
+            if session.guild_id not in self.guild_session_roots:
+                self.user_admin_guilds.clear()
+            self.guild_session_roots.setdefault(session.guild_id, set()).add(root_id)
+        viewers = set() if remove else self._session_viewer_ids(session)
+        previous = self.session_viewers.get(root_id, set())
+        for user_id in previous - viewers:
+            self._set_session_viewer(root_id, user_id, False)
+        for user_id in viewers - previous:
+            self._set_session_viewer(root_id, user_id, True)
+        roles = set() if remove or session.access_mode != "role" else {int(role_id) for role_id in session.access_role_ids if str(role_id).isdigit()}
+        guild_id, previous_roles = self.session_roles.pop(root_id, (session.guild_id, set()))
+        guild_index = self.role_session_roots.get(guild_id, {})
+        for role_id in previous_roles:
+            role_roots = guild_index.get(role_id)
+            if role_roots is not None:
+                role_roots.discard(root_id)
+                if not role_roots:
+                    guild_index.pop(role_id, None)
+        if not guild_index:
+            self.role_session_roots.pop(guild_id, None)
+        if roles:
+            self.session_roles[root_id] = (session.guild_id, roles)
+            guild_index = self.role_session_roots.setdefault(session.guild_id, {})
+            for role_id in roles:
+                guild_index.setdefault(role_id, set()).add(root_id)
+
+    def _index_session_viewer(self, session: LiveSession, user_id: int) -> None:
+        if self._is_registered_session(session):
+            self._set_session_viewer(session.root_channel_id, user_id, self._is_session_viewer(session, user_id))
+
+    def _set_session_viewer(self, root_id: int, user_id: int, visible: bool) -> None:
+        if visible:
+            self.session_viewers.setdefault(root_id, set()).add(user_id)
+            self.visible_sessions_by_user.setdefault(user_id, set()).add(root_id)
+            return
+        viewers = self.session_viewers.get(root_id)
+        if viewers is not None:
+            viewers.discard(user_id)
+            if not viewers:
+                self.session_viewers.pop(root_id, None)
+        roots = self.visible_sessions_by_user.get(user_id)
+        if roots is not None:
+            roots.discard(root_id)
+            if not roots:
+                self.visible_sessions_by_user.pop(user_id, None)
+
+    async def visible_session_roots(self, user_id: int) -> set[int]:
+        roots = set(self.visible_sessions_by_user.get(user_id, ()))
+        admin_guilds = await self._admin_guild_ids(user_id)
+        for guild_id in admin_guilds:
+            roots.update(self.guild_session_roots.get(guild_id, ()))
+        for guild_id, role_index in self.role_session_roots.items():
+            if guild_id in admin_guilds:
+                continue
+            guild = self._resolve_guild(guild_id)
+            member = guild.get_member(user_id) if guild is not None else None
+            if member is None:
+                continue
+            for role in member.roles:
+                roots.update(role_index.get(role.id, ()))
+        return roots
 
     async def can_view_session(self, session: LiveSession, user_id: int) -> bool:
         if await self.is_guild_admin(session.guild_id, user_id):
             return True
-        if session.starter_user_id == user_id:
-            return True
-        if session.access_mode == "invite" and str(user_id) in session.invited_user_ids:
+        if self._is_registered_session(session):
+            if user_id in self.session_viewers.get(session.root_channel_id, ()):
+                return True
+        elif self._is_session_viewer(session, user_id):
             return True
         if session.access_mode == "role":
             guild = self._resolve_guild(session.guild_id)
             member = guild.get_member(user_id) if guild is not None else None
             if member is not None and any(str(role.id) in session.access_role_ids for role in member.roles):
                 return True
-        if session.panel_creator_id == user_id:
-            return True
-        if session.access_mode in {"invite", "role"}:
-            return False
-        participant = session.participants.get(user_id)
-        return participant is not None and participant.current_channel_id is not None
+        return False
 
     async def can_edit_session(self, session: LiveSession, user_id: int) -> bool:
         if session.starter_user_id == user_id:
             return True
         return await self.is_guild_admin(session.guild_id, user_id)
 
+    def _desired_access_overwrites(
+        self,
+        session: LiveSession,
+        guild: discord.Guild,
+    ) -> dict[int, tuple[discord.Role | discord.Member, discord.PermissionOverwrite | None]]:
+        desired: dict[int, tuple[discord.Role | discord.Member, discord.PermissionOverwrite | None]] = {}
+        invited_members = [
+            member
+            for member in (guild.get_member(int(user_id)) if str(user_id).isdigit() else None for user_id in session.invited_user_ids)
+            if member is not None
+        ]
+        access_roles = [
+            role
+            for role in (guild.get_role(int(role_id)) if str(role_id).isdigit() else None for role_id in session.access_role_ids)
+            if role is not None
+        ]
+        default_role = guild.default_role
+        if session.access_mode == "public":
+            desired[default_role.id] = (default_role, None)
+            for member in invited_members:
+                desired[member.id] = (member, None)
+            for role in access_roles:
+                desired[role.id] = (role, None)
+            return desired
+
+        desired[default_role.id] = (default_role, discord.PermissionOverwrite(view_channel=False, connect=False))
+        if session.access_mode == "invite":
+            for member in invited_members:
+                desired[member.id] = (member, discord.PermissionOverwrite(view_channel=True, connect=True))
+            for role in access_roles:
+                desired[role.id] = (role, None)
+        if session.access_mode == "role":
+            for role in access_roles:
+                desired[role.id] = (role, discord.PermissionOverwrite(view_channel=True, connect=True))
+            for member in invited_members:
+                if member.id != session.starter_user_id:
+                    desired[member.id] = (member, None)
+        starter = guild.get_member(session.starter_user_id)
+        if starter is not None:
+            desired[starter.id] = (starter, discord.PermissionOverwrite(view_channel=True, connect=True))
+        bot_member = guild.me
+        if bot_member is not None:
+            desired[bot_member.id] = (
+                bot_member,
+                discord.PermissionOverwrite(view_channel=True, connect=True, manage_channels=True, send_messages=True),
+            )
+        return desired
+
     async def _apply_access_overwrites(self, session: LiveSession) -> None:
         guild = self._resolve_guild(session.guild_id)
         if guild is None:
             return
-        channel_ids = [session.root_channel_id, *session.team_channels.values()]
-        default_role = guild.default_role
-        bot_member = guild.me
-        for channel_id in channel_ids:
+        desired = self._desired_access_overwrites(session, guild)
+        reason = {
+            "public": "VCアクセスを公開に設定",
+            "invite": "VC招待アクセスを更新",
+            "role": "VCロールアクセスを更新",
+        }.get(session.access_mode, "VCアクセスを制限")
+        for channel_id in [session.root_channel_id, *session.team_channels.values()]:
             channel = self._resolve_voice_channel(channel_id)
             if channel is None:
                 continue
+            current = {target.id: (target, overwrite) for target, overwrite in channel.overwrites.items()}
+            merged = dict(current)
+            for target_id, (target, overwrite) in desired.items():
+                if overwrite is None:
+                    merged.pop(target_id, None)
+                else:
+                    merged[target_id] = (current[target_id][0] if target_id in current else target, overwrite)
+            if merged.keys() == current.keys() and all(merged[target_id][1] == current[target_id][1] for target_id in merged):
+                continue
             try:
-                if session.access_mode == "public":
-                    await channel.set_permissions(default_role, overwrite=None, reason="VCアクセスを公開に設定")
-                    for user_id in session.invited_user_ids:
-                        member = guild.get_member(int(user_id)) if str(user_id).isdigit() else None
-                        if member is not None:
-                            await channel.set_permissions(member, overwrite=None, reason="VCアクセスを公開に設定")
-                    for role_id in session.access_role_ids:
-                        role = guild.get_role(int(role_id)) if str(role_id).isdigit() else None
-                        if role is not None:
-                            await channel.set_permissions(role, overwrite=None, reason="VCアクセスを公開に設定")
-                    continue
-
-                await channel.set_permissions(
-                    default_role,
-                    overwrite=discord.PermissionOverwrite(view_channel=False, connect=False),
-                    reason="VCアクセスを制限",
-                )
-                if bot_member is not None:
-                    await channel.set_permissions(
-                        bot_member,
-                        overwrite=discord.PermissionOverwrite(view_channel=True, connect=True, manage_channels=True, send_messages=True),
-                        reason="VCアクセスを制限",
-                    )
-                starter = guild.get_member(session.starter_user_id)
-                if starter is not None:
-                    await channel.set_permissions(
-                        starter,
-                        overwrite=discord.PermissionOverwrite(view_channel=True, connect=True),
-                        reason="VCアクセスを制限",
-                    )
-                if session.access_mode == "invite":
-                    for user_id in session.invited_user_ids:
-                        member = guild.get_member(int(user_id)) if str(user_id).isdigit() else None
-                        if member is not None:
-                            await channel.set_permissions(
-                                member,
-                                overwrite=discord.PermissionOverwrite(view_channel=True, connect=True),
-                                reason="VC招待アクセスを更新",
-                            )
-                    for role_id in session.access_role_ids:
-                        role = guild.get_role(int(role_id)) if str(role_id).isdigit() else None
-                        if role is not None:
-                            await channel.set_permissions(role, overwrite=None, reason="VC招待アクセスを更新")
-                if session.access_mode == "role":
-                    for role_id in session.access_role_ids:
-                        role = guild.get_role(int(role_id)) if str(role_id).isdigit() else None
-                        if role is not None:
-                            await channel.set_permissions(
-                                role,
-                                overwrite=discord.PermissionOverwrite(view_channel=True, connect=True),
-                                reason="VCロールアクセスを更新",
-                            )
-                    for user_id in session.invited_user_ids:
-                        member = guild.get_member(int(user_id)) if str(user_id).isdigit() else None
-                        if member is not None and member.id != session.starter_user_id:
-                            await channel.set_permissions(member, overwrite=None, reason="VCロールアクセスを更新")
+                await channel.edit(overwrites={target: overwrite for target, overwrite in merged.values()}, reason=reason)
             except discord.Forbidden:
                 self.logger.exception("VC access permission update denied: session_key=%s channel_id=%s", session.session_key, channel_id)
                 raise PermissionError("Botにチャンネル権限を更新する権限がありません。")
@@ -2341,17 +3891,26 @@ class SessionManager:
             raise ValueError(t("msg.channelUnresolvable", locale))
         moved_messages: list[str] = []
         async with session.lock:
+            teams: list[tuple[str, list[LiveParticipant]]] = []
             for team_name in session.team_names:
                 team_members = [
                     participant
                     for participant in session.active_participants()
                     if session.team_assignments.get(participant.user_id) == team_name
                 ]
-                if not team_members:
-                    continue
-                team_channel = await self._ensure_team_channel(root_channel, session, team_name)
+                if team_members:
+                    teams.append((team_name, team_members))
+            team_channels = await asyncio.gather(
+                *(self._ensure_team_channel(root_channel, session, team_name, apply_overwrites=False) for team_name, _ in teams)
+            )
+            if any(team_channel is not None for team_channel in team_channels):
+                await self._apply_access_overwrites(session)
+            moves: list[tuple[discord.Member, discord.VoiceChannel]] = []
+            resolved_teams: list[tuple[str, list[LiveParticipant], discord.VoiceChannel]] = []
+            for (team_name, team_members), team_channel in zip(teams, team_channels):
                 if team_channel is None:
                     continue
+                resolved_teams.append((team_name, team_members, team_channel))
                 await self._cancel_empty_cleanup(team_channel)
                 for participant in team_members:
                     member = guild.get_member(participant.user_id)
@@ -2360,15 +3919,12 @@ class SessionManager:
                     if member.voice.channel.id == team_channel.id:
                         continue
                     self._mark_system_move(participant.user_id, member.voice.channel.id, team_channel.id, "team_split")
-                    try:
-                        await member.move_to(team_channel, reason="チーム分割")
-                    except discord.Forbidden:
-                        self.logger.exception("チームVCへの移動権限がありません")
-                    except discord.HTTPException:
-                        self.logger.exception("チームVCへの移動に失敗しました")
+                    moves.append((member, team_channel))
+            report = await self.member_moves.move_members(guild.id, moves, reason="チーム分割")
+            for team_name, team_members, team_channel in resolved_teams:
                 names = ", ".join(f"<@{participant.user_id}>" for participant in team_members)
                 moved_messages.append(f"{team_name}: {names}")
-                await self._send_embed(
+                self._queue_embed(
                     team_channel,
                     build_embed(
                         locale,
@@ -2379,7 +3935,7 @@ class SessionManager:
                     ),
                 )
             if moved_messages:
-                await self._send_embed(
+                self._queue_embed(
                     root_channel,
                     discord.Embed(
                         title=t("embed.teams_split.title", locale),
@@ -2395,9 +3951,13 @@ class SessionManager:
                 "チームを分割しました。",
                 user_id=actor_id,
                 user_name=actor.display_name if actor is not None else str(actor_id),
-                payload={"messages": moved_messages},
+                payload={"messages": moved_messages, "moves": report.to_payload()},
+            )
+            await self._publish_session_event(
+                session,
+                "teams_split",
+                {"messages": moved_messages, "moves": report.to_payload(), "results": [result.to_payload() for result in report.results]},
             )
-            await self._publish_session_event(session, "teams_split", {"messages": moved_messages})
         return moved_messages
 
     async def assemble_teams(self, root_channel_id: int, actor_id: int) -> list[str]:
@@ -2412,8 +3972,8 @@ class SessionManager:
         root_channel = self._resolve_voice_channel(session.root_channel_id)
         if guild is None or root_channel is None:
             raise ValueError(t("msg.channelUnresolvable", locale))
-        moved_users: list[str] = []
         async with session.lock:
+            moves: list[tuple[discord.Member, discord.VoiceChannel]] = []
             for participant in session.active_participants():
                 if participant.current_channel_id == root_channel.id:
                     continue
@@ -2421,15 +3981,11 @@ class SessionManager:
                 if member is None or member.voice is None or member.voice.channel is None:
                     continue
                 self._mark_system_move(participant.user_id, member.voice.channel.id, root_channel.id, "team_collect")
-                try:
-                    await member.move_to(root_channel, reason="チーム集合")
-                    moved_users.append(f"<@{participant.user_id}>")
-                except discord.Forbidden:
-                    self.logger.exception("集合時の移動権限がありません")
-                except discord.HTTPException:
-                    self.logger.exception("集合時の移動に失敗しました")
+                moves.append((member, root_channel))
+            report = await self.member_moves.move_members(guild.id, moves, reason="チーム集合")
+            moved_users = [f"<@{user_id}>" for user_id in report.moved_user_ids()]
             if moved_users:
-                await self._send_embed(
+                self._queue_embed(
                     root_channel,
                     build_embed(
                         locale,
@@ -2444,9 +4000,13 @@ class SessionManager:
                 session,
                 "teams_assembled",
                 "チームが集合しました。",
-                payload={"users": moved_users},
+                payload={"users": moved_users, "moves": report.to_payload()},
+            )
+            await self._publish_session_event(
+                session,
+                "teams_assembled",
+                {"users": moved_users, "moves": report.to_payload(), "results": [result.to_payload() for result in report.results]},
             )
-            await self._publish_session_event(session, "teams_assembled", {"users": moved_users})
         return moved_users
 
     async def recall_member(self, root_channel_id: int, actor_id: int, target_user_id: int) -> str:
@@ -2565,47 +4125,68 @@ class SessionManager:
     def list_sessions(self) -> list[LiveSession]:
         return list(self.sessions.values())
 
-    async def list_accessible_sessions(self, user_id: int, admin_only: bool = False) -> list[dict[str, Any]]:
+    async def list_accessible_session_summaries(self, user_id: int) -> list[dict[str, Any]]:
         result: list[dict[str, Any]] = []
-        for session in self.sessions.values():
-            is_admin = await self.is_guild_admin(session.guild_id, user_id)
-            if admin_only and not is_admin:
+        for root_id in await self.visible_session_roots(user_id):
+            session = self.sessions.get(root_id)
+            if session is None:
                 continue
-            if admin_only or await self.can_view_session(session, user_id):
-                payload = session.to_payload()
-                payload["can_edit"] = await self.can_edit_session(session, user_id)
-                result.append(payload)
+            summary = dict(session.cached_summary())
+            summary["can_edit"] = await self.can_edit_session(session, user_id)
+            result.append(summary)
         result.sort(key=lambda item: item["started_at"], reverse=True)
         return result
 
     async def update_presence(self) -> None:
         if self.bot is None or self.bot.user is None:
             return
-        count = sum(1 for session in self.sessions.values() for participant in session.active_participants())
+        count = self.active_participant_count
         name = "通話はされていません。" if count == 0 else f"{count}人が通話中"
-        try:
-            await self.bot.change_presence(activity=discord.CustomActivity(name=name))
-        except discord.HTTPException:
-            self.logger.exception("プレゼンス更新に失敗しました")
+        self.presence.publish(self.bot, name)
+
+    def _is_registered_session(self, session: LiveSession) -> bool:
+        return self.sessions_by_key.get(session.session_key) is session
+
+    def _set_participant_channel(self, session: LiveSession, participant: LiveParticipant, channel_id: int | None) -> None:
+        delta = (channel_id is not None) - (participant.current_channel_id is not None)
+        participant.current_channel_id = channel_id
+        session.touch()
+        if delta and self._is_registered_session(session):
+            self.active_participant_count += delta
+            self._index_session_viewer(session, participant.user_id)
+
+    def _add_participant(self, session: LiveSession, participant: LiveParticipant) -> None:
+        previous = session.participants.get(participant.user_id)
+        session.participants[participant.user_id] = participant
+        session.touch()
+        if self._is_registered_session(session):
+            self.active_participant_count += (participant.current_channel_id is not None) - (
+                previous is not None and previous.current_channel_id is not None
+            )
+            self._index_session_viewer(session, participant.user_id)
 
     async def _ensure_team_channel(
         self,
         root_channel: discord.VoiceChannel,
         session: LiveSession,
         team_name: str,
+        *,
+        apply_overwrites: bool = True,
     ) -> discord.VoiceChannel | None:
         existing_id = session.team_channels.get(team_name)
         if existing_id:
             existing = self._resolve_voice_channel(existing_id)
             if existing is not None:
-                await self._apply_access_overwrites(session)
+                if apply_overwrites:
+                    await self._apply_access_overwrites(session)
                 return existing
         target_name = f"{root_channel.name}-{team_name}"
         for channel in root_channel.category.voice_channels if root_channel.category else []:
             if channel.name == target_name:
                 session.team_channels[team_name] = channel.id
                 self.channel_to_root[channel.id] = session.root_channel_id
-                await self._apply_access_overwrites(session)
+                if apply_overwrites:
+                    await self._apply_access_overwrites(session)
                 return channel
         try:
             created = await root_channel.guild.create_voice_channel(
@@ -2621,7 +4202,8 @@ class SessionManager:
             return None
         session.team_channels[team_name] = created.id
         self.channel_to_root[created.id] = session.root_channel_id
-        await self._apply_access_overwrites(session)
+        if apply_overwrites:
+            await self._apply_access_overwrites(session)
         return created
 
     def _solo_cleanup_mode(self, config: GuildConfig) -> str:
@@ -2664,76 +4246,78 @@ class SessionManager:
         if member is None:
             self._cancel_solo_cleanup_by_channel_id(session.root_channel_id)
             return
-        if session.root_channel_id in self.solo_cleanup_tasks:
+        entry = self.solo_cleanups.get(session.root_channel_id)
+        if entry is None:
+            self._schedule_solo_cleanup(session, config)
             return
-        self._schedule_solo_cleanup(session, config)
+        entry.session_key = session.session_key
+        if entry.stage == "notice":
+            notice_at = entry.started_at + timedelta(seconds=max(60, int(config.solo_notice_after_sec)))
+            if notice_at != entry.due_at:
+                self._arm_cleanup_deadline(entry, "notice", notice_at)
 
     def _schedule_solo_cleanup(self, session: LiveSession, config: GuildConfig) -> None:
         root_channel_id = session.root_channel_id
-        mode = self._solo_cleanup_mode(config)
-        notice_after = max(60, int(config.solo_notice_after_sec))
-        warning_after = max(60, int(config.solo_delete_warning_after_sec))
-        repeat_after = max(300, int(config.solo_repeat_notice_sec))
-        session_key = session.session_key
+        now = utcnow()
+        restored = self.restored_solo_deadlines.pop(root_channel_id, None)
+        entry = CleanupDeadline(
+            kind="solo",
+            channel_id=root_channel_id,
+            guild_id=session.guild_id,
+            started_at=min(restored["started_at"], now) if restored else now,
+            session_key=session.session_key,
+        )
+        self.solo_cleanups[root_channel_id] = entry
+        stage = str(restored.get("stage") or "notice") if restored else "notice"
+        if stage != "notice":
+            entry.notice_sent = True
+            entry.warning_sent = stage == "delete"
+            self._arm_cleanup_deadline(entry, stage, restored["due_at"])
+            return
+        self._arm_cleanup_deadline(entry, "notice", entry.started_at + timedelta(seconds=max(60, int(config.solo_notice_after_sec))))
 
-        async def runner() -> None:
-            handle = self.solo_cleanup_tasks[root_channel_id]
-            try:
-                await asyncio.sleep(notice_after)
-                current = self.sessions_by_key.get(session_key)
-                if current is None:
-                    return
-                member = self._get_solo_cleanup_member(current)
-                if member is None:
-                    return
-                handle.notice_sent = True
-                await self._send_solo_cleanup_notice(current, member, warning=False)
-                if mode == "delete_warning":
-                    await asyncio.sleep(warning_after)
-                    current = self.sessions_by_key.get(session_key)
-                    if current is None:
-                        return
-                    member = self._get_solo_cleanup_member(current)
-                    if member is None:
-                        return
-                    handle.warning_sent = True
-                    await self._send_solo_cleanup_notice(current, member, warning=True)
-                    await asyncio.sleep(warning_after)
-                    current = self.sessions_by_key.get(session_key)
-                    if current is None:
-                        return
-                    member = self._get_solo_cleanup_member(current)
-                    if member is None:
-                        return
-                    channel = self._resolve_voice_channel(current.root_channel_id)
-                    if channel is None:
-                        return
-                    await self._end_session(current)
-                    try:
-                        await channel.delete(reason="ソロVCの自動削除")
-                    except discord.Forbidden:
-                        self.logger.info("ソロVC自動削除: 権限不足のためスキップ: channel=%s", channel.id)
-                    except discord.HTTPException:
-                        self.logger.exception("ソロVC自動削除に失敗しました: channel=%s", channel.id)
+    async def _advance_solo_cleanup(self, entry: CleanupDeadline) -> None:
+        config = self.guild_configs.get(entry.guild_id)
+        current = self.sessions_by_key.get(entry.session_key) if entry.session_key else None
+        if config is None or current is None:
+            return
+        mode = self._solo_cleanup_mode(config)
+        member = self._get_solo_cleanup_member(current)
+        if mode == "disabled" or member is None:
+            return
+        stage = entry.stage
+        if mode != "delete_warning" and stage in {"warning", "delete"}:
+            stage = "repeat"
+        try:
+            if stage == "delete":
+                channel = self._resolve_voice_channel(current.root_channel_id)
+                if channel is None:
                     return
-                if mode == "repeat_notice":
-                    while True:
-                        await asyncio.sleep(repeat_after)
-                        current = self.sessions_by_key.get(session_key)
-                        if current is None:
-                            return
-                        member = self._get_solo_cleanup_member(current)
-                        if member is None:
-                            return
-                        await self._send_solo_cleanup_notice(current, member, warning=False)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger.exception("solo VC cleanup task failed: session_key=%s", session_key)
-            finally:
-                self.solo_cleanup_tasks.pop(root_channel_id, None)
-
-        self.solo_cleanup_tasks[root_channel_id] = SoloCleanupHandle(task=asyncio.create_task(runner()))
+                await self._end_session(current)
+                try:
+                    await channel.delete(reason="ソロVCの自動削除")
+                except discord.Forbidden:
+                    self.logger.info("ソロVC自動削除: 権限不足のためスキップ: channel=%s", channel.id)
+                except discord.HTTPException:
+                    self.logger.exception("ソロVC自動削除に失敗しました: channel=%s", channel.id)
+                return
+            warning = stage == "warning"
+            if warning:
+                entry.warning_sent = True
+            else:
+                entry.notice_sent = True
+            job_key = f"solo_cleanup:{entry.channel_id}:{stage}:{to_iso(entry.due_at)}"
+            await self._send_solo_cleanup_notice(current, member, warning=warning, job_key=job_key)
+            if mode == "delete_warning":
+                warning_after = max(60, int(config.solo_delete_warning_after_sec))
+                self._arm_cleanup_deadline(entry, "delete" if warning else "warning", utcnow() + timedelta(seconds=warning_after))
+            elif mode == "repeat_notice":
+                repeat_after = max(300, int(config.solo_repeat_notice_sec))
+                self._arm_cleanup_deadline(entry, "repeat", utcnow() + timedelta(seconds=repeat_after))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger.exception("solo VC cleanup task failed: session_key=%s", entry.session_key)
 
     async def _send_solo_cleanup_notice(
         self,
@@ -2741,6 +4325,7 @@ class SessionManager:
         member: discord.Member,
         *,
         warning: bool,
+        job_key: str,
     ) -> None:
         channel = self._resolve_voice_channel(session.root_channel_id)
         if channel is None:
@@ -2753,29 +4338,18 @@ class SessionManager:
             description += t("embed.solo_warning.suffix", locale)
         embed = discord.Embed(title=t(title_key, locale), description=description, color=COLOR_ERROR if warning else COLOR_WARNING)
         await self._send_embed(channel, embed)
-        await self._send_solo_cleanup_dm(session, embed)
+        await self._send_solo_cleanup_dm(session, embed, job_key)
 
-    async def _send_solo_cleanup_dm(self, session: LiveSession, embed: discord.Embed) -> None:
+    async def _send_solo_cleanup_dm(self, session: LiveSession, embed: discord.Embed, job_key: str) -> None:
         if self.bot is None:
             return
-        user: discord.User | discord.Member | None = self.bot.get_user(session.starter_user_id)
-        if user is None:
-            guild = self._resolve_guild(session.guild_id)
-            user = guild.get_member(session.starter_user_id) if guild is not None else None
-        if user is None:
-            try:
-                user = await self.bot.fetch_user(session.starter_user_id)
-            except (discord.Forbidden, discord.HTTPException, discord.NotFound):
-                return
         try:
-            await user.send(embed=embed)
-        except (discord.Forbidden, discord.HTTPException):
-            self.logger.info("solo VC cleanup DM failed: guild=%s user=%s", session.guild_id, session.starter_user_id)
+            await self.direct_messages.enqueue(job_key, "solo_cleanup", session.guild_id, embed, [session.starter_user_id])
+        except Exception:
+            self.logger.exception("solo VC cleanup DM enqueue failed: guild=%s user=%s", session.guild_id, session.starter_user_id)
 
     def _cancel_solo_cleanup_by_channel_id(self, channel_id: int) -> None:
-        handle = self.solo_cleanup_tasks.pop(channel_id, None)
-        if handle is not None:
-            handle.task.cancel()
+        self._release_cleanup_deadline("solo", channel_id)
 
     async def _is_active_temporary_event_channel(self, channel_id: int) -> bool:
         try:
@@ -2785,8 +4359,8 @@ class SessionManager:
             return False
         return any(item.created_channel_id == channel_id for item in active_items)
 
-    async def _schedule_empty_cleanup(self, channel: discord.VoiceChannel) -> None:
-        if channel.id in self.deletion_tasks:
+    async def _schedule_empty_cleanup(self, channel: discord.VoiceChannel, *, restored: dict[str, Any] | None = None) -> None:
+        if channel.id in self.empty_cleanups:
             return
         if not self._is_managed_voice_channel(channel, include_base=False):
             return
@@ -2795,15 +4369,28 @@ class SessionManager:
         config = await self.get_guild_config(channel.guild.id)
         if config is None:
             return
+        now = utcnow()
+        entry = CleanupDeadline(
+            kind="empty",
+            channel_id=channel.id,
+            guild_id=channel.guild.id,
+            started_at=min(restored["started_at"] or now, now) if restored else now,
+        )
+        self.empty_cleanups[channel.id] = entry
+        if restored and restored.get("stage") == "delete" and restored.get("due_at") is not None:
+            entry.notice_sent = True
+            self._arm_cleanup_deadline(entry, "delete", restored["due_at"])
+            return
+        self._arm_cleanup_deadline(entry, "notice", entry.started_at + timedelta(seconds=config.first_empty_notice_sec))
 
-        async def runner() -> None:
-            handle = self.deletion_tasks[channel.id]
-            try:
-                await asyncio.sleep(config.first_empty_notice_sec)
-                refreshed = self._resolve_voice_channel(channel.id)
-                if refreshed is None or refreshed.members:
-                    return
-                handle.notice_sent = True
+    async def _advance_empty_cleanup(self, entry: CleanupDeadline) -> None:
+        config = await self.get_guild_config(entry.guild_id)
+        refreshed = self._resolve_voice_channel(entry.channel_id)
+        if config is None or refreshed is None or refreshed.members:
+            return
+        try:
+            if entry.stage == "notice":
+                entry.notice_sent = True
                 await self._send_embed(
                     refreshed,
                     build_embed(
@@ -2814,37 +4401,31 @@ class SessionManager:
                         description_fmt={"seconds": config.final_delete_sec},
                     ),
                 )
-                await asyncio.sleep(max(0, config.final_delete_sec - config.first_empty_notice_sec))
-                refreshed = self._resolve_voice_channel(channel.id)
-                if refreshed is None or refreshed.members:
-                    return
-                root_id = self.channel_to_root.get(channel.id)
-                if root_id and root_id in self.sessions and channel.id != root_id:
-                    session = self.sessions[root_id]
-                    for team_name, team_channel_id in list(session.team_channels.items()):
-                        if team_channel_id == channel.id:
-                            session.team_channels.pop(team_name, None)
-                            break
-                    self.channel_to_root.pop(channel.id, None)
-                    await self._persist_and_broadcast(session)
-                await refreshed.delete(reason="空室VCの自動削除")
-            except asyncio.CancelledError:
-                raise
-            except discord.Forbidden:
-                self.logger.exception("VC削除権限がありません")
-            except discord.HTTPException:
-                self.logger.exception("VC削除に失敗しました")
-            finally:
-                self.deletion_tasks.pop(channel.id, None)
-
-        self.deletion_tasks[channel.id] = DeletionHandle(task=asyncio.create_task(runner()))
+                delete_after = max(config.first_empty_notice_sec, config.final_delete_sec)
+                self._arm_cleanup_deadline(entry, "delete", entry.started_at + timedelta(seconds=delete_after))
+                return
+            root_id = self.channel_to_root.get(entry.channel_id)
+            if root_id and root_id in self.sessions and entry.channel_id != root_id:
+                session = self.sessions[root_id]
+                for team_name, team_channel_id in list(session.team_channels.items()):
+                    if team_channel_id == entry.channel_id:
+                        session.team_channels.pop(team_name, None)
+                        break
+                self.channel_to_root.pop(entry.channel_id, None)
+                await self._persist_and_broadcast(session)
+            await refreshed.delete(reason="空室VCの自動削除")
+        except asyncio.CancelledError:
+            raise
+        except discord.Forbidden:
+            self.logger.exception("VC削除権限がありません")
+        except discord.HTTPException:
+            self.logger.exception("VC削除に失敗しました")
 
     async def _cancel_empty_cleanup(self, channel: discord.VoiceChannel) -> None:
-        handle = self.deletion_tasks.pop(channel.id, None)
-        if handle is None:
+        entry = self._release_cleanup_deadline("empty", channel.id)
+        if entry is None:
             return
-        handle.task.cancel()
-        if handle.notice_sent:
+        if entry.notice_sent:
             config = self.guild_configs.get(channel.guild.id)
             await self._send_embed(
                 channel,
@@ -2863,7 +4444,7 @@ class SessionManager:
         target_channel_id: int | None,
         reason: str,
     ) -> None:
-        self.system_move_markers.append(
+        self.system_move_markers.mark(
             SystemMoveMarker(
                 user_id=user_id,
                 source_channel_id=source_channel_id,
@@ -2879,40 +4460,259 @@ class SessionManager:
         source_channel_id: int | None,
         target_channel_id: int | None,
     ) -> bool:
-        threshold = utcnow() - timedelta(seconds=15)
-        remaining: list[SystemMoveMarker] = []
-        matched = False
-        for marker in self.system_move_markers:
-            if marker.created_at < threshold:
-                continue
-            if (
-                marker.user_id == user_id
-                and marker.source_channel_id == source_channel_id
-                and marker.target_channel_id == target_channel_id
-            ):
-                matched = True
-                continue
-            remaining.append(marker)
-        self.system_move_markers = remaining
-        return matched
+        return self.system_move_markers.consume(user_id, source_channel_id, target_channel_id)
 
-    async def _persist_and_broadcast(self, session: LiveSession) -> None:
+    def _journal_participant(self, session: LiveSession, participant: LiveParticipant, kind: int) -> None:
+        if self.journal is None:
+            return
         try:
-            await self.config_repo.save_session_snapshot(session.to_snapshot())
-        except Exception:
-            self.logger.exception("セッションスナップショット保存に失敗しました: session_key=%s", session.session_key)
-        payload = session.to_payload()
-        await self.websocket_hub.broadcast(f"session:{session.root_channel_id}", "session_update", payload)
-        await self.websocket_hub.broadcast(f"guild:{session.guild_id}", "session_update", payload)
-        await self.websocket_hub.broadcast(f"user:{session.owner_user_id}", "session_update", payload)
-        for participant in session.participants.values():
-            await self.websocket_hub.broadcast(f"user:{participant.user_id}", "session_update", payload)
+            self.journal.append(
+                JournalEntry(
+                    kind=kind,
+                    session_id=session.session_id,
+                    user_id=participant.user_id,
+                    channel_id=participant.current_channel_id,
+                    self_muted=participant.self_muted,
+                    self_deafened=participant.self_deafened,
+                    in_afk_channel=participant.in_afk_channel,
+                    at=participant.last_transition_at,
+                )
+            )
+        except OSError:
+            self.logger.exception("参加者ジャーナルの書き込みに失敗しました: session_key=%s", session.session_key)
+            self._mark_snapshot_dirty(session)
+
+    def start_journal_checkpoint_worker(self) -> None:
+        if self.journal is None:
+            return
+        if self.journal_checkpoint_task is not None and not self.journal_checkpoint_task.done():
+            return
+        self.journal_checkpoint_task = asyncio.create_task(self._journal_checkpoint_worker())
+
+    async def _journal_checkpoint_worker(self) -> None:
+        while True:
+            await asyncio.sleep(JOURNAL_CHECKPOINT_INTERVAL_SEC)
+            try:
+                await self.checkpoint_journal()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger.exception("journal checkpoint failed")
+
+    async def checkpoint_journal(self, *, force: bool = False) -> None:
+        if self.journal is None:
+            return
+        async with self.snapshot_lock:
+            if not force and not self.journal.records_since_rotate and not self.dirty_snapshots:
+                return
+            now = utcnow()
+            for session in self.sessions.values():
+                changed = [participant.checkpoint(now) for participant in session.participants.values()]
+                if any(changed):
+                    session.touch()
+            snapshots = [
+                session.to_snapshot()
+                for session in self.sessions.values()
+                if session.session_id not in self.retired_snapshot_ids
+            ]
+            self.dirty_snapshots = {}
+            sealed = self.journal.rotate()
+            for snapshot in snapshots:
+                await self.live_state_repo.save_session_snapshot(snapshot)
+            self.journal.discard(sealed)
+
+    def _load_journal_entries(self) -> dict[str, list[JournalEntry]]:
+        if self.journal is None:
+            return {}
+        entries: dict[str, list[JournalEntry]] = {}
+        try:
+            for entry in self.journal.replay():
+                entries.setdefault(entry.session_id, []).append(entry)
+        except OSError:
+            self.logger.exception("参加者ジャーナルの読み込みに失敗しました")
+        return entries
+
+    def _replay_journal_entries(self, session: LiveSession, entries: list[JournalEntry]) -> None:
+        for entry in entries:
+            participant = session.participants.get(entry.user_id)
+            if participant is None:
+                if entry.kind != JOURNAL_JOIN:
+                    continue
+                participant = LiveParticipant(
+                    user_id=entry.user_id,
+                    user_name=str(entry.user_id),
+                    joined_at=entry.at,
+                    last_transition_at=entry.at,
+                    current_channel_id=entry.channel_id,
+                    current_team=session.team_assignments.get(entry.user_id),
+                )
+                self._add_participant(session, participant)
+                if entry.user_id not in session.member_order:
+                    session.member_order.append(entry.user_id)
+            elif entry.at <= participant.last_transition_at:
+                continue
+            else:
+                participant.accrue(entry.at)
+                participant.last_transition_at = entry.at
+            self._set_participant_channel(session, participant, entry.channel_id)
+            participant.self_muted = entry.self_muted
+            participant.self_deafened = entry.self_deafened
+            participant.in_afk_channel = entry.in_afk_channel
+
+    def _mark_snapshot_dirty(self, session: LiveSession) -> None:
+        if self.sessions.get(session.root_channel_id) is not session or session.session_id in self.retired_snapshot_ids:
+            return
+        self.dirty_snapshots[session.session_id] = session
+        if self.snapshot_flush_task is None or self.snapshot_flush_task.done():
+            self.snapshot_flush_task = asyncio.create_task(self._flush_snapshots_after_delay())
+
+    async def _flush_snapshots_after_delay(self) -> None:
+        while True:
+            self.snapshot_flush_sleeping = True
+            try:
+                await asyncio.sleep(self.snapshot_flush_interval)
+            finally:
+                self.snapshot_flush_sleeping = False
+            await self.flush_session_snapshots()
+            if not self.dirty_snapshots or self.snapshot_flush_closing:
+                return
+
+    async def flush_session_snapshots(self) -> None:
+        async with self.snapshot_lock:
+            dirty, self.dirty_snapshots = self.dirty_snapshots, {}
+            for session in dirty.values():
+                if self.sessions.get(session.root_channel_id) is not session or session.session_id in self.retired_snapshot_ids:
+                    continue
+                try:
+                    await self.live_state_repo.save_session_snapshot(session.to_snapshot())
+                except Exception:
+                    self.logger.exception("セッションスナップショット保存に失敗しました: session_key=%s", session.session_key)
+
+    async def _delete_session_snapshot(self, session_id: str) -> None:
+        async with self.snapshot_lock:
+            self.dirty_snapshots.pop(session_id, None)
+            if any(session.session_id == session_id for session in self.sessions.values()):
+                self.retired_snapshot_ids.add(session_id)
+            await self.live_state_repo.delete_session_snapshot(session_id)
+
+    def submit_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState) -> None:
+        if not member.bot:
+            self._set_voice_occupancy(member.guild.id, member.id, after.channel.id if after.channel is not None else None)
+        self.voice_events.submit(member, before, after)
+
+    def start_dm_dispatcher(self) -> None:
+        if self.bot is not None:
+            self.direct_messages.start(self.bot)
+
+    async def close(self) -> None:
+        workers = [task for task in (self.scheduled_vc_task, self.timeline_retention_task) if task is not None and not task.done()]
+        self.scheduled_vc_task = None
+        self.timeline_retention_task = None
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        await self.voice_events.close()
+        await self.outbox.close()
+        await self.direct_messages.close()
+        await self._stop_cleanup_timers()
+        await self.presence.close()
+        self.snapshot_flush_closing = True
+        task, self.snapshot_flush_task = self.snapshot_flush_task, None
+        if task is not None and not task.done():
+            if self.snapshot_flush_sleeping:
+                task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                self.logger.exception("セッションスナップショット保存に失敗しました")
+        checkpoint_task, self.journal_checkpoint_task = self.journal_checkpoint_task, None
+        if checkpoint_task is not None and not checkpoint_task.done():
+            checkpoint_task.cancel()
+            try:
+                await checkpoint_task
+            except asyncio.CancelledError:
+                pass
+        if self.journal is not None:
+            await self.checkpoint_journal()
+            self.journal.close()
+        else:
+            await self.flush_session_snapshots()
+        if self.live_state_tasks:
+            await asyncio.gather(*self.live_state_tasks, return_exceptions=True)
+
+    async def _persist_and_broadcast(self, session: LiveSession, *, snapshot: bool = True) -> None:
+        if snapshot or self.journal is None:
+            self._mark_snapshot_dirty(session)
+        if self._is_registered_session(session):
+            self._index_session_visibility(session)
+        session.touch()
+        await self.websocket_hub.publish_encoded(self._session_scopes(session), "session_update", session.cached_payload_json())
         await self._broadcast_global_state()
         await self._refresh_solo_cleanup_for_session(session)
 
+    def _sync_global_state(self) -> list[str]:
+        frames: list[str] = []
+        for root_id, session in self.sessions.items():
+            payload = session.cached_payload()
+            published = self.global_published.get(root_id)
+            if published is not None and published[0] is payload:
+                continue
+            self.global_sequence += 1
+            if published is None:
+                frames.append(
+                    _encode_realtime_frame(
+                        "session_added",
+                        {"seq": self.global_sequence, "guild_id": payload["guild_id"], "root_channel_id": payload["root_channel_id"], "session": payload},
+                    )
+                )
+            else:
+                previous = published[0]
+                changes = {key: value for key, value in payload.items() if previous.get(key) != value}
+                removed_fields = [key for key in previous if key not in payload]
+                frames.append(
+                    _encode_realtime_frame(
+                        "session_patched",
+                        {
+                            "seq": self.global_sequence,
+                            "guild_id": payload["guild_id"],
+                            "root_channel_id": payload["root_channel_id"],
+                            "changes": changes,
+                            "removed_fields": removed_fields,
+                        },
+                    )
+                )
+            self.global_published[root_id] = (payload, session.cached_payload_json())
+        for root_id in [root_id for root_id in self.global_published if root_id not in self.sessions]:
+            payload, _ = self.global_published.pop(root_id)
+            self.global_sequence += 1
+            frames.append(
+                _encode_realtime_frame(
+                    "session_removed",
+                    {"seq": self.global_sequence, "guild_id": payload["guild_id"], "root_channel_id": payload["root_channel_id"]},
+                )
+            )
+        return frames
+
+    def _session_scopes(self, session: LiveSession) -> list[str]:
+        scopes = [f"session:{session.root_channel_id}", f"guild:{session.guild_id}", f"user:{session.owner_user_id}"]
+        scopes.extend(f"user:{participant.user_id}" for participant in session.participants.values())
+        return scopes
+
     async def _broadcast_global_state(self) -> None:
-        payload = {"active_sessions": [session.to_payload() for session in self.sessions.values()]}
-        await self.websocket_hub.broadcast("global", "global_state", payload)
+        if "global" not in self.websocket_hub.connections:
+            return
+        for frame in self._sync_global_state():
+            await self.websocket_hub.broadcast_frame("global", frame)
+
+    async def send_global_snapshot(self, websocket: WebSocket) -> None:
+        await self._broadcast_global_state()
+        active_sessions = ",".join(encoded for _, encoded in self.global_published.values())
+        self.websocket_hub.send_text(
+            websocket,
+            _realtime_frame("global_state", f'{{"seq":{self.global_sequence},"active_sessions":[{active_sessions}]}}'),
+        )
 
     async def _timeline_retention_days(self) -> int:
         raw = await self.config_repo.get_app_setting("timeline_retention_days", "90")
@@ -2930,6 +4730,21 @@ class SessionManager:
         user_id: int | None = None,
         user_name: str | None = None,
         payload: dict[str, Any] | None = None,
+    ) -> None:
+        async def write() -> None:
+            await self._write_timeline_event(session, event_type, message, user_id=user_id, user_name=user_name, payload=payload)
+
+        self.outbox.submit(write, target=("timeline", session.session_id), description=f"timeline:{event_type}", priority=OUTBOX_PRIORITY_LOW)
+
+    async def _write_timeline_event(
+        self,
+        session: LiveSession,
+        event_type: str,
+        message: str,
+        *,
+        user_id: int | None = None,
+        user_name: str | None = None,
+        payload: dict[str, Any] | None = None,
     ) -> None:
         locale = self.guild_configs.get(session.guild_id).guild_language if self.guild_configs.get(session.guild_id) else None
         try:
@@ -2945,7 +4760,6 @@ class SessionManager:
                 user_name=user_name,
                 message=message,
                 payload=payload or {},
-                retention_days=await self._timeline_retention_days(),
             )
         except Exception:
             self.logger.exception("タイムライン保存に失敗しました: session_key=%s event_type=%s", session.session_key, event_type)
@@ -2957,8 +4771,7 @@ class SessionManager:
             "root_channel_id": str(session.root_channel_id),
             "event": event,
         }
-        for scope in {f"session:{session.root_channel_id}", f"guild:{session.guild_id}", "global"}:
-            await self.websocket_hub.broadcast(scope, "timeline_event", envelope)
+        await self.websocket_hub.publish([f"session:{session.root_channel_id}", f"guild:{session.guild_id}", "global"], "timeline_event", envelope)
 
     async def _publish_session_event(
         self,
@@ -2970,15 +4783,16 @@ class SessionManager:
             "type": event_type,
             "guild_id": str(session.guild_id),
             "root_channel_id": str(session.root_channel_id),
-            "session": session.to_payload(),
             "payload": payload or {},
         }
-        scopes = {f"session:{session.root_channel_id}", f"guild:{session.guild_id}", "global"}
-        scopes.add(f"user:{session.owner_user_id}")
-        for participant in session.participants.values():
-            scopes.add(f"user:{participant.user_id}")
-        for scope in scopes:
-            await self.websocket_hub.broadcast(scope, "session_event", envelope)
+        scopes = self._session_scopes(session)
+        envelope_json = _encode_json(envelope)
+        recipients: set[WebSocket] = set()
+        if any(scope in self.websocket_hub.connections for scope in scopes):
+            payload_json = _splice_json_field(envelope_json, "session", session.cached_payload_json())
+            recipients = await self.websocket_hub.publish_encoded(scopes, "session_event", payload_json)
+        if "global" in self.websocket_hub.connections:
+            await self.websocket_hub.publish_encoded(["global"], "session_event", envelope_json, exclude=recipients)
 
     async def _publish_important_event(
         self,
@@ -2990,7 +4804,7 @@ class SessionManager:
         extra_payload: dict[str, Any] | None = None,
     ) -> None:
         payload = {
-            "session": session.to_payload(),
+            "session": session.cached_payload(),
             **(extra_payload or {}),
         }
         try:
@@ -3017,19 +4831,29 @@ class SessionManager:
                 "read_at": None,
             }
         envelope = {"type": event_type, "notification": notification, "payload": payload}
-        for scope in {f"session:{session.root_channel_id}", f"guild:{session.guild_id}", "global"}:
-            await self.websocket_hub.broadcast(scope, "important_notification", envelope)
+        await self.websocket_hub.publish([f"session:{session.root_channel_id}", f"guild:{session.guild_id}", "global"], "important_notification", envelope)
 
     def _register_session(self, session: LiveSession) -> None:
+        previous = self.sessions_by_key.get(session.session_key)
+        if previous is not session:
+            if previous is not None:
+                self.active_participant_count -= len(previous.active_participants())
+            self.active_participant_count += len(session.active_participants())
         self.sessions[session.root_channel_id] = session
         self.sessions_by_key[session.session_key] = session
         self.channel_to_root[session.root_channel_id] = session.root_channel_id
         for channel_id in session.team_channels.values():
             self.channel_to_root[channel_id] = session.root_channel_id
+        self._index_session_visibility(session)
 
     def _unregister_session(self, session: LiveSession) -> None:
+        self.dirty_snapshots.pop(session.session_id, None)
+        self.retired_snapshot_ids.discard(session.session_id)
         self._cancel_solo_cleanup_by_channel_id(session.root_channel_id)
         self.auto_personal_root_channels.discard(session.root_channel_id)
+        if self._is_registered_session(session):
+            self.active_participant_count -= len(session.active_participants())
+            self._index_session_visibility(session, remove=True)
         self.sessions.pop(session.root_channel_id, None)
         self.sessions_by_key.pop(session.session_key, None)
         self.channel_to_root.pop(session.root_channel_id, None)
@@ -3064,6 +4888,52 @@ class SessionManager:
             await self._send_fallback_notification(channel, embed, view=view)
         return None
 
+    def _queue_embed(
+        self,
+        channel: discord.abc.Messageable | None,
+        embed: discord.Embed,
+        view: discord.ui.View | None = None,
+        *,
+        priority: int = OUTBOX_PRIORITY_NORMAL,
+        coalesce_key: Any = None,
+    ) -> None:
+        if channel is None:
+            return
+
+        async def deliver() -> None:
+            await channel.send(embed=embed, view=view)
+
+        async def fallback() -> None:
+            await self._send_fallback_notification(channel, embed, view=view)
+
+        self.outbox.submit(
+            deliver,
+            target=("channel", getattr(channel, "id", id(channel))),
+            description="embed",
+            priority=priority,
+            on_failure=fallback,
+            coalesce_key=coalesce_key,
+        )
+
+    def _queue_notification_message(self, session: LiveSession, embed: discord.Embed, view: discord.ui.View | None = None) -> None:
+        async def deliver() -> None:
+            message = await self._send_notification_message(session, embed, view=view, propagate_http_errors=True)
+            if message is None:
+                return
+            if self.sessions.get(session.root_channel_id) is not session:
+                await self._delete_notification_message(session)
+                session.notice_message_id = None
+                return
+            session.touch()
+            self._mark_snapshot_dirty(session)
+
+        self.outbox.submit(
+            deliver,
+            target=("notice", session.guild_id),
+            description="notification_message",
+            priority=OUTBOX_PRIORITY_HIGH,
+        )
+
     async def _send_fallback_notification(
         self,
         channel: discord.abc.Messageable,
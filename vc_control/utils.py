@@ -49,8 +49,8 @@ def json_loads(value: str | None, default: object) -> object:
         return default
 
 
-def period_cutoff(period: str) -> date | None:
-    today = utcnow().date()
+def period_cutoff(period: str, target_date: date | None = None) -> date | None:
+    today = target_date or utcnow().date()
     if period == "day":
         return today
     if period == "week":
@@ -618,6 +618,8 @@ def _build_session_ui_payload(container: AppContainer, session: dict[str, Any] |
         )
     unassigned_members = [participant for participant in participants if not participant.get("current_team")]
     participant_count = len([participant for participant in participants if participant.get("current_channel_id") is not None])
+    started_at = from_iso(payload.get("started_at"))
+    elapsed_seconds = max(0, int((utcnow() - started_at).total_seconds())) if started_at is not None else 0
 
     return {
         **payload,
@@ -654,8 +656,8 @@ def _build_session_ui_payload(container: AppContainer, session: dict[str, Any] |
         ),
         "participant_count": participant_count,
         "active_participant_count": participant_count,
-        "elapsed_seconds": safe_int(payload.get("elapsed_seconds")),
-        "elapsed_label": format_duration(safe_int(payload.get("elapsed_seconds"))),
+        "elapsed_seconds": elapsed_seconds,
+        "elapsed_label": format_duration(elapsed_seconds),
         "participants": participants,
         "teams": teams,
         "unassigned_members": unassigned_members,
@@ -1146,6 +1148,48 @@ def create_app(container: AppContainer) -> FastAPI:
             }
         )
 
+    @app.get("/api/admin/realtime")
+    async def api_admin_realtime(request: Request) -> JSONResponse:
+        await _require_admin(request, container)
+        return JSONResponse({"realtime": container.websocket_hub.stats()})
+
+    @app.get("/api/admin/voice-events")
+    async def api_admin_voice_events(request: Request) -> JSONResponse:
+        await _require_admin(request, container)
+        return JSONResponse(
+            {
+                "voice_events": container.session_manager.voice_events.stats(),
+                "presence": container.session_manager.presence.stats(),
+                "system_moves": container.session_manager.system_move_markers.stats(),
+            }
+        )
+
+    @app.get("/api/admin/dm-jobs")
+    async def api_admin_dm_jobs(request: Request) -> JSONResponse:
+        await _require_admin(request, container)
+        limit = max(1, min(100, safe_int(request.query_params.get("limit")) or 20))
+        return JSONResponse(
+            {
+                "dispatcher": container.session_manager.direct_messages.stats(),
+                "jobs": await container.session_manager.live_state_repo.list_dm_job_progress(limit=limit),
+            }
+        )
+
+    @app.get("/api/admin/outbox")
+    async def api_admin_outbox(request: Request) -> JSONResponse:
+        await _require_admin(request, container)
+        return JSONResponse(
+            {
+                "outbox": container.session_manager.outbox.stats(),
+                "member_moves": container.session_manager.member_moves.stats(),
+            }
+        )
+
+    @app.get("/api/admin/timeline-retention")
+    async def api_admin_timeline_retention(request: Request) -> JSONResponse:
+        await _require_admin(request, container)
+        return JSONResponse({"retention": container.session_manager.timeline_retention_status.to_payload()})
+
     @app.post("/api/admin/settings")
     async def api_update_admin_settings(request: Request) -> JSONResponse:
         await _require_admin(request, container)
@@ -1279,7 +1323,7 @@ def create_app(container: AppContainer) -> FastAPI:
         profile = await _require_profile(request)
         settings = await _fetch_runtime_settings(container)
         is_admin = _owner_user_id(settings) == profile.user_id
-        sessions = await container.session_manager.list_accessible_sessions(profile.user_id)
+        sessions = await container.session_manager.list_accessible_session_summaries(profile.user_id)
         session_rows = []
         for session_payload in sessions:
             guild_id = safe_int(session_payload.get("guild_id"))
@@ -1414,13 +1458,13 @@ def create_app(container: AppContainer) -> FastAPI:
             repeat_weekdays=repeat_weekdays,
         )
         await container.config_repo.create_scheduled_vc(scheduled)
+        container.session_manager.track_scheduled_vc(scheduled)
         return JSONResponse({"ok": True})
 
     @app.delete("/api/reservations/{scheduled_id}")
     async def api_delete_reservation(request: Request, scheduled_id: int) -> JSONResponse:
         profile = await _require_profile(request)
-        schedules = await container.config_repo.list_scheduled_vcs(limit=1000)
-        scheduled = next((item for item in schedules if item.id == scheduled_id), None)
+        scheduled = await container.config_repo.get_scheduled_vc(scheduled_id)
         if scheduled is None:
             raise HTTPException(status_code=404, detail="予約が見つかりません。")
         if not await container.session_manager.is_guild_admin(scheduled.guild_id, profile.user_id):
@@ -1832,19 +1876,24 @@ def create_app(container: AppContainer) -> FastAPI:
                 if await container.session_manager.is_guild_admin(guild_id, user_id):
                     allowed_scopes.append(scope)
                     continue
-                for session in container.session_manager.list_sessions():
-                    if session.guild_id == guild_id and await container.session_manager.can_view_session(session, user_id):
+                for root_id in await container.session_manager.visible_session_roots(user_id):
+                    session = container.session_manager.get_session_by_root(root_id)
+                    if session is not None and session.guild_id == guild_id:
                         allowed_scopes.append(scope)
                         break
         if not allowed_scopes:
             await websocket.close(code=4003)
             return
         await container.websocket_hub.connect(websocket, allowed_scopes)
+        if "global" in allowed_scopes:
+            await container.session_manager.send_global_snapshot(websocket)
         try:
             while True:
                 message = await websocket.receive_text()
                 if message == "ping":
-                    await websocket.send_text("pong")
+                    container.websocket_hub.send_text(websocket, "pong")
+                elif message == "resync" and "global" in allowed_scopes:
+                    await container.session_manager.send_global_snapshot(websocket)
         except WebSocketDisconnect:
             await container.websocket_hub.disconnect(websocket)
         except Exception: